@@ -0,0 +1,96 @@
+"""
+Benchmark gzip request bodies against uncompressed uploads
+
+Uploads the same assessment to a local fake Credo API server with and without
+compression and reports the bytes on the wire, the measured wall time and the
+transfer time estimated for a given bandwidth.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_compression.py --rows 20000 --bandwidth-mbps 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fake_server import USE_CASE_ID, FakeCredoServer
+from connect.evidence import MetricEvidence, TableEvidence
+from connect.governance.credo_api import CredoApi
+
+
+def build_assessment(n_metrics, n_rows, seed=0):
+    """Assessment data with metric evidences and one profiler-like table"""
+    rng = np.random.default_rng(seed)
+    table = pd.DataFrame(
+        {
+            "feature": rng.choice(["age", "income", "gender", "zip"], n_rows),
+            "group": rng.choice(["a", "b", "c"], n_rows),
+            "count": rng.integers(0, 1000, n_rows),
+            "value": rng.random(n_rows).round(4),
+        }
+    )
+    evidences = [
+        MetricEvidence(type=f"metric_{i}", value=float(rng.random()))
+        for i in range(n_metrics)
+    ]
+    evidences.append(TableEvidence("profile", table))
+    return {
+        "policy_pack_id": "PP+1",
+        "models": None,
+        "evidences": [e.struct() for e in evidences],
+        "$type": "assessments",
+    }
+
+
+def run(n_metrics, n_rows, repeat, bandwidth_mbps):
+    data = build_assessment(n_metrics, n_rows)
+    results = []
+    with FakeCredoServer() as server:
+        for compress in (False, True):
+            api = CredoApi(client=server.client(compress=compress))
+            server.reset()
+            start = time.perf_counter()
+            for _ in range(repeat):
+                api.create_assessment(USE_CASE_ID, data)
+            wall_time = (time.perf_counter() - start) / repeat
+            wire_bytes = server.bytes_received / repeat
+            transfer_time = wire_bytes * 8 / (bandwidth_mbps * 1e6)
+            results.append(
+                {
+                    "compress": compress,
+                    "bytes": int(wire_bytes),
+                    "wall_time_s": wall_time,
+                    "estimated_time_s": wall_time + transfer_time,
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--metrics", type=int, default=1000)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--bandwidth-mbps",
+        type=float,
+        default=20.0,
+        help="link bandwidth used to estimate the transfer time",
+    )
+    args = parser.parse_args()
+
+    results = run(args.metrics, args.rows, args.repeat, args.bandwidth_mbps)
+    print(f"{'compress':>8} {'bytes':>12} {'wall (s)':>9} {'est. at link (s)':>17}")
+    for r in results:
+        print(
+            f"{str(r['compress']):>8} {r['bytes']:>12,} {r['wall_time_s']:>9.3f} {r['estimated_time_s']:>17.3f}"
+        )
+    ratio = results[0]["bytes"] / results[1]["bytes"]
+    print(f"compression ratio: {ratio:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
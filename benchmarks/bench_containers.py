@@ -0,0 +1,81 @@
+"""
+Benchmark the conversion of metric and statistic test containers to evidence
+
+Converts frames of metrics and statistic tests row by row with iterrows, as
+the containers used to, and with the column-wise conversion of
+`Scrubber.records`, and reports the rows converted per second.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_containers.py --rows 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from connect.evidence import MetricContainer, StatisticTestContainer
+
+
+def build_metrics(n_rows, missing_rate=0.01, seed=0):
+    rng = np.random.default_rng(seed)
+    metrics = pd.DataFrame(
+        {
+            "type": rng.choice(["accuracy", "precision", "recall", "f1"], n_rows),
+            "value": rng.random(n_rows),
+            "subtype": rng.choice(["overall", "group"], n_rows),
+        }
+    )
+    metrics.loc[rng.random(n_rows) < missing_rate, "value"] = np.nan
+    return metrics
+
+
+def build_statistic_tests(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    p_values = rng.random(n_rows)
+    return pd.DataFrame(
+        {
+            "statistic_type": rng.choice(["ks", "chi2"], n_rows),
+            "test_statistic": rng.random(n_rows) * 10,
+            "significance_threshold": 0.05,
+            "p_value": p_values,
+            "significant": p_values < 0.05,
+        }
+    )
+
+
+def iterrows_to_evidence(container):
+    return [
+        container.evidence_class(
+            additional_labels=container.labels, **data, **container.metadata
+        )
+        for _, data in container.scrubbed_data.iterrows()
+    ]
+
+
+def measure(fn, container, n_rows):
+    start = time.perf_counter()
+    fn(container)
+    return n_rows / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    containers = {
+        "metric": MetricContainer(build_metrics(args.rows)),
+        "statistic_test": StatisticTestContainer(build_statistic_tests(args.rows)),
+    }
+    print(f"{'container':>15} {'iterrows (rows/s)':>18} {'records (rows/s)':>17}")
+    for name, container in containers.items():
+        old = measure(iterrows_to_evidence, container, args.rows)
+        new = measure(lambda c: c.to_evidence(), container, args.rows)
+        print(f"{name:>15} {old:>18,.0f} {new:>17,.0f}")
+
+
+if __name__ == "__main__":
+    main()
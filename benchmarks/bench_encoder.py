@@ -0,0 +1,58 @@
+"""
+Benchmark the JSON encoding of numpy-heavy evidence payloads
+
+Encodes a payload of large float arrays, with a share of NaNs, and of many
+small records holding numpy scalars, indented, compact, and compact with NaN
+as null as for uploads, and reports the time and the size of each output.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_encoder.py --size 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from connect.utils import json_dumps
+
+
+def build_payload(size, missing_rate=0.01, seed=0):
+    rng = np.random.default_rng(seed)
+    values = rng.random(size)
+    values[rng.random(size) < missing_rate] = np.nan
+    records = [
+        {"type": "accuracy", "value": np.float64(v), "count": np.int64(i)}
+        for i, v in enumerate(rng.random(size // 100))
+    ]
+    return {
+        "scores": values,
+        "labels": rng.integers(0, 2, size),
+        "records": records,
+    }
+
+
+MODES = {
+    "indent": lambda obj: json_dumps(obj),
+    "compact": lambda obj: json_dumps(obj, compact=True),
+    "upload": lambda obj: json_dumps(obj, compact=True, nan_as_null=True),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--size", type=int, default=1000000)
+    args = parser.parse_args()
+
+    payload = build_payload(args.size)
+    print(f"{'mode':>8} {'dumps (s)':>10} {'size (MB)':>10}")
+    for mode, dumps in MODES.items():
+        start = time.perf_counter()
+        text = dumps(payload)
+        elapsed = time.perf_counter() - start
+        print(f"{mode:>8} {elapsed:>10.3f} {len(text) / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark the import time of Connect modules
+
+Imports each module in a fresh interpreter with `python -X importtime`, and
+reports its cumulative import time and the slowest modules it pulled in.
+Exits with status 1 if a module exceeds the budget, 500 ms by default, which
+guards the startup time in CI. Pass --budget-ms 0 to only report the times.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_import_time.py
+    PYTHONPATH=. python benchmarks/bench_import_time.py --budget-ms 150 connect connect.governance
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = ["connect", "connect.governance", "connect.evidence"]
+# generous, since CI machines vary: eager imports of heavy dependencies are
+# caught by tests/test_lazy_imports.py, this catches slow growth of the rest
+DEFAULT_BUDGET_MS = 500
+
+
+def import_times(module):
+    """
+    Returns the cumulative import time in microseconds of every module
+    imported by `import module` in a new interpreter
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            # header line
+            continue
+    return times
+
+
+def measure(module, repeat=5):
+    """Median cumulative import time of module in ms, and the modules of the last run"""
+    runs = [import_times(module) for _ in range(repeat)]
+    total_ms = statistics.median(run[module] for run in runs) / 1000
+    return total_ms, runs[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help=f"fail if the import time of a module exceeds this budget, by default {DEFAULT_BUDGET_MS}, 0 disables the check",
+    )
+    args = parser.parse_args()
+
+    over_budget = []
+    for module in args.modules:
+        total_ms, times = measure(module, args.repeat)
+        print(f"{module}: {total_ms:.1f} ms ({len(times)} modules)")
+        slowest = sorted(
+            ((name, t) for name, t in times.items() if name != module),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        for name, t in slowest[: args.top]:
+            print(f"    {t / 1000:8.1f} ms  {name}")
+        if args.budget_ms and total_ms > args.budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"over the {args.budget_ms} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark matching evidence requirements against evidences
+
+Registers a synthetic assessment plan and times `requirements_satisified`.
+With --baseline, the matching is also timed with the former scan that
+compares every requirement with every evidence.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_requirements.py --requirements 2000 --evidences 50000
+"""
+
+import argparse
+import json
+import time
+
+from connect.evidence import MetricEvidence
+from connect.governance import Governance
+from connect.utils import check_subset
+
+
+def build_governance(n_requirements, n_evidences):
+    requirements = [
+        {
+            "evidence_type": "metric",
+            "label": {"metric_type": f"metric_{i}", "dataset_type": "validation"},
+        }
+        for i in range(n_requirements)
+    ]
+    plan = {
+        "use_case_id": "use_case",
+        "policy_pack_id": "PP+1",
+        "evidence_requirements": requirements,
+    }
+    gov = Governance()
+    gov.register(assessment_plan=json.dumps({"data": {"attributes": plan}}))
+    evidences = []
+    for i in range(n_evidences):
+        evidence = MetricEvidence(
+            type=f"metric_{i}",
+            value=0.5,
+            model_name="model",
+            dataset_name=f"dataset_{i % 7}",
+        )
+        evidence.label = {**evidence.label, "dataset_type": "validation"}
+        evidences.append(evidence)
+    gov.add_evidence(evidences)
+    return gov
+
+
+def scan(gov):
+    """Matching as done before the evidence index"""
+    labels = [r.label for r in gov.get_evidence_requirements()]
+    return all(
+        sum(check_subset(label, e.label) for e in gov._evidences) == 1
+        for label in labels
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requirements", type=int, default=2000)
+    parser.add_argument("--evidences", type=int, default=50000)
+    parser.add_argument("--baseline", action="store_true")
+    args = parser.parse_args()
+
+    gov = build_governance(args.requirements, args.evidences)
+    start = time.perf_counter()
+    satisfied = gov.requirements_satisified
+    print(f"indexed: {time.perf_counter() - start:.3f}s (satisfied={satisfied})")
+    if args.baseline:
+        start = time.perf_counter()
+        satisfied = scan(gov)
+        print(f"scan:    {time.perf_counter() - start:.3f}s (satisfied={satisfied})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark the row and column layouts of table evidence
+
+Builds the payload of a mixed-dtype table with each layout through
+TableContainer, as an export does, and reports the time to build and serialize
+it, the peak memory allocated and the size of the JSON payload.
+
+Usage:
+
+    PYTHONPATH=. python benchmarks/bench_table_layout.py --rows 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from connect.evidence import TableContainer
+from connect.utils import json_dumps
+
+
+def build_table(n_rows, missing_rate=0.01, seed=0):
+    rng = np.random.default_rng(seed)
+    table = pd.DataFrame(
+        {
+            "feature": rng.choice(["age", "income", "gender", "zip"], n_rows),
+            "count": rng.integers(0, 1000, n_rows),
+            "value": rng.random(n_rows).round(4),
+            "flag": rng.random(n_rows) > 0.5,
+        }
+    )
+    table.loc[rng.random(n_rows) < missing_rate, "value"] = np.nan
+    table.name = "profile"
+    return table
+
+
+def measure(table, layout):
+    tracemalloc.start()
+    start = time.perf_counter()
+    evidence = TableContainer(table, layout=layout).to_evidence()[0]
+    data = evidence.data
+    build_time = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    payload = json_dumps(data, compact=True)
+    dump_time = time.perf_counter() - start
+    return {
+        "layout": layout,
+        "build_s": build_time,
+        "dumps_s": dump_time,
+        "peak_mb": peak / 1e6,
+        "payload_mb": len(payload.encode("utf-8")) / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=200000)
+    args = parser.parse_args()
+
+    table = build_table(args.rows)
+    print(
+        f"{'layout':>8} {'build (s)':>10} {'dumps (s)':>10} {'peak (MB)':>10} {'payload (MB)':>13}"
+    )
+    for layout in ("rows", "columns"):
+        r = measure(table, layout)
+        print(
+            f"{r['layout']:>8} {r['build_s']:>10.3f} {r['dumps_s']:>10.3f} {r['peak_mb']:>10.1f} {r['payload_mb']:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Local HTTP server answering like the Credo API server, for benchmarks
+"""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from connect.governance.credo_api_client import CredoApiClient, CredoApiConfig
+
+TENANT = "credoai"
+USE_CASE_ID = "use_case"
+
+
+class FakeCredoServer:
+    """Serves /auth/exchange and assessment endpoints on a free local port
+
+    Every request is recorded in `requests` as a dict with its method, path,
+    the number of bytes received and the Content-Encoding header.
+
+    Parameters
+    ----------
+    assessment_plan : dict, optional
+        Deserialized assessment plan returned for any GET ending with the plan path
+    """
+
+    def __init__(self, assessment_plan: dict = None):
+        self.assessment_plan = assessment_plan or {}
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def bytes_received(self):
+        return sum(r["bytes"] for r in self.requests)
+
+    def client(self, **kwargs):
+        """Returns a CredoApiClient configured for this server"""
+        config = CredoApiConfig(api_key="API_KEY", tenant=TENANT, api_server=self.url)
+        return CredoApiClient(config=config, **kwargs)
+
+    def reset(self):
+        with self._lock:
+            self.requests = []
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self._record(b"")
+                if "/assessments/" in self.path:
+                    self._reply(_assessment(self.path.rsplit("/", 1)[-1], 0))
+                elif "assessment_plan_url" in self.path:
+                    self._reply(
+                        {
+                            "data": {
+                                "type": "assessment_plan_urls",
+                                "id": "url",
+                                "attributes": {"url": f"{server.url}/plan"},
+                            }
+                        }
+                    )
+                else:
+                    self._reply(
+                        {
+                            "data": {
+                                "type": "assessment_plans",
+                                "id": "plan",
+                                "attributes": server.assessment_plan,
+                            }
+                        }
+                    )
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self._record(body)
+                if self.path.endswith("/auth/exchange"):
+                    self._reply({"access_token": "TOKEN"})
+                    return
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                document = json.loads(body)
+                evidences = document["data"]["attributes"].get("evidences", [])
+                self._reply(_assessment(str(len(server.requests)), len(evidences)))
+
+            do_PATCH = do_POST
+
+            def _record(self, body):
+                with server._lock:
+                    server.requests.append(
+                        {
+                            "method": self.command,
+                            "path": self.path,
+                            "bytes": len(body),
+                            "encoding": self.headers.get("Content-Encoding"),
+                        }
+                    )
+
+            def _reply(self, document):
+                content = json.dumps(document).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/vnd.api+json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        return Handler
+
+
+def _assessment(id, n_evidences):
+    return {
+        "data": {
+            "type": "assessments",
+            "id": id,
+            "attributes": {
+                "result": "success",
+                "details": {"evidences": [{}] * n_evidences},
+                "duration": 0,
+            },
+        }
+    }
@@ -0,0 +1,321 @@
+"""
+Benchmark suite timing each stage of the evidence-to-export pipeline
+
+Builds a synthetic workload of metrics, a table and an assessment plan, then
+times every stage an export goes through, from container conversion to the
+upload to a local fake Credo API server. Each stage is run --repeat times and
+its median and minimum times are reported.
+
+Results can be saved to benchmarks/results/<commit>.json and compared with
+the results of another commit, to catch regressions.
+
+Usage:
+
+    PYTHONPATH=. python -m benchmarks.suite --evidences 10000 --rows 100000 --requirements 1000
+    PYTHONPATH=. python -m benchmarks.suite --save
+    PYTHONPATH=. python -m benchmarks.suite --compare <commit or results file>
+"""
+
+import argparse
+import json
+import logging
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.fake_server import FakeCredoServer
+from connect.evidence import MetricContainer, MetricEvidence, TableContainer
+from connect.governance import Governance
+from connect.governance.credo_api_client import CredoApiClient, CredoApiConfig
+from connect.governance.json_api import serialize
+from connect.utils import Scrubber, global_logger, json_dumps
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+class Workload:
+    """Synthetic data shared by the stages
+
+    Parameters
+    ----------
+    n_evidences : int
+        Number of metric evidences, one per metric type
+    n_rows : int
+        Number of rows of the table evidence
+    n_requirements : int
+        Number of metric requirements of the assessment plan
+    """
+
+    def __init__(self, n_evidences, n_rows, n_requirements, seed=0):
+        rng = np.random.default_rng(seed)
+        self.metrics = pd.DataFrame(
+            {
+                "type": [f"metric_{i}" for i in range(n_evidences)],
+                "value": rng.random(n_evidences),
+                "dataset_type": "validation",
+            }
+        )
+        self.metrics.loc[rng.random(n_evidences) < 0.01, "value"] = np.nan
+        self.table = pd.DataFrame(
+            {
+                "feature": rng.choice(["age", "income", "gender", "zip"], n_rows),
+                "count": rng.integers(0, 1000, n_rows),
+                "value": rng.random(n_rows).round(4),
+            }
+        )
+        self.table.loc[rng.random(n_rows) < 0.01, "value"] = np.nan
+        self.table.name = "profile"
+        self.plan = {
+            "use_case_id": "use_case",
+            "policy_pack_id": "PP+1",
+            "evidence_requirements": [
+                {"evidence_type": "metric", "label": {"metric_type": f"metric_{i}"}}
+                for i in range(n_requirements)
+            ],
+        }
+
+    def evidences(self):
+        return (
+            MetricContainer(self.metrics).to_evidence()
+            + TableContainer(self.table).to_evidence()
+        )
+
+    def governance(self, credo_api_client=None, assessment_plan_url=None):
+        """Registered Governance holding the evidences of the workload"""
+        if credo_api_client is None:
+            # never used to send requests, it only avoids reading ~/.credoconfig
+            config = CredoApiConfig(
+                api_key="API_KEY", tenant="credoai", api_server="http://localhost"
+            )
+            credo_api_client = CredoApiClient(config=config)
+        gov = Governance(credo_api_client=credo_api_client)
+        if assessment_plan_url:
+            gov.register(assessment_plan_url=assessment_plan_url)
+        else:
+            gov.register(
+                assessment_plan=json.dumps({"data": {"attributes": self.plan}})
+            )
+        gov.add_evidence(self.evidences())
+        return gov
+
+
+def invalidate(gov):
+    """Drop cached evidence structures, so that stages build them again"""
+    for evidence in gov._evidences:
+        evidence.invalidate()
+
+
+# each stage maps to a setup run once, and a run timed on its result
+def stage_containers(workload):
+    return lambda: workload.evidences()
+
+
+def stage_scrubber(workload):
+    return lambda: Scrubber.remove_NaNs(workload.table)
+
+
+def stage_evidence_creation(workload):
+    rows = Scrubber.records(workload.metrics)
+    return lambda: [MetricEvidence(**row) for row in rows]
+
+
+def stage_match_requirements(workload):
+    gov = workload.governance()
+    return gov._match_requirements
+
+
+def stage_prepare_export_data(workload):
+    gov = workload.governance()
+
+    def run():
+        invalidate(gov)
+        return gov._prepare_export_data()
+
+    return run
+
+
+def stage_serialize(workload):
+    data = workload.governance()._prepare_export_data()
+    return lambda: serialize(data)
+
+
+def stage_json_dumps(workload):
+    document = serialize(workload.governance()._prepare_export_data())
+    return lambda: json_dumps(document, compact=True, nan_as_null=True)
+
+
+def stage_file_export(workload):
+    gov = workload.governance()
+    directory = tempfile.mkdtemp()
+    filename = Path(directory) / "assessment.json"
+
+    def run():
+        invalidate(gov)
+        gov.export(filename=filename)
+
+    run.close = lambda: shutil.rmtree(directory)
+    return run
+
+
+def stage_api_export(workload):
+    server = FakeCredoServer(assessment_plan=workload.plan).__enter__()
+    gov = workload.governance(server.client(), f"{server.url}/plan")
+
+    def run():
+        invalidate(gov)
+        gov.export()
+
+    run.close = lambda: server.__exit__(None, None, None)
+    return run
+
+
+STAGES = {
+    "containers": stage_containers,
+    "scrubber": stage_scrubber,
+    "evidence_creation": stage_evidence_creation,
+    "match_requirements": stage_match_requirements,
+    "prepare_export_data": stage_prepare_export_data,
+    "serialize": stage_serialize,
+    "json_dumps": stage_json_dumps,
+    "file_export": stage_file_export,
+    "api_export": stage_api_export,
+}
+
+
+def run_suite(workload, stages, repeat):
+    results = {}
+    for name in stages:
+        run = STAGES[name](workload)
+        times = []
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - start)
+        finally:
+            getattr(run, "close", lambda: None)()
+        results[name] = {"median_s": statistics.median(times), "min_s": min(times)}
+    return results
+
+
+def git_commit():
+    """Current commit, with a -dirty suffix if the tree has changes"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if status else commit
+
+
+def load_results(reference):
+    """Results saved for a commit, or in a results file"""
+    path = Path(reference)
+    if not path.is_file():
+        matches = sorted(RESULTS_DIR.glob(f"{reference}*.json"))
+        if not matches:
+            raise SystemExit(f"No saved results for {reference} in {RESULTS_DIR}")
+        path = matches[0]
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(baseline, current, threshold):
+    """Print the change of every stage and return the stages that regressed"""
+    if baseline["params"] != current["params"]:
+        print(f"warning: parameters differ from baseline {baseline['params']}")
+    print(
+        f"{'stage':>20} {baseline['commit']:>14} {current['commit']:>14} {'change':>8}"
+    )
+    regressions = []
+    for name, result in current["stages"].items():
+        if name not in baseline["stages"]:
+            continue
+        before = baseline["stages"][name]["median_s"]
+        after = result["median_s"]
+        change = (after - before) / before if before else 0.0
+        flag = " !" if change > threshold else ""
+        print(f"{name:>20} {before:>13.4f}s {after:>13.4f}s {change:>+8.1%}{flag}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--evidences", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--requirements", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--stages", nargs="+", choices=list(STAGES), default=list(STAGES)
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="save results to benchmarks/results"
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="commit or results file to compare with",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression, by default 0.1",
+    )
+    args = parser.parse_args()
+
+    global_logger.setLevel(logging.WARNING)
+    workload = Workload(args.evidences, args.rows, args.requirements)
+    results = {
+        "commit": git_commit(),
+        "created_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "params": {
+            "evidences": args.evidences,
+            "rows": args.rows,
+            "requirements": args.requirements,
+            "repeat": args.repeat,
+        },
+        "stages": run_suite(workload, args.stages, args.repeat),
+    }
+
+    print(f"{'stage':>20} {'median (s)':>11} {'min (s)':>9}")
+    for name, result in results["stages"].items():
+        print(f"{name:>20} {result['median_s']:>11.4f} {result['min_s']:>9.4f}")
+
+    if args.save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path = RESULTS_DIR / f"{results['commit']}.json"
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"saved {path}")
+
+    if args.compare:
+        print()
+        if compare(load_results(args.compare), results, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,20 @@
 """
 Credo AI Connect package
+
+Subpackages and their classes are imported on first access, so that
+`import connect` stays cheap and does not import pandas or requests.
 """
-from connect.adapters import Adapter
-from connect.governance import Governance
-from connect.utils.version_check import validate_version
+from connect._lazy import lazy_module
 from connect._version import __version__
 
-
 __all__ = ["governance", "evidence", "utils"]
 
-validate_version()
+# lazily imported attribute -> module defining it
+_LAZY_ATTRIBUTES = {
+    "Adapter": "connect.adapters",
+    "Governance": "connect.governance",
+    "validate_version": "connect.utils.version_check",
+}
+_SUBPACKAGES = ("adapters", "evidence", "governance", "utils")
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES, _SUBPACKAGES)
@@ -0,0 +1,40 @@
+"""
+Lazy attributes of packages (PEP 562), so that importing them stays cheap
+"""
+
+import importlib
+import sys
+
+
+def lazy_module(name, attributes, submodules=()):
+    """
+    Returns the module-level `__getattr__` and `__dir__` of a package whose
+    attributes are imported on first access
+
+    Parameters
+    ----------
+    name : str
+        Name of the package, i.e. its `__name__`
+    attributes : dict
+        Lazy attribute -> module defining it, absolute or relative to the package
+    submodules : tuple, optional
+        Submodules of the package imported on first access
+
+    Returns
+    -------
+    tuple
+        `__getattr__` and `__dir__` functions, to assign in the package
+    """
+
+    def __getattr__(attribute):
+        if attribute in attributes:
+            module = importlib.import_module(attributes[attribute], name)
+            return getattr(module, attribute)
+        if attribute in submodules:
+            return importlib.import_module(f"{name}.{attribute}")
+        raise AttributeError(f"module {name!r} has no attribute {attribute!r}")
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[name])) | set(attributes) | set(submodules))
+
+    return __getattr__, __dir__
@@ -4,11 +4,23 @@ Everything needed to generate inputs for the Credo AI Platform
 All the logic defined here is in order to standardize communication with 
 Credo AI Platform API
 """
-from .containers import (
-    EvidenceContainer,
-    MetricContainer,
-    TableContainer,
-    StatisticTestContainer,
+from connect._lazy import lazy_module
+
+from .evidence import (
+    Evidence,
+    MetricEvidence,
+    MetricEvidenceBatch,
+    StatisticTestEvidence,
+    TableEvidence,
 )
-from .evidence import Evidence, MetricEvidence, TableEvidence, StatisticTestEvidence
 from .evidence_requirement import EvidenceRequirement
+
+# containers import pandas, they are imported on first access
+_LAZY_ATTRIBUTES = {
+    "EvidenceContainer": ".containers",
+    "MetricContainer": ".containers",
+    "TableContainer": ".containers",
+    "StatisticTestContainer": ".containers",
+}
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
@@ -73,14 +73,12 @@ class MetricContainer(EvidenceContainer):
         super().__init__(MetricEvidence, data, labels, metadata)
 
     def to_evidence(self, **metadata):
-        evidence = []
-        for _, data in self.scrubbed_data.iterrows():
-            evidence.append(
-                self.evidence_class(
-                    additional_labels=self.labels, **data, **self.metadata, **metadata
-                )
+        return [
+            self.evidence_class(
+                additional_labels=self.labels, **data, **self.metadata, **metadata
             )
-        return evidence
+            for data in Scrubber.records(self._data)
+        ]
 
     def _validate(self, data):
         required_columns = {"type", "value"}
@@ -98,14 +96,12 @@ class StatisticTestContainer(EvidenceContainer):
         super().__init__(StatisticTestEvidence, data, labels, metadata)
 
     def to_evidence(self, **metadata):
-        evidence = []
-        for _, data in self.scrubbed_data.iterrows():
-            evidence.append(
-                self.evidence_class(
-                    additional_labels=self.labels, **data, **self.metadata, **metadata
-                )
+        return [
+            self.evidence_class(
+                additional_labels=self.labels, **data, **self.metadata, **metadata
             )
-        return evidence
+            for data in Scrubber.records(self._data)
+        ]
 
     def _validate(self, data):
         required_columns = {
@@ -123,17 +119,34 @@ class StatisticTestContainer(EvidenceContainer):
 
 
 class TableContainer(EvidenceContainer):
-    """Container for all Table type evidence"""
-
-    def __init__(self, data: pd.DataFrame, labels: dict = None, metadata: dict = None):
+    """Container for all Table type evidence
+
+    Parameters
+    ----------
+    layout : str, optional
+        Layout of the table evidence, "rows" (default) or "columns", see TableEvidence.
+        With "columns", missing values are encoded per column and the data is
+        not scrubbed first
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        labels: dict = None,
+        metadata: dict = None,
+        layout: str = "rows",
+    ):
         super().__init__(TableEvidence, data, labels, metadata)
+        self.layout = layout
 
     def to_evidence(self, **metadata):
+        data = self.scrubbed_data if self.layout == "rows" else self.data
         return [
             self.evidence_class(
-                self.scrubbed_data.name,
-                self.scrubbed_data,
+                data.name,
+                data,
                 self.labels,
+                layout=self.layout,
                 **self.metadata,
                 **metadata,
             )
@@ -1 +1,9 @@
-from .containers import DeepchecksContainer
+from connect._lazy import lazy_module
+
+# containers import pandas and deepchecks, they are imported on first access
+_LAZY_ATTRIBUTES = {
+    "DeepchecksContainer": ".containers",
+    "suites_to_evidence": ".containers",
+}
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
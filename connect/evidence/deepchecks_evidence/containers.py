@@ -1,54 +1,186 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from numbers import Number
+from typing import TYPE_CHECKING, Iterable, List
+
 import pandas as pd
 
-from connect.evidence import EvidenceContainer, TableEvidence
+from connect.evidence import (
+    Evidence,
+    EvidenceContainer,
+    MetricEvidence,
+    TableEvidence,
+)
 from connect.utils import ValidationError
 
 from .evidence import DeepchecksEvidence
 from .utils import get_deepchecks_type
 
-DeepChecksType = get_deepchecks_type()
+if TYPE_CHECKING:
+    from deepchecks.core import SuiteResult
+
+EVIDENCE_MODES = ("status", "suite", "checks")
 
 
 class DeepchecksContainer(EvidenceContainer):
-    """Container for all Table type evidence"""
+    """Container for deepchecks SuiteResult objects
+
+    Parameters
+    ----------
+    name : str
+        Name of the suite of deepchecks checks
+    data : SuiteResult
+        The output of a call to a deepchecks.Suite object's run() function
+    labels : dict, optional
+        Additional labels to pass to underlying evidence
+    metadata : dict, optional
+        Metadata to pass to underlying evidence
+    evidence : str, optional
+        Evidence created from the suite result:
+            "status" (default): a table of the status of each check
+            "suite": the whole suite result rendered as JSON, see DeepchecksEvidence
+            "checks": the status table, plus a metric or table evidence for each
+            check whose value is a number, a dict of numbers or a DataFrame,
+            labeled with the check header
+    """
 
     def __init__(
         self,
         name: str,
-        data: DeepChecksType,
+        data: "SuiteResult",
         labels: dict = None,
         metadata: dict = None,
+        evidence: str = "status",
     ):
+        if evidence not in EVIDENCE_MODES:
+            raise ValidationError(f"'evidence' must be one of {EVIDENCE_MODES}")
         super().__init__(DeepchecksEvidence, data, labels, metadata)
         self.name = name
+        self.evidence = evidence
 
     @property
     def scrubbed_data(self):
         return self._data
 
     def to_evidence(self, **metadata):
-        checks_2_df = {"Check_Name": list(), "Status": list()}
-        for check in self.scrubbed_data.get_not_passed_checks():
-            checks_2_df["Check_Name"].append(check.header)
-            checks_2_df["Status"].append("Not Passed")
-        for check in self.scrubbed_data.get_passed_checks():
-            checks_2_df["Check_Name"].append(check.header)
-            checks_2_df["Status"].append("Passed")
-        for check in self.scrubbed_data.get_not_ran_checks():
-            checks_2_df["Check_Name"].append(check.header)
-            checks_2_df["Status"].append("Not Run")
-
-        check_results_df = pd.DataFrame.from_dict(checks_2_df, orient="columns")
-        check_results_df.name = "Lens_Deepchecks_SuiteResult"
-        return [
+        if self.evidence == "suite":
+            return [
+                self.evidence_class(
+                    self.name, self._data, self.labels, **self.metadata, **metadata
+                )
+            ]
+        evidence = [
             TableEvidence(
-                self.name, check_results_df, self.labels, **self.metadata, **metadata
+                self.name,
+                self._status_table(),
+                self.labels,
+                **self.metadata,
+                **metadata,
             )
         ]
+        if self.evidence == "checks":
+            for check in self._data.results:
+                evidence += self._check_evidence(check, **metadata)
+        return evidence
+
+    def _status_table(self):
+        """Name and status of the checks, in one table"""
+        names, statuses = [], []
+        for status, checks in (
+            ("Not Passed", self._data.get_not_passed_checks()),
+            ("Passed", self._data.get_passed_checks()),
+            ("Not Run", self._data.get_not_ran_checks()),
+        ):
+            for check in checks:
+                names.append(check.header)
+                statuses.append(status)
+        table = pd.DataFrame({"Check_Name": names, "Status": statuses})
+        table.name = "Lens_Deepchecks_SuiteResult"
+        return table
+
+    def _check_evidence(self, check, **metadata):
+        """Metric or table evidence of the value of a check, if it has one"""
+        # checks that failed to run have no value
+        value = getattr(check, "value", None)
+        labels = {**(self.labels or {}), "check": check.header}
+        metadata = {**self.metadata, **metadata}
+        if _is_number(value):
+            metric_type = "_".join(check.header.lower().split())
+            return [
+                MetricEvidence(metric_type, value, additional_labels=labels, **metadata)
+            ]
+        if isinstance(value, dict) and value and all(map(_is_number, value.values())):
+            return [
+                MetricEvidence(str(key), val, additional_labels=labels, **metadata)
+                for key, val in value.items()
+            ]
+        if isinstance(value, pd.DataFrame):
+            # missing values are encoded per column, so the table is not scrubbed
+            return [
+                TableEvidence(check.header, value, labels, layout="columns", **metadata)
+            ]
+        return []
 
     def _validate_inputs(self, data):
-        if not isinstance(data, DeepChecksType):
+        if not isinstance(data, get_deepchecks_type()):
             raise ValidationError("'data' must be a deepchecks.core.SuiteResult object")
 
     def _validate(self, data):
         pass
+
+
+def suites_to_evidence(
+    containers: Iterable[DeepchecksContainer],
+    executor: Executor = None,
+    max_workers: int = None,
+    **metadata,
+) -> List[Evidence]:
+    """
+    Convert many deepchecks containers to evidence in a worker pool
+
+    The data of every evidence, e.g. the JSON rendering of suite results, is
+    computed in the pool and kept, so that exports do not compute it again.
+    The evidences are then released, see Evidence.release, so they no longer
+    hold the suite results.
+
+    Rendering suite results holds the GIL, so threads only overlap their I/O.
+    Pass a ProcessPoolExecutor to render suites in parallel: containers are
+    sent to the worker processes, and only the evidence structures come back.
+
+    Parameters
+    ----------
+    containers : Iterable[DeepchecksContainer]
+        Containers to convert. They must be picklable when executor is a
+        ProcessPoolExecutor
+    executor : Executor, optional
+        Pool running the conversions. If None, a thread pool of max_workers
+        threads is used for this call
+    max_workers : int, optional
+        Number of threads of the pool created when executor is None
+    **metadata
+        Metadata added to every evidence
+
+    Returns
+    -------
+    List[Evidence]
+        The evidences of all containers, in container order
+    """
+    convert = partial(_convert_container, metadata=metadata)
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            converted = list(pool.map(convert, containers))
+    else:
+        converted = list(executor.map(convert, containers))
+    return [evidence for evidences in converted for evidence in evidences]
+
+
+def _convert_container(container, metadata):
+    """Evidences of a container, with their data computed, for worker pools"""
+    evidences = container.to_evidence(**metadata)
+    for evidence in evidences:
+        evidence.release()
+    return evidences
+
+
+def _is_number(value):
+    return isinstance(value, Number) and not isinstance(value, bool)
@@ -1,15 +1,17 @@
-from connect.evidence import Evidence
+from typing import TYPE_CHECKING
 
-from .utils import get_deepchecks_type
+from connect.evidence import Evidence
 
-DeepChecksType = get_deepchecks_type()
+if TYPE_CHECKING:
+    from deepchecks.core import SuiteResult
 
 
 class DeepchecksEvidence(Evidence):
     """
     Evidence for deepchecks SuiteResult objects
 
-    Underlying evidence is passed as a JSON-formatted string. Other
+    Underlying evidence is passed as a JSON-formatted string, rendered once by
+    `struct()` and cached. Call `invalidate()` if the result changes.
 
     Parameters
     ----------
@@ -24,10 +26,13 @@ class DeepchecksEvidence(Evidence):
         displayed in the governance app
     """
 
+    _source_attributes = ("_result",)
+    _cache_data = True
+
     def __init__(
         self,
         name: str,
-        result: DeepChecksType,
+        result: "SuiteResult",
         additional_labels: dict = None,
         **metadata,
     ):
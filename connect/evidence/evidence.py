@@ -4,15 +4,29 @@ Wrappers formatting results of evaluator runs for the Credo AI Platform
 import pprint
 from abc import ABC, abstractproperty
 from datetime import datetime
-from typing import Tuple
-
-from pandas import DataFrame
+from typing import TYPE_CHECKING, Tuple
 
 from connect.utils import ValidationError
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 
 class Evidence(ABC):
-    """Abstract class defining Evidence"""
+    """Abstract class defining Evidence
+
+    The structure of an evidence is built from its current attributes on every
+    call to `struct()`. Evidences whose data is expensive to compute, e.g.
+    from a DataFrame, set `_cache_data`: their structure and data are computed
+    once and cached. Setting `label` or `metadata` updates the cached
+    structure. Other changes, e.g. to the source DataFrame, are not detected:
+    call `invalidate()` after them.
+    """
+
+    # attributes holding source data, dropped by release()
+    _source_attributes: Tuple[str, ...] = ()
+    # whether the structure and data are cached, see invalidate()
+    _cache_data: bool = False
 
     def __init__(self, type: str, additional_labels: dict = None, **metadata):
         self.type = type
@@ -20,21 +34,71 @@ class Evidence(ABC):
         self.metadata = metadata
         self.creation_time: str = datetime.utcnow().isoformat()
         self._label = None
+        self._released = False
         self._validate()
 
     def __str__(self):
         return pprint.pformat(self.struct())
 
-    def struct(self):
-        """Structure of evidence"""
-        structure = {
+    def struct(self, cache: bool = True):
+        """
+        Structure of evidence
+
+        Parameters
+        ----------
+        cache : bool, optional
+            If False, a structure or data that is not cached yet is built
+            without being cached, e.g. to stream it to a file, by default True
+        """
+        if "_struct_cache" in self.__dict__:
+            # copied so that callers cannot alter the cache
+            return dict(self._struct_cache)
+        struct = {
             "type": self.type,
             "label": self.label,
-            "data": self.data,
+            "data": self._cached_data() if cache else self._uncached_data(),
             "generated_at": self.creation_time,
             "metadata": self.metadata,
         }
-        return structure
+        if cache and (self._cache_data or self._released):
+            self._struct_cache = dict(struct)
+        return struct
+
+    def invalidate(self, data: bool = True):
+        """
+        Drop the cached structure, and the cached data if data is True, so
+        that they are computed again. The data of released evidence is kept
+        """
+        self.__dict__.pop("_struct_cache", None)
+        if data and not self.__dict__.get("_released", False):
+            self.__dict__.pop("_data_cache", None)
+
+    def release(self):
+        """
+        Compute and keep the structure of the evidence, then drop references to
+        its source data (e.g. a DataFrame) so that it can be garbage-collected.
+
+        After release, `struct()` still works, and label and metadata can still
+        be changed, but `data` cannot be computed again.
+        """
+        self._data_cache = self._cached_data()
+        self._released = True
+        self.struct()
+        for name in self._source_attributes:
+            setattr(self, name, None)
+
+    def _cached_data(self):
+        if "_data_cache" in self.__dict__:
+            return self._data_cache
+        if not self._cache_data:
+            return self.data
+        self._data_cache = self.data
+        return self._data_cache
+
+    def _uncached_data(self):
+        if "_data_cache" in self.__dict__:
+            return self._data_cache
+        return self.data
 
     @property
     def label(self):
@@ -49,6 +113,16 @@ class Evidence(ABC):
     @label.setter
     def label(self, value):
         self._label = value
+        self.invalidate(data=False)
+
+    @property
+    def metadata(self):
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value):
+        self._metadata = value
+        self.invalidate(data=False)
 
     @abstractproperty
     def base_label(self):
@@ -91,7 +165,7 @@ class MetricEvidence(Evidence):
         confidence_interval: Tuple[float, float] = None,
         confidence_level: int = None,
         additional_labels=None,
-        **metadata
+        **metadata,
     ):
         self.metric_type = type
         self.value = value
@@ -117,6 +191,188 @@ class MetricEvidence(Evidence):
             raise ValidationError
 
 
+class MetricEvidenceBatch:
+    """
+    Many metric evidences stored in arrays
+
+    A batch behaves like a list of MetricEvidence without creating one object
+    per metric: metric types, values and confidence intervals are kept in numpy
+    arrays, labels and metadata are shared by the whole batch, and structures
+    are built straight from the arrays. Iterating or indexing a batch returns
+    lightweight row views, used by Governance to match evidence requirements.
+
+    Parameters
+    ----------
+    types : array-like of str
+        short identifier of each metric
+    values : array-like of float
+        value of each metric. Values that are not numbers, e.g. Decimal or
+        None, are converted to float, None becoming NaN
+    confidence_intervals : array-like of shape (n, 2), optional
+        [lower, upper] confidence interval of each metric
+    confidence_levels : int or array-like of int, optional
+        Level of confidence of the intervals (e.g., 95%), for all or each metric
+    additional_labels : dict, optional
+        Extra labels shared by all metrics
+    metadata : dict, optional
+        Arbitrary keyword arguments shared by all metrics as metadata. These will be
+        displayed in the governance app
+    """
+
+    type = "metric"
+
+    def __init__(
+        self,
+        types,
+        values,
+        confidence_intervals=None,
+        confidence_levels=None,
+        additional_labels: dict = None,
+        **metadata,
+    ):
+        import numpy as np
+
+        self.types = np.asarray(types, dtype=object)
+        self.values = np.asarray(values)
+        if self.values.dtype.kind not in "iufb":
+            # e.g. an object array of Decimals, or of floats and None
+            try:
+                self.values = self.values.astype(float)
+            except (TypeError, ValueError):
+                raise ValidationError("values must be numbers")
+        n_metrics = len(self.types)
+        if self.values.shape != (n_metrics,):
+            raise ValidationError("types and values must have the same length")
+
+        self.confidence_intervals = None
+        if confidence_intervals is not None:
+            self.confidence_intervals = np.asarray(confidence_intervals, dtype=float)
+            if self.confidence_intervals.shape != (n_metrics, 2):
+                raise ValidationError("confidence_intervals must have shape (n, 2)")
+            if confidence_levels is None:
+                raise ValidationError
+
+        self.confidence_levels = None
+        if confidence_levels is not None:
+            self.confidence_levels = np.broadcast_to(confidence_levels, (n_metrics,))
+
+        self.additional_labels = additional_labels or {}
+        self.metadata = metadata
+        self.creation_time: str = datetime.utcnow().isoformat()
+        # labels set on rows, e.g. by Governance when matching requirements
+        self._labels = {}
+
+    def __len__(self):
+        return len(self.types)
+
+    def __iter__(self):
+        return (MetricEvidenceRow(self, index) for index in range(len(self)))
+
+    def __getitem__(self, index: int):
+        if not -len(self) <= index < len(self):
+            raise IndexError("batch index out of range")
+        return MetricEvidenceRow(self, index % len(self))
+
+    def structs(self):
+        """Structure of every metric evidence of the batch, see Evidence.struct"""
+        n_metrics = len(self)
+        intervals = (
+            self.confidence_intervals.tolist()
+            if self.confidence_intervals is not None
+            else [None] * n_metrics
+        )
+        levels = (
+            self.confidence_levels.tolist()
+            if self.confidence_levels is not None
+            else [None] * n_metrics
+        )
+        structs = []
+        for index, (metric_type, value, interval, level) in enumerate(
+            zip(self.types.tolist(), self.values.tolist(), intervals, levels)
+        ):
+            label = self._labels.get(index)
+            if label is None:
+                label = {"metric_type": metric_type, **self.additional_labels}
+            structs.append(
+                {
+                    "type": self.type,
+                    "label": label,
+                    "data": {
+                        "value": value,
+                        "confidence_interval": interval,
+                        "confidence_level": level,
+                    },
+                    "generated_at": self.creation_time,
+                    "metadata": self.metadata,
+                }
+            )
+        return structs
+
+    def _label(self, index):
+        label = self._labels.get(index)
+        if label is None:
+            label = {"metric_type": self.types[index], **self.additional_labels}
+        return label
+
+    def _data(self, index):
+        interval = None
+        if self.confidence_intervals is not None:
+            interval = self.confidence_intervals[index].tolist()
+        level = None
+        if self.confidence_levels is not None:
+            level = self.confidence_levels[index].item()
+        return {
+            "value": self.values[index].item(),
+            "confidence_interval": interval,
+            "confidence_level": level,
+        }
+
+
+class MetricEvidenceRow:
+    """View of one metric of a MetricEvidenceBatch, with the interface of MetricEvidence"""
+
+    __slots__ = ("_batch", "_index")
+
+    type = "metric"
+
+    def __init__(self, batch: MetricEvidenceBatch, index: int):
+        self._batch = batch
+        self._index = index
+
+    def __str__(self):
+        return pprint.pformat(self.struct())
+
+    @property
+    def label(self):
+        return self._batch._label(self._index)
+
+    @label.setter
+    def label(self, value):
+        self._batch._labels[self._index] = value
+
+    @property
+    def data(self):
+        return self._batch._data(self._index)
+
+    @property
+    def metadata(self):
+        return self._batch.metadata
+
+    @property
+    def creation_time(self):
+        return self._batch.creation_time
+
+    def struct(self):
+        """Structure of evidence"""
+        return {
+            "type": self.type,
+            "label": self.label,
+            "data": self.data,
+            "generated_at": self.creation_time,
+            "metadata": self.metadata,
+        }
+
+
 class StatisticTestEvidence(Evidence):
     """
     Evidence for Statistical Test:value result type
@@ -146,7 +402,7 @@ class StatisticTestEvidence(Evidence):
         p_value: float,
         significant: bool,
         additional_labels=None,
-        **metadata
+        **metadata,
     ):
         self.statistic_type = statistic_type
         self.test_statistic = test_statistic
@@ -178,16 +434,31 @@ class TableEvidence(Evidence):
     ----------
     data : str
         a pandas DataFrame to use as evidence
+    layout : str, optional
+        "rows" (default) encodes the table as a list of rows. "columns" encodes
+        it as one list per column. Both are built from the values of each
+        column, converted the same way, so that mixed dtypes are not upcast.
+        Missing values are encoded as None
     metadata : dict, optional
         Arbitrary keyword arguments to append to metric as metadata. These will be
         displayed in the governance app
     """
 
+    LAYOUTS = ("rows", "columns")
+    _source_attributes = ("_data",)
+    _cache_data = True
+
     def __init__(
-        self, name: str, table_data: DataFrame, additional_labels=None, **metadata
+        self,
+        name: str,
+        table_data: "DataFrame",
+        additional_labels=None,
+        layout: str = "rows",
+        **metadata,
     ):
         self.name = name
         self._data = table_data
+        self.layout = layout
         super().__init__("table", additional_labels, **metadata)
 
     @property
@@ -196,16 +467,48 @@ class TableEvidence(Evidence):
             {"value": k, "type": self._transform_type(v)}
             for k, v in self._data.dtypes.items()
         ]
-        return {
-            "columns": columns,
-            "value": self._data.values.tolist(),
-        }
+        values = [self._column_values(c) for _, c in self._data.items()]
+        if self.layout == "columns":
+            return {"columns": columns, "layout": "columns", "value": values}
+        if not values:
+            rows = [[] for _ in range(len(self._data))]
+        else:
+            rows = [list(row) for row in zip(*values)]
+        return {"columns": columns, "value": rows}
 
     @property
     def base_label(self):
         label = {"table_name": self.name}
         return label
 
+    def _validate(self):
+        if self.layout not in self.LAYOUTS:
+            raise ValidationError(f"layout must be one of {self.LAYOUTS}")
+
+    @staticmethod
+    def _column_values(column):
+        """Values of a column as a list of Python objects, missing values as None"""
+        import numpy as np
+
+        if not isinstance(column.dtype, np.dtype):
+            # extension dtypes, e.g. nullable Int64 or categories
+            kind = "O"
+        else:
+            values = column.to_numpy()
+            kind = values.dtype.kind
+        if kind in "iub":
+            # integers and booleans cannot be missing
+            return values.tolist()
+        if kind == "f":
+            missing = np.isnan(values)
+            result = values.tolist()
+        else:
+            missing = column.isna().to_numpy()
+            result = column.tolist()
+        for position in np.flatnonzero(missing):
+            result[position] = None
+        return result
+
     def _transform_type(self, pandas_type):
         lookup = {
             "int64": "number",
@@ -1 +1,9 @@
-from .containers import DataProfilerContainer, ModelProfilerContainer
+from connect._lazy import lazy_module
+
+# containers validate ydata_profiling reports, they are imported on first access
+_LAZY_ATTRIBUTES = {
+    "DataProfilerContainer": ".containers",
+    "ModelProfilerContainer": ".containers",
+}
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
@@ -1,4 +1,5 @@
-import numpy as np
+from dataclasses import fields, is_dataclass
+from typing import Iterable
 
 from connect.evidence import EvidenceContainer
 from connect.utils import Scrubber, ValidationError
@@ -6,18 +7,43 @@ from connect.utils import Scrubber, ValidationError
 from .evidence import DataProfilerEvidence, ModelProfilerEvidence
 from .utils import get_ydata_profile_type
 
-ydataProfileType = get_ydata_profile_type()
+# sections of a profile description whose size grows with the data
+BULKY_SECTIONS = ("correlations", "duplicates", "histograms", "missing", "sample")
 
 
 class DataProfilerContainer(EvidenceContainer):
-    """Container for all profiler type evidence"""
+    """Container for all profiler type evidence
 
-    def __init__(self, data, labels: dict = None, metadata: dict = None):
+    The description of the profile report is computed and scrubbed once, on
+    first access to `scrubbed_data`, and shared by every evidence.
+
+    Parameters
+    ----------
+    exclude : Iterable[str], optional
+        Sections of the description left out of the evidence, to bound its
+        size and export time. Either top level sections, e.g. "correlations",
+        "sample", "duplicates", "missing" or "scatter", or "histograms" for
+        the histograms of every variable. BULKY_SECTIONS lists the largest.
+        By default the whole description is kept
+    """
+
+    def __init__(
+        self,
+        data,
+        labels: dict = None,
+        metadata: dict = None,
+        exclude: Iterable[str] = (),
+    ):
         super().__init__(DataProfilerEvidence, data, labels, metadata)
+        self.exclude = frozenset(exclude)
+        self._scrubbed_description = None
 
     @property
     def scrubbed_data(self):
-        return Scrubber.remove_NaNs(self.data.get_description())
+        if self._scrubbed_description is None:
+            description = _drop_sections(self.data.get_description(), self.exclude)
+            self._scrubbed_description = Scrubber.remove_NaNs(description)
+        return self._scrubbed_description
 
     def to_evidence(self, **metadata):
         return [
@@ -30,12 +56,39 @@ class DataProfilerContainer(EvidenceContainer):
         pass
 
     def _validate_inputs(self, data):
-        if not isinstance(data, ydataProfileType):
+        if not isinstance(data, get_ydata_profile_type()):
             raise ValidationError(
                 "'data' must be a ydata_profiling.profile_report.ProfileReport"
             )
 
 
+def _drop_sections(description, exclude):
+    """
+    Returns the sections of a profile description as a dict, without the
+    excluded ones. The description itself is cached by the report and is
+    not modified
+    """
+    if is_dataclass(description):
+        # recent ydata_profiling versions describe reports with a dataclass
+        description = {
+            field.name: getattr(description, field.name)
+            for field in fields(description)
+        }
+    description = {
+        section: value
+        for section, value in description.items()
+        if section not in exclude
+    }
+    if "histograms" in exclude and isinstance(description.get("variables"), dict):
+        description["variables"] = {
+            name: {
+                key: value for key, value in variable.items() if "histogram" not in key
+            }
+            for name, variable in description["variables"].items()
+        }
+    return description
+
+
 class ModelProfilerContainer(EvidenceContainer):
     """Container for Model Profiler type evidence"""
 
@@ -1,9 +1,10 @@
-import json
-
-from pandas import DataFrame, Series
+from typing import TYPE_CHECKING
 
 from connect.evidence import Evidence
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 
 class DataProfilerEvidence(Evidence):
     """
@@ -31,7 +32,10 @@ class ModelProfilerEvidence(Evidence):
     Labeling contains info on where the entries come from: user vs autogenerated
     """
 
-    def __init__(self, data: DataFrame, additional_labels: dict = None, **metadata):
+    _source_attributes = ("_data",)
+    _cache_data = True
+
+    def __init__(self, data: "DataFrame", additional_labels: dict = None, **metadata):
         super().__init__("model_profiler", additional_labels, **metadata)
         self._data = data["results"]
 
@@ -1,2 +1,3 @@
 """All protocols for interaction with Credo AI Platform"""
+from .fleet import GovernanceFleet
 from .governance import Governance
@@ -0,0 +1,78 @@
+"""
+Streaming writer for assessment JSON:API documents
+"""
+
+import json
+from typing import IO, Iterable
+
+from connect.utils import json_dumps
+
+from .json_api import serialize
+
+INDENT = 2
+# stands in for the evidences while the rest of the document is serialized
+EVIDENCES_PLACEHOLDER = "__connect_evidences__"
+
+
+def write_assessment(f: IO[str], data: dict, meta: dict = None, compact=False):
+    """
+    Write an assessment JSON:API document to a file, one evidence at a time
+
+    The output is identical to `json_dumps(serialize(data=data, meta=meta))`,
+    but the whole document is never held in memory: only one evidence is
+    serialized at a time, so `data["evidences"]` can be a generator.
+
+    Parameters
+    ----------
+    f : file object
+        Text file to write to
+    data : dict
+        assessment data generated by Governance. Its "evidences" must not be empty
+    meta : dict, optional
+        JSON:API meta of the document
+    compact : bool, optional
+        If True, the document is written without indentation and whitespace,
+        by default False
+    """
+    skeleton = serialize(data={**data, "evidences": EVIDENCES_PLACEHOLDER}, meta=meta)
+    head, tail = json_dumps(skeleton, compact=compact).split(
+        json.dumps(EVIDENCES_PLACEHOLDER)
+    )
+
+    if compact:
+        newline = ""
+        opening, separator, closing = "[", ",", "]"
+    else:
+        last_line = head.rsplit("\n", 1)[-1]
+        depth = len(last_line) - len(last_line.lstrip(" "))
+        newline = "\n" + " " * (depth + INDENT)
+        opening, separator, closing = (
+            "[" + newline,
+            "," + newline,
+            "\n" + " " * depth + "]",
+        )
+
+    f.write(head)
+    written = _write_items(f, data["evidences"], opening, separator, newline, compact)
+    f.write(closing if written else "[]")
+    f.write(tail)
+
+
+def _write_items(
+    f: IO[str],
+    items: Iterable,
+    opening: str,
+    separator: str,
+    newline: str,
+    compact: bool,
+):
+    written = 0
+    for item in items:
+        f.write(separator if written else opening)
+        text = json_dumps(item, compact=compact)
+        if newline:
+            # JSON strings cannot contain raw newlines, so this only re-indents
+            text = text.replace("\n", newline)
+        f.write(text)
+        written += 1
+    return written
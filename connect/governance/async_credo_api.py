@@ -0,0 +1,59 @@
+"""
+Credo API functions for asyncio
+"""
+import httpx
+
+from .async_credo_api_client import AsyncCredoApiClient
+from .credo_api import (
+    CredoApi,
+    assessment_plan_url_path,
+    handle_assessment_plan_url_error,
+)
+
+
+class AsyncCredoApi(CredoApi):
+    """
+    AsyncCredoApi holds Credo API functions as coroutines
+
+    See CredoApi for the description of each function.
+    """
+
+    def __init__(self, client: AsyncCredoApiClient = None):
+        super().__init__(client)
+
+    async def get_assessment_plan_url(
+        self, use_case_name: str, policy_pack_key: str = None
+    ):
+        try:
+            path = assessment_plan_url_path(use_case_name, policy_pack_key)
+            response = await self._client.get(path)
+            return response["url"]
+        except httpx.HTTPStatusError as error:
+            return handle_assessment_plan_url_error(
+                error, use_case_name, policy_pack_key
+            )
+
+    async def get_assessment_plan(self, url: str):
+        return await self._client.get(url)
+
+    async def get_assessment_plan_if_modified(self, url: str, etag: str = None):
+        return await self._client.get_conditional(url, etag)
+
+    async def create_assessment(self, use_case_id: str, data: dict):
+        path = f"use_cases/{use_case_id}/assessments"
+        return await self._client.post(path, data)
+
+    async def get_assessment(self, use_case_id: str, id: str):
+        path = f"use_cases/{use_case_id}/assessments/{id}"
+        return await self._client.get(path)
+
+    async def get_assessment_with_headers(self, use_case_id: str, id: str):
+        path = f"use_cases/{use_case_id}/assessments/{id}"
+        return await self._client.get_with_headers(path)
+
+    async def update_use_case_model_link_tags(
+        self, use_case_id: str, model_link_id: str, tags: dict
+    ):
+        path = f"use_cases/{use_case_id}/model_links/{model_link_id}"
+        data = {"tags": tags, "$type": "use_case_model_links", "id": model_link_id}
+        return await self._client.patch(path, data)
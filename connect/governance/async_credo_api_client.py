@@ -0,0 +1,300 @@
+"""
+Defines asyncio Credo API client
+"""
+
+import asyncio
+import os
+import weakref
+from functools import partial
+from typing import Dict
+
+import httpx
+
+from .credo_api_client import (
+    CredoApiConfig,
+    build_headers,
+    encode_body,
+    log_response_errors,
+)
+from .json_api import deserialize
+from .token_cache import TokenCache, jwt_expiry, token_expiring, token_expiry
+from .transport import TransportPolicy
+
+# locks serializing the clients of an event loop that share a token cache file
+_token_cache_locks = weakref.WeakKeyDictionary()
+
+
+def _token_cache_lock(token_cache: TokenCache) -> asyncio.Lock:
+    locks = _token_cache_locks.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(str(token_cache.path), asyncio.Lock())
+
+
+class AsyncCredoApiClient:
+    """
+    AsyncCredoApiClient is an asyncio interface class to the Credo API server.
+
+    It has the same surface as CredoApiClient, but every request is a coroutine
+    sent with `httpx.AsyncClient`, so many requests can be in flight at once.
+    The access token is fetched with the first request, and refreshed shortly
+    before it expires.
+
+    Parameters
+    ----------
+    config : CredoApiConfig, optional
+        API configuration. If None, it is loaded from config_path
+    config_path : str, optional
+        path to .credoconfig file. If None, points to ~/.credoconfig
+    http_client : httpx.AsyncClient, optional
+        client used to send requests. A new one is created if None
+    compress : bool, optional
+        If True, bodies of post and patch requests are gzipped, by default False.
+        Can be overridden per request
+    transport : TransportPolicy, optional
+        Connection pool, timeout and retry policy. Defaults to TransportPolicy().
+        Pool size and timeouts only apply to the http client created if
+        http_client is None
+    token_cache : TokenCache, optional
+        Cache of access tokens shared with other processes. Defaults to
+        TokenCache.from_env(), i.e. no cache unless CREDO_CONNECT_TOKEN_CACHE=1.
+        Clients of one event loop exchange the API key one at a time. Async
+        clients of other processes may exchange it concurrently, after which
+        they all use the first token stored
+    """
+
+    def __init__(
+        self,
+        config: CredoApiConfig = None,
+        config_path=None,
+        http_client: httpx.AsyncClient = None,
+        compress: bool = False,
+        transport: TransportPolicy = None,
+        token_cache: TokenCache = None,
+    ):
+        self._compress = compress
+        self._transport = transport or TransportPolicy()
+        if config:
+            self._config = config
+        else:
+            self._config = CredoApiConfig()
+            self._config.load_config(config_path=config_path)
+
+        self._client = http_client or httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self._transport.pool_maxsize,
+                max_keepalive_connections=self._transport.pool_maxsize,
+            ),
+            timeout=httpx.Timeout(
+                self._transport.read_timeout, connect=self._transport.connect_timeout
+            ),
+        )
+        self._token_cache = token_cache or TokenCache.from_env()
+        self._token_lock = None
+        self._authenticated = False
+        self._access_token = None
+        self._token_expires_at = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Close the underlying http client
+        """
+        await self._client.aclose()
+
+    async def refresh_token(self):
+        """
+        Get access token and set to headers
+        """
+        async with self.__lock():
+            await self.__authenticate(rejected_token=self._access_token)
+
+    def set_access_token(self, access_token, expires_at: float = None):
+        """
+        Set access token to headers
+
+        expires_at defaults to the exp claim of the token, if it is a JWT
+        """
+        self._client.headers.update(build_headers(access_token))
+        self._authenticated = True
+        self._access_token = access_token
+        self._token_expires_at = expires_at or jwt_expiry(access_token)
+
+    def __lock(self):
+        # created on first use, in the event loop of the requests
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        return self._token_lock
+
+    def __token_valid(self):
+        return self._authenticated and not token_expiring(self._token_expires_at)
+
+    async def __ensure_token(self):
+        """Authenticate on first request, or ahead of the token expiry"""
+        if self.__token_valid():
+            return
+        async with self.__lock():
+            if not self.__token_valid():
+                await self.__authenticate()
+
+    async def __token_rejected(self, rejected_token):
+        """Refresh the access token after a 401, unless another task did"""
+        async with self.__lock():
+            if self._access_token == rejected_token:
+                await self.__authenticate(rejected_token=rejected_token)
+
+    async def __authenticate(self, rejected_token=None):
+        self._authenticated = True
+        if not self._config.valid:
+            return
+        if self._token_cache is None:
+            self.set_access_token(*await self.__exchange_token())
+            return
+
+        key = TokenCache.key(
+            self._config.api_server, self._config.tenant, self._config.api_key
+        )
+        # the file lock blocks, so it is only taken in worker threads, and
+        # never held across an await: clients of this event loop are
+        # serialized by an asyncio lock instead
+        loop = asyncio.get_running_loop()
+        async with _token_cache_lock(self._token_cache):
+            cached = await loop.run_in_executor(None, self._token_cache.get, key)
+            if cached and cached["access_token"] != rejected_token:
+                entry = cached
+            else:
+                access_token, expires_at = await self.__exchange_token()
+                entry = await loop.run_in_executor(
+                    None,
+                    partial(
+                        self._token_cache.get_or_put,
+                        key,
+                        access_token,
+                        expires_at,
+                        rejected_token,
+                    ),
+                )
+        self.set_access_token(entry["access_token"], entry["expires_at"])
+
+    async def __exchange_token(self):
+        data = {"api_token": self._config.api_key, "tenant": self._config.tenant}
+        headers = {"content-type": "application/json", "charset": "utf-8"}
+        auth_url = os.path.join(self._config.api_server, "auth", "exchange")
+        response = await self.__request("post", auth_url, json=data, headers=headers)
+        token_response = response.json()
+        return token_response["access_token"], token_expiry(token_response)
+
+    async def __make_request(self, method: str, path: str, **kwargs):
+        response = await self.__send(method, path, **kwargs)
+
+        if response.content:
+            return deserialize(response.json())
+        else:
+            return None
+
+    async def __send(self, method: str, path: str, **kwargs):
+        if path.startswith("http"):
+            endpoint = path
+        else:
+            endpoint = self.__build_endpoint(path)
+
+        await self.__ensure_token()
+        access_token = self._access_token
+        response = await self.__request(method, endpoint, **kwargs)
+        if response.status_code == 401:
+            await self.__token_rejected(access_token)
+            response = await self.__request(method, endpoint, **kwargs)
+
+        if response.status_code >= 400:
+            log_response_errors(method, endpoint, response)
+            # httpx also raises for 3xx, which includes 304 Not Modified
+            response.raise_for_status()
+
+        return response
+
+    async def __request(self, method: str, endpoint: str, **kwargs):
+        """Send a request, retrying it as allowed by the transport policy"""
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.request(
+                    method.upper(), endpoint, **kwargs
+                )
+            except httpx.TransportError as error:
+                if not self._transport.should_retry(method, attempt, error=error):
+                    raise
+                retry_after = None
+            else:
+                if not self._transport.should_retry(
+                    method, attempt, status=response.status_code
+                ):
+                    return response
+                retry_after = self._transport.retry_after(response.headers)
+
+            await asyncio.sleep(self._transport.delay(attempt, retry_after))
+            attempt += 1
+
+    def __build_endpoint(self, path):
+        return os.path.join(self._config.api_base, path)
+
+    async def get(self, path: str, **kwargs):
+        """
+        Send get request and return retult
+        """
+        return await self.__make_request("get", path, **kwargs)
+
+    async def get_with_headers(self, path: str, **kwargs):
+        """
+        Send get request and return its result and the response headers
+
+        See CredoApiClient.get_with_headers
+        """
+        response = await self.__send("get", path, **kwargs)
+        result = deserialize(response.json()) if response.content else None
+        return result, response.headers
+
+    async def get_conditional(self, path: str, etag: str = None, **kwargs):
+        """
+        Send get request with an If-None-Match header
+
+        See CredoApiClient.get_conditional
+        """
+        headers = {**kwargs.pop("headers", {})}
+        if etag:
+            headers["If-None-Match"] = etag
+        response = await self.__send("get", path, headers=headers, **kwargs)
+        if response.status_code == 304:
+            return None, etag
+        result = deserialize(response.json()) if response.content else None
+        return result, response.headers.get("ETag")
+
+    async def post(self, path: str, data: Dict = None, compress: bool = None, **kwargs):
+        """
+        Send post request and return retult
+        """
+        return await self.__send_body("post", path, data, compress, **kwargs)
+
+    async def patch(
+        self, path: str, data: Dict = None, compress: bool = None, **kwargs
+    ):
+        """
+        Send patch request and return retult
+        """
+        return await self.__send_body("patch", path, data, compress, **kwargs)
+
+    async def __send_body(self, method, path, data, compress, **kwargs):
+        if compress is None:
+            compress = self._compress
+        content, headers = encode_body(data, compress)
+        if headers:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **headers}
+        return await self.__make_request(method, path, content=content, **kwargs)
+
+    async def delete(self, path: str, **kwargs):
+        """
+        Send delete request and return retult
+        """
+        return await self.__make_request("delete", path, **kwargs)
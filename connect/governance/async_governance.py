@@ -0,0 +1,208 @@
+"""
+Credo Governance for asyncio
+"""
+
+import asyncio
+
+import httpx
+
+from connect.utils import global_logger
+
+from .async_credo_api import AsyncCredoApi
+from .async_credo_api_client import AsyncCredoApiClient
+from .governance import Governance
+from .polling import PollingStrategy
+
+
+class AsyncGovernance(Governance):
+    """Governance whose API interactions are coroutines.
+
+    AsyncGovernance behaves like Governance, except that `register`,
+    `apply_model_changes` and `export` must be awaited. Requests are sent
+    with AsyncCredoApiClient, so a single event loop can keep many exports
+    in flight.
+
+    Parameters
+    ----------
+    credo_api_client: AsyncCredoApiClient, optional
+        Async Credo API client. Uses default async Credo API client if it is None
+    polling_strategy : PollingStrategy, optional
+        Strategy used to wait until the server processed an uploaded assessment.
+        Defaults to ExponentialBackoffPolling
+    **kwargs
+        Other arguments of Governance, e.g. manifest or plan_cache
+
+    Examples
+    --------
+    Export the evidences of several models concurrently:
+
+        from connect.governance.async_governance import AsyncGovernance
+
+        async def export(model):
+            gov = AsyncGovernance(credo_api_client=client)
+            await gov.register(use_case_name=model.use_case, policy_pack_key="FAIR")
+            gov.set_artifacts(model.name, model.tags)
+            gov.add_evidence(model.evidences)
+            return await gov.export()
+
+        await asyncio.gather(*(export(model) for model in models))
+    """
+
+    _api_class = AsyncCredoApi
+    _client_class = AsyncCredoApiClient
+
+    def __init__(
+        self,
+        config_path: str = None,
+        credo_api_client: AsyncCredoApiClient = None,
+        polling_strategy: PollingStrategy = None,
+        **kwargs,
+    ):
+        super().__init__(
+            config_path=config_path,
+            credo_api_client=credo_api_client,
+            polling_strategy=polling_strategy,
+            **kwargs,
+        )
+
+    async def apply_model_changes(self):
+        """
+        Update Platform model's tags to CredoAI Governance if changed
+
+        See Governance.apply_model_changes
+        """
+        for api_call, plan_model, key, model_value in self._model_changes():
+            await api_call(self._use_case_id, plan_model["id"], model_value)
+            plan_model[key] = model_value
+
+    async def export(
+        self,
+        filename=None,
+        batch_size: int = None,
+        max_workers: int = 4,
+        compact: bool = False,
+        incremental: bool = False,
+    ):
+        """
+        Upload evidences to CredoAI Governance(Report) App
+
+        See Governance.export. `max_workers` bounds the number of batches
+        uploaded concurrently.
+        """
+        if not self.validate_export():
+            return False
+        to_return = self._match_requirements()
+
+        if filename is None:
+            self._assessment = None
+            await self._api_export(batch_size, max_workers, incremental)
+        else:
+            self._file_export(filename, compact)
+
+        self._log_export_status(to_return)
+        return to_return
+
+    async def register(
+        self,
+        assessment_plan_url: str = None,
+        use_case_name: str = None,
+        policy_pack_key: str = None,
+        assessment_plan: str = None,
+        assessment_plan_file: str = None,
+    ):
+        """
+        Get assessment plan and register it
+
+        See Governance.register
+        """
+        self._plan = None
+
+        plan = None
+        if use_case_name or assessment_plan_url:
+            plan = await self._fetch_plan(
+                assessment_plan_url, use_case_name, policy_pack_key
+            )
+
+        local_plan = self._read_plan(assessment_plan, assessment_plan_file)
+        if local_plan is not None:
+            plan = local_plan
+
+        self._set_plan(plan)
+
+    async def _api_export(self, batch_size=None, max_workers=4, incremental=False):
+        # update when model tags are changed
+        await self.apply_model_changes()
+
+        evidences, manifest_entries = self._select_evidences(incremental)
+        if not evidences:
+            global_logger.info(
+                "No evidence changed since the last export, nothing was uploaded"
+            )
+            return
+
+        self._log_upload_start(len(evidences))
+        if batch_size:
+            assessment = await self._batched_upload(
+                self._prepare_batches(evidences, batch_size), max_workers
+            )
+        else:
+            assessment = await self._upload(self._prepare_export_data(evidences))
+
+        self._report_assessment(assessment)
+        self._record_exported(assessment, manifest_entries)
+
+    async def _batched_upload(self, batches, max_workers):
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def upload_batch(data):
+            async with semaphore:
+                try:
+                    return await self._upload(data)
+                except httpx.HTTPError as error:
+                    return {"result": "error", "error": str(error)}
+
+        assessments = await asyncio.gather(*map(upload_batch, batches))
+        return self._merge_assessments(assessments)
+
+    async def _fetch_plan(self, assessment_plan_url, use_case_name, policy_pack_key):
+        if self._plan_cache is None:
+            if use_case_name:
+                assessment_plan_url = await self._api.get_assessment_plan_url(
+                    use_case_name, policy_pack_key
+                )
+            if assessment_plan_url:
+                return await self._api.get_assessment_plan(assessment_plan_url)
+            return None
+
+        key = self._plan_cache_key(assessment_plan_url, use_case_name, policy_pack_key)
+        entry = self._plan_cache.get(key)
+        if entry and self._plan_cache.is_fresh(entry):
+            return entry["plan"]
+
+        try:
+            if use_case_name:
+                assessment_plan_url = await self._api.get_assessment_plan_url(
+                    use_case_name, policy_pack_key
+                )
+            if not assessment_plan_url:
+                return None
+            plan, etag = await self._api.get_assessment_plan_if_modified(
+                assessment_plan_url, self._cached_plan_etag(entry, assessment_plan_url)
+            )
+        except httpx.TransportError as error:
+            return self._offline_plan(entry, error)
+        return self._store_plan(key, entry, assessment_plan_url, plan, etag)
+
+    async def _upload(self, data):
+        assessment = await self._api.create_assessment(self._use_case_id, data)
+
+        if assessment:
+            # wait until uploading is finished without blocking the event loop
+            assessment = await self._polling_strategy.async_wait(
+                lambda: self._api.get_assessment_with_headers(
+                    self._use_case_id, assessment["id"]
+                ),
+                assessment,
+            )
+
+        return assessment
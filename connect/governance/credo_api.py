@@ -10,6 +10,45 @@ from connect.utils import global_logger
 from .credo_api_client import CredoApiClient
 
 
+def assessment_plan_url_path(use_case_name: str, policy_pack_key: str = None):
+    """
+    Returns the API path resolving use_case_name and policy_pack_key to an assessment plan URL
+    """
+    path = f"assessment_plan_url?use_case_name={use_case_name}"
+    if policy_pack_key:
+        path += f"&policy_pack_key={policy_pack_key}"
+    return path
+
+
+def handle_assessment_plan_url_error(
+    error: Exception, use_case_name: str, policy_pack_key: str = None
+):
+    """
+    Logs a failed assessment plan URL lookup and returns None,
+    or raises the error again when the response does not explain it
+    """
+    if policy_pack_key is not None:
+        global_logger.info(
+            f"Use case ({use_case_name}) with policy pack ({policy_pack_key}) does not exist"
+        )
+    else:
+        global_logger.info(
+            f"Cannot find assessment plan URL of use case {use_case_name}"
+        )
+    data = error.response.json()
+    errors = data.get("errors", None)
+    if errors:
+        detail = errors[0]["detail"]
+        if error:
+            global_logger.info(f"Error : {detail}")
+        else:
+            raise error
+
+        return None
+    else:
+        raise error
+
+
 class CredoApi:
     """
     CredoApi holds Credo API functions
@@ -55,32 +94,13 @@ class CredoApi:
         """
 
         try:
-            path = f"assessment_plan_url?use_case_name={use_case_name}"
-            if policy_pack_key:
-                path += f"&policy_pack_key={policy_pack_key}"
+            path = assessment_plan_url_path(use_case_name, policy_pack_key)
             response = self._client.get(path)
             return response["url"]
         except HTTPError as error:
-            if policy_pack_key is not None:
-                global_logger.info(
-                    f"Use case ({use_case_name}) with policy pack ({policy_pack_key}) does not exist"
-                )
-            else:
-                global_logger.info(
-                    f"Cannot find assessment plan URL of use case {use_case_name}"
-                )
-            data = error.response.json()
-            errors = data.get("errors", None)
-            if errors:
-                detail = errors[0]["detail"]
-                if error:
-                    global_logger.info(f"Error : {detail}")
-                else:
-                    raise error
-
-                return None
-            else:
-                raise error
+            return handle_assessment_plan_url_error(
+                error, use_case_name, policy_pack_key
+            )
 
     def get_assessment_plan(self, url: str):
         """
@@ -106,6 +126,30 @@ class CredoApi:
 
         return self._client.get(url)
 
+    def get_assessment_plan_if_modified(self, url: str, etag: str = None):
+        """
+        Get assessment plan from API server unless it matches etag
+
+        Parameters
+        ----------
+        url : str
+            assessment plan URL
+        etag : str, optional
+            ETag of the assessment plan already known
+
+        Returns
+        -------
+        tuple
+            the assessment plan, or None when it did not change, and its ETag
+
+        Raises
+        ------
+        HTTPError
+            When API request returns error
+        """
+
+        return self._client.get_conditional(url, etag)
+
     def create_assessment(self, use_case_id: str, data: dict):
         """
         Upload evidences to API server. API server creates an assessment and returns it.
@@ -161,6 +205,24 @@ class CredoApi:
         path = f"use_cases/{use_case_id}/assessments/{id}"
         return self._client.get(path)
 
+    def get_assessment_with_headers(self, use_case_id: str, id: str):
+        """
+        Get assessment like `get_assessment`, with the headers of the response
+
+        Returns
+        -------
+        tuple
+            the assessment, and the response headers, which can hold a
+            Retry-After header telling when to poll the assessment again
+
+        Raises
+        ------
+        HTTPError
+            When API request returns error
+        """
+        path = f"use_cases/{use_case_id}/assessments/{id}"
+        return self._client.get_with_headers(path)
+
     def update_use_case_model_link_tags(
         self, use_case_id: str, model_link_id: str, tags: dict
     ):
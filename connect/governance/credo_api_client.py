@@ -2,16 +2,72 @@
 Defines Credo API client
 """
 
+import gzip
 import os
+import threading
 from typing import Dict
 
 import requests
 from dotenv import dotenv_values
-from json_api_doc import deserialize, serialize
 
 from connect.utils import get_version, global_logger, json_dumps
 
+from .json_api import deserialize, serialize
+from .token_cache import TokenCache, jwt_expiry, token_expiring, token_expiry
+from .transport import TransportPolicy
+
 CREDO_URL = "https://api.credo.ai"
+# balances compression ratio and speed for JSON payloads
+GZIP_LEVEL = 6
+
+
+def build_headers(access_token: str):
+    """
+    Returns the headers sent with every API request
+    """
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "accept": "application/vnd.api+json",
+        "content-type": "application/vnd.api+json",
+        "X-Client-Name": "Credo AI Connect",
+        "X-Client-Version": get_version(),
+    }
+
+
+def encode_body(data: Dict, compress: bool = False):
+    """
+    Serializes data to a JSON:API request body
+
+    The body is compact and strict JSON: numpy values are converted by the
+    encoder, and NaN and infinities are sent as null, see `json_dumps`.
+
+    Returns
+    -------
+    tuple
+        the body and the headers to send with it. When compress is True,
+        the body is gzipped and sent with a `Content-Encoding: gzip` header
+    """
+    body = json_dumps(serialize(data), compact=True, nan_as_null=True)
+    if not compress:
+        return body, {}
+    body = gzip.compress(body.encode("utf-8"), compresslevel=GZIP_LEVEL)
+    return body, {"Content-Encoding": "gzip"}
+
+
+def log_response_errors(method: str, endpoint: str, response):
+    """
+    Logs the JSON:API errors of a failed API response
+    """
+    try:
+        data = response.json()
+    except ValueError:
+        # e.g. an error page of a proxy, or no body
+        data = None
+    if data:
+        for error in data.get("errors", []):
+            global_logger.error(
+                f"Error happened from [{method.upper()}] {endpoint} : Message={error['title']}, Error Detail={error['detail']}"
+            )
 
 
 class CredoApiConfig:
@@ -99,69 +155,165 @@ class CredoApiConfig:
 class CredoApiClient:
     """
     CredoApiClient is interface class to the Credo API server.
+
+    Parameters
+    ----------
+    config : CredoApiConfig, optional
+        API configuration. If None, it is loaded from config_path
+    config_path : str, optional
+        path to .credoconfig file. If None, points to ~/.credoconfig
+    compress : bool, optional
+        If True, bodies of post and patch requests are gzipped, by default False.
+        Can be overridden per request
+    transport : TransportPolicy, optional
+        Connection pool, timeout and retry policy. Defaults to TransportPolicy()
+    token_cache : TokenCache, optional
+        Cache of access tokens shared with other processes. Defaults to
+        TokenCache.from_env(), i.e. no cache unless CREDO_CONNECT_TOKEN_CACHE=1
+
+    The access token is fetched with the first request, and refreshed shortly
+    before it expires.
     """
 
-    def __init__(self, config: CredoApiConfig = None, config_path=None):
+    def __init__(
+        self,
+        config: CredoApiConfig = None,
+        config_path=None,
+        compress: bool = False,
+        transport: TransportPolicy = None,
+        token_cache: TokenCache = None,
+    ):
+        self._compress = compress
+        self._transport = transport or TransportPolicy()
         if config:
             self._config = config
         else:
             self._config = CredoApiConfig()
             self._config.load_config(config_path=config_path)
 
-        self._session = requests.Session()
-        self.refresh_token()
+        self._session = self._transport.create_session()
+        self._token_cache = token_cache or TokenCache.from_env()
+        self._token_lock = threading.Lock()
+        self._access_token = None
+        self._token_expires_at = None
 
     def refresh_token(self):
         """
         Get access token and set to headers
         """
-        if self._config.valid:
-            data = {"api_token": self._config.api_key, "tenant": self._config.tenant}
-            headers = {"content-type": "application/json", "charset": "utf-8"}
-            auth_url = os.path.join(self._config.api_server, "auth", "exchange")
-            response = requests.post(auth_url, json=data, headers=headers)
-            access_token = response.json()["access_token"]
-            self.set_access_token(access_token)
+        with self._token_lock:
+            self.__authenticate(rejected_token=self._access_token)
 
-    def set_access_token(self, access_token):
+    def set_access_token(self, access_token, expires_at: float = None):
         """
         Set access token to headers
+
+        expires_at defaults to the exp claim of the token, if it is a JWT
         """
+        self._session.headers.update(build_headers(access_token))
+        self._access_token = access_token
+        self._token_expires_at = expires_at or jwt_expiry(access_token)
+
+    def __ensure_token(self):
+        """Authenticate on first request, or ahead of the token expiry"""
+        if self._access_token and not token_expiring(self._token_expires_at):
+            return
+        with self._token_lock:
+            if self._access_token and not token_expiring(self._token_expires_at):
+                return
+            self.__authenticate()
+
+    def __token_rejected(self, rejected_token):
+        """Refresh the access token after a 401, unless another thread did"""
+        with self._token_lock:
+            if self._access_token == rejected_token:
+                self.__authenticate(rejected_token=rejected_token)
+
+    def __authenticate(self, rejected_token=None):
+        if not self._config.valid:
+            return
+        if self._token_cache is None:
+            self.set_access_token(*self.__exchange_token())
+            return
+
+        key = TokenCache.key(
+            self._config.api_server, self._config.tenant, self._config.api_key
+        )
+        with self._token_cache.lock():
+            cached = self._token_cache.get(key)
+            if cached and cached["access_token"] != rejected_token:
+                access_token, expires_at = cached["access_token"], cached["expires_at"]
+            else:
+                access_token, expires_at = self.__exchange_token()
+                self._token_cache.put(key, access_token, expires_at)
+        self.set_access_token(access_token, expires_at)
+
+    def __exchange_token(self):
+        data = {"api_token": self._config.api_key, "tenant": self._config.tenant}
+        # the expired token is not sent with the exchange
         headers = {
-            "Authorization": f"Bearer {access_token}",
-            "accept": "application/vnd.api+json",
-            "content-type": "application/vnd.api+json",
-            "X-Client-Name": "Credo AI Connect",
-            "X-Client-Version": get_version(),
+            "content-type": "application/json",
+            "charset": "utf-8",
+            "Authorization": None,
         }
-        self._session.headers.update(headers)
+        auth_url = os.path.join(self._config.api_server, "auth", "exchange")
+        response = self.__request("post", auth_url, json=data, headers=headers)
+        token_response = response.json()
+        return token_response["access_token"], token_expiry(token_response)
 
     def __make_request(self, method: str, path: str, **kwargs):
+        response = self.__send(method, path, **kwargs)
 
+        if response.content:
+            return deserialize(response.json())
+        else:
+            return None
+
+    def __send(self, method: str, path: str, **kwargs):
         if path.startswith("http"):
             endpoint = path
         else:
             endpoint = self.__build_endpoint(path)
 
-        response = self._session.request(method, endpoint, **kwargs)
+        self.__ensure_token()
+        access_token = self._access_token
+        response = self.__request(method, endpoint, **kwargs)
         if response.status_code == 401:
-            self.refresh_token()
-            response = self._session.request(method, endpoint, **kwargs)
+            self.__token_rejected(access_token)
+            response = self.__request(method, endpoint, **kwargs)
 
         if response.status_code >= 400:
-            data = response.json()
-            if data:
-                for error in data.get("errors", []):
-                    global_logger.error(
-                        f"Error happened from [{method.upper()}] {endpoint} : Message={error['title']}, Error Detail={error['detail']}"
-                    )
+            log_response_errors(method, endpoint, response)
 
         response.raise_for_status()
-
-        if response.content:
-            return deserialize(response.json())
-        else:
-            return None
+        return response
+
+    def __request(self, method: str, endpoint: str, **kwargs):
+        """Send a request, retrying it as allowed by the transport policy"""
+        kwargs.setdefault("timeout", self._transport.timeout)
+        attempt = 0
+        while True:
+            try:
+                response = self._session.request(method, endpoint, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if not self._transport.should_retry(method, attempt, error=error):
+                    raise
+                retry_after = None
+                reason = repr(error)
+            else:
+                if not self._transport.should_retry(
+                    method, attempt, status=response.status_code
+                ):
+                    return response
+                retry_after = self._transport.retry_after(response.headers)
+                reason = f"status {response.status_code}"
+
+            delay = self._transport.delay(attempt, retry_after)
+            global_logger.debug(
+                f"Retrying [{method.upper()}] {endpoint} in {delay:.2f}s after {reason}"
+            )
+            self._transport.sleep(delay)
+            attempt += 1
 
     def __build_endpoint(self, path):
         return os.path.join(self._config.api_base, path)
@@ -172,19 +324,59 @@ class CredoApiClient:
         """
         return self.__make_request("get", path, **kwargs)
 
-    def post(self, path: str, data: Dict = None, **kwargs):
+    def get_with_headers(self, path: str, **kwargs):
+        """
+        Send get request and return its result and the response headers,
+        e.g. to read a Retry-After header
+        """
+        response = self.__send("get", path, **kwargs)
+        result = deserialize(response.json()) if response.content else None
+        return result, response.headers
+
+    def get_conditional(self, path: str, etag: str = None, **kwargs):
+        """
+        Send get request with an If-None-Match header
+
+        Returns
+        -------
+        tuple
+            the result, or None if the server answered 304 Not Modified,
+            and the ETag of the resource
+        """
+        headers = {**kwargs.pop("headers", {})}
+        if etag:
+            headers["If-None-Match"] = etag
+        response = self.__send("get", path, headers=headers, **kwargs)
+        if response.status_code == 304:
+            return None, etag
+        result = deserialize(response.json()) if response.content else None
+        return result, response.headers.get("ETag")
+
+    def post(self, path: str, data: Dict = None, compress: bool = None, **kwargs):
         """
         Send post request and return retult
+
+        The body is gzipped if compress is True, or if it is None and
+        the client was created with compress=True
         """
-        data = json_dumps(serialize(data))
-        return self.__make_request("post", path, data=data, **kwargs)
+        return self.__send_body("post", path, data, compress, **kwargs)
 
-    def patch(self, path: str, data: Dict = None, **kwargs):
+    def patch(self, path: str, data: Dict = None, compress: bool = None, **kwargs):
         """
         Send patch request and return retult
+
+        The body is gzipped if compress is True, or if it is None and
+        the client was created with compress=True
         """
-        data = json_dumps(serialize(data))
-        return self.__make_request("patch", path, data=data, **kwargs)
+        return self.__send_body("patch", path, data, compress, **kwargs)
+
+    def __send_body(self, method, path, data, compress, **kwargs):
+        if compress is None:
+            compress = self._compress
+        body, headers = encode_body(data, compress)
+        if headers:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **headers}
+        return self.__make_request(method, path, data=body, **kwargs)
 
     def delete(self, path: str, **kwargs):
         """
@@ -0,0 +1,88 @@
+"""
+Inverted index of evidences by label, used to match evidence requirements
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from connect.evidence import Evidence
+from connect.utils import check_subset
+
+
+class EvidenceIndex:
+    """Index of evidences by the (key, value) pairs of their labels
+
+    A requirement label matches an evidence when it is a subset of the evidence
+    label, see `connect.utils.check_subset`. Instead of comparing a requirement
+    with every evidence, the index intersects the evidences having each
+    (key, value) pair of the requirement and only runs `check_subset` on the
+    few candidates left. Values that cannot be looked up by hash (None,
+    NaN, dicts, lists and sets) are left to `check_subset`.
+
+    Parameters
+    ----------
+    evidences : List[Evidence]
+        Evidences to index, in the order matches are reported
+    """
+
+    def __init__(self, evidences: List[Evidence]):
+        self._evidences = list(evidences)
+        self._postings: Dict[Tuple, Set[int]] = defaultdict(set)
+        self._positions: Dict[int, List[int]] = defaultdict(list)
+        for position, evidence in enumerate(self._evidences):
+            self._positions[id(evidence)].append(position)
+            self._add(position, evidence.label)
+
+    def match(self, label: dict) -> List[Evidence]:
+        """Returns the evidences whose label includes label, in evidence order"""
+        postings = [self._postings.get(pair) for pair in _indexable_pairs(label)]
+        if postings:
+            if not all(postings):
+                return []
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting
+        else:
+            candidates = range(len(self._evidences))
+        return [
+            self._evidences[position]
+            for position in sorted(candidates)
+            if check_subset(label, self._evidences[position].label)
+        ]
+
+    def relabel(self, evidence: Evidence, label: dict):
+        """Set the label of an indexed evidence and update the index"""
+        positions = self._positions.get(id(evidence))
+        if not positions:
+            raise ValueError("Evidence is not indexed")
+        for pair in _indexable_pairs(evidence.label):
+            for position in positions:
+                self._postings[pair].discard(position)
+        evidence.label = label
+        for position in positions:
+            self._add(position, label)
+
+    def _add(self, position, label):
+        for pair in _indexable_pairs(label):
+            self._postings[pair].add(position)
+
+
+def _indexable_pairs(label):
+    if not isinstance(label, dict):
+        return []
+    pairs = []
+    for key, value in label.items():
+        # None also matches missing keys, NaN never matches and containers
+        # match by inclusion: these are checked by check_subset
+        if value is None or isinstance(value, (dict, list, set)):
+            continue
+        if isinstance(value, float) and math.isnan(value):
+            continue
+        try:
+            hash(value)
+        except TypeError:
+            continue
+        pairs.append((key, value))
+    return pairs
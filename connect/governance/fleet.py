@@ -0,0 +1,191 @@
+"""
+Governance of many use cases sharing one API client
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable
+
+from connect.utils import global_logger
+
+from .credo_api_client import CredoApiClient
+from .governance import Governance
+from .transport import TransportPolicy
+
+
+class GovernanceFleet:
+    """Registers and exports many Governance objects concurrently
+
+    All members share one pooled API client, and so one access token, and one
+    pool of worker threads. Each member is a regular Governance object, reached
+    with `fleet[key]` to add evidences and set artifacts.
+
+    Example:
+
+        fleet = GovernanceFleet(max_workers=16)
+        statuses = fleet.register({
+            "fraud": {"use_case_name": "Fraud Detection", "policy_pack_key": "FAIR"},
+            "credit": {"assessment_plan_url": "https://..."},
+        })
+        fleet["fraud"].add_evidence(evidences)
+        statuses = fleet.export()
+
+    Parameters
+    ----------
+    config_path : str, optional
+        path to .credoconfig file. If None, points to ~/.credoconfig
+    credo_api_client : CredoApiClient, optional
+        Client shared by all members. If None, a client is created whose
+        connection pool fits max_workers * member_workers requests
+    max_workers : int, optional
+        Maximum number of members registering or exporting at once, by default 8
+    member_workers : int, optional
+        Maximum number of batches a member uploads at once, i.e. the
+        `max_workers` of its exports, by default 4
+    **governance_kwargs
+        Other arguments of every member Governance, e.g. polling_strategy,
+        manifest or plan_cache
+    """
+
+    def __init__(
+        self,
+        config_path: str = None,
+        credo_api_client: CredoApiClient = None,
+        max_workers: int = 8,
+        member_workers: int = 4,
+        **governance_kwargs,
+    ):
+        # every member export can upload member_workers batches at once
+        self._client = credo_api_client or CredoApiClient(
+            config_path=config_path,
+            transport=TransportPolicy(pool_maxsize=max_workers * member_workers),
+        )
+        self._member_workers = member_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="connect-fleet"
+        )
+        self._governance_kwargs = governance_kwargs
+        self._members: Dict[str, Governance] = {}
+
+    def __getitem__(self, key: str) -> Governance:
+        return self._members[key]
+
+    def __contains__(self, key: str):
+        return key in self._members
+
+    def __iter__(self):
+        return iter(self._members)
+
+    def __len__(self):
+        return len(self._members)
+
+    def add(self, key: str) -> Governance:
+        """Returns the member Governance of key, created if it does not exist"""
+        if key not in self._members:
+            self._members[key] = Governance(
+                credo_api_client=self._client,
+                executor=self._executor,
+                **self._governance_kwargs,
+            )
+        return self._members[key]
+
+    def register(self, targets: Dict[str, dict]) -> Dict[str, dict]:
+        """
+        Register members concurrently
+
+        Parameters
+        ----------
+        targets : Dict[str, dict]
+            Keyword arguments of Governance.register for each member key, e.g.
+            {"fraud": {"use_case_name": "Fraud Detection", "policy_pack_key": "FAIR"}}
+
+        Returns
+        -------
+        Dict[str, dict]
+            Status of each member: {"status": "registered"}, {"status": "not_registered"}
+            when no plan was found, or {"status": "error", "error": message}
+        """
+        members = {key: self.add(key) for key in targets}
+
+        def register(key):
+            members[key].register(**targets[key])
+            return {
+                "status": "registered" if members[key].registered else "not_registered"
+            }
+
+        return self._run(register, targets)
+
+    def export(self, keys: Iterable[str] = None, **export_kwargs) -> Dict[str, dict]:
+        """
+        Export members concurrently
+
+        Parameters
+        ----------
+        keys : Iterable[str], optional
+            Keys of the members to export. All members if None
+        **export_kwargs
+            Arguments of Governance.export, e.g. batch_size or incremental.
+            Exports always wait for the assessments, and upload at most
+            member_workers batches at once
+
+        Returns
+        -------
+        Dict[str, dict]
+            Status of each member: {"status": "exported"} when all evidence
+            requirements were fulfilled, {"status": "partial"} when some are
+            missing, {"status": "skipped"} when the member is not registered,
+            has no evidence or, with incremental=True, no changed evidence, or
+            {"status": "error", "error": message} when the export failed or the
+            server did not process the assessment successfully
+        """
+        if export_kwargs.pop("wait", True) is False:
+            global_logger.warning("GovernanceFleet.export always waits for exports")
+        keys = list(self._members) if keys is None else list(keys)
+        max_workers = export_kwargs.get("max_workers", self._member_workers)
+        if max_workers > self._member_workers:
+            global_logger.warning(
+                f"GovernanceFleet members upload at most {self._member_workers} batches at once"
+            )
+        export_kwargs["max_workers"] = min(max_workers, self._member_workers)
+
+        def export(key):
+            member = self._members[key]
+            if not member.validate_export():
+                return {"status": "skipped"}
+            fulfilled = member.export(**export_kwargs)
+            assessment = member.last_assessment
+            if export_kwargs.get("filename"):
+                # file exports create no assessment
+                return {"status": "exported" if fulfilled else "partial"}
+            if assessment is None:
+                if export_kwargs.get("incremental"):
+                    return {"status": "skipped"}
+                return {"status": "error", "error": "No assessment was created"}
+            if assessment["result"] != "success":
+                error = assessment.get("error", f"assessment {assessment['result']}")
+                return {"status": "error", "error": error}
+            return {"status": "exported" if fulfilled else "partial"}
+
+        return self._run(export, keys)
+
+    def close(self):
+        """Shut down the worker pool once running exports are done"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _run(self, fn, keys):
+        """Run fn for each key in the worker pool and collect statuses in key order"""
+
+        def run(key):
+            try:
+                return fn(key)
+            except Exception as error:
+                global_logger.error(f"{fn.__name__} failed for {key}: {error}")
+                return {"status": "error", "error": str(error)}
+
+        futures = {key: self._executor.submit(run, key) for key in keys}
+        return {key: future.result() for key, future in futures.items()}
@@ -3,24 +3,37 @@ Credo Governance
 """
 
 import json
-import sys
-import time
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from functools import partial
 from pprint import pprint
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
-from json_api_doc import deserialize, serialize
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RequestException, Timeout
 
-from connect.evidence import Evidence, EvidenceRequirement
+from connect.evidence import Evidence, EvidenceRequirement, MetricEvidenceBatch
 from connect.utils import (
+    ExportError,
     check_subset,
+    dict_hash,
+    flatten_list,
     get_version,
     global_logger,
-    json_dumps,
+    open_text,
     wrap_list,
 )
+from connect.utils.version_check import validate_version_in_background
 
+from .assessment_writer import write_assessment
 from .credo_api import CredoApi
 from .credo_api_client import CredoApiClient
+from .evidence_index import EvidenceIndex
+from .json_api import deserialize
+from .manifest import EvidenceManifest
+from .plan_cache import AssessmentPlanCache
+from .polling import ExponentialBackoffPolling, PollingStrategy
 
 
 class Governance:
@@ -57,8 +70,17 @@ class Governance:
 
     """
 
+    _api_class = CredoApi
+    _client_class = CredoApiClient
+
     def __init__(
-        self, config_path: str = None, credo_api_client: CredoApiClient = None
+        self,
+        config_path: str = None,
+        credo_api_client: CredoApiClient = None,
+        polling_strategy: PollingStrategy = None,
+        executor: Executor = None,
+        manifest: EvidenceManifest = None,
+        plan_cache: AssessmentPlanCache = None,
     ):
         """Governance object to connect Lens with Credo AI Platform
 
@@ -69,21 +91,51 @@ class Governance:
         credo_api_client : CredoApiClient, optional
             If provided, overrides the API configuration defined by
             the config path, by default None
+        polling_strategy : PollingStrategy, optional
+            Strategy used to wait until the server processed an uploaded assessment.
+            Defaults to ExponentialBackoffPolling
+        executor : concurrent.futures.Executor, optional
+            Executor running the uploads of `export(wait=False)`. A thread pool
+            is created on first use if None
+        manifest : EvidenceManifest, optional
+            Manifest of exported evidences used by `export(incremental=True)`.
+            Defaults to a manifest in the Connect cache directory
+        plan_cache : AssessmentPlanCache, optional
+            If provided, assessment plans registered by URL or use case name are
+            cached on disk, revalidated with ETags once their TTL expired, and used
+            as a fallback when the API server cannot be reached. No cache if None
         """
         self._use_case_id: Optional[str] = None
         self._policy_pack_id: Optional[str] = None
         self._evidence_requirements: List[EvidenceRequirement] = []
-        self._evidences: List[Evidence] = []
+        self._evidences: List[Union[Evidence, MetricEvidenceBatch]] = []
         self._model = None
         self._plan: Optional[dict] = None
+        # last assessment reported by the API server
+        self._assessment: Optional[dict] = None
         self._unique_tags: List[dict] = []
+        # evidence requirement positions grouped by tag set, and the
+        # requirements applying to each tag set already filtered for
+        self._requirement_groups: Dict[str, Tuple[dict, List[int]]] = {}
+        self._requirements_by_tags: Dict[str, List[EvidenceRequirement]] = {}
+        self._polling_strategy = polling_strategy or ExponentialBackoffPolling()
+        self._executor = executor
+        # thread pool created by _submit_export, shut down by close()
+        self._own_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_exports: List[Future] = []
+        # background exports that failed since the last wait_for_exports
+        self._failed_exports: List[Future] = []
+        self._pending_lock = threading.Lock()
+        self._manifest = manifest
+        self._plan_cache = plan_cache
+        validate_version_in_background()
 
         if credo_api_client:
             client = credo_api_client
         else:
-            client = CredoApiClient(config_path=config_path)
+            client = self._client_class(config_path=config_path)
 
-        self._api = CredoApi(client=client)
+        self._api = self._api_class(client=client)
 
     @property
     def model(self):
@@ -93,14 +145,39 @@ class Governance:
     def requirements_satisified(self):
         return self._match_requirements()
 
+    @property
+    def pending_exports(self):
+        """Futures of the exports started with `export(wait=False)` that are not done"""
+        with self._pending_lock:
+            return [f for f in self._pending_exports if not f.done()]
+
+    @property
+    def last_assessment(self):
+        """
+        Assessment reported by the API server for the last upload, None if it
+        created no assessment or is still running in the background
+        """
+        return self._assessment
+
+    def has_evidence(self):
+        """Returns True if evidences were added"""
+        return 0 < self._count_evidences()
+
     @property
     def registered(self):
         return bool(self._plan)
 
-    def add_evidence(self, evidences: Union[Evidence, List[Evidence]]):
+    def add_evidence(
+        self,
+        evidences: Union[
+            Evidence, MetricEvidenceBatch, List[Union[Evidence, MetricEvidenceBatch]]
+        ],
+    ):
         """
-        Add evidences
+        Add evidences, or batches of metric evidences
         """
+        if isinstance(evidences, MetricEvidenceBatch):
+            evidences = [evidences]
         self._evidences += wrap_list(evidences)
 
     def apply_model_changes(self):
@@ -111,64 +188,139 @@ class Governance:
         the tags associated with the local model associated with Governance. If no
         model has been registered on the platform, nothing will be updated.
         """
-        # association between keys and api calls:
-        api_calls = {
-            "tags": self._api.update_use_case_model_link_tags,
-        }
-
-        # find model_link with model name from assessment plan
-        plan_model = self._find_plan_model()
-        if plan_model is None:
-            return
-
-        model_info = self.get_model_info()
-        for key in model_info.keys():
-            api_call = api_calls.get(key, None)
-            if api_call == None:
-                continue
-
-            model_value = model_info[key]
-            plan_model_value = plan_model[key]
-            if model_value != plan_model_value:
-                global_logger.info(
-                    "%s\n%s",
-                    f"Platform model and local model {key} do not match. Platform {key}: {plan_model_value}, Local {key}: {model_value}\n",
-                    f"Updated platform model {key}...",
-                )
-                api_call(self._use_case_id, plan_model["id"], model_value)
-                plan_model[key] = model_value
+        for api_call, plan_model, key, model_value in self._model_changes():
+            api_call(self._use_case_id, plan_model["id"], model_value)
+            plan_model[key] = model_value
 
     def clear_evidence(self):
         self.set_evidence([])
 
-    def export(self, filename=None):
+    def export(
+        self,
+        filename=None,
+        batch_size: int = None,
+        max_workers: int = 4,
+        wait: bool = True,
+        compact: bool = False,
+        incremental: bool = False,
+    ):
         """
         Upload evidences to CredoAI Governance(Report) App
 
+        Parameters
+        ----------
+        filename : str, optional
+            If provided, evidences are saved to this file instead of being uploaded.
+            The file is gzipped if its name ends with .gz, e.g. assessment.json.gz
+        batch_size : int, optional
+            If provided, evidences are uploaded in batches of at most `batch_size`
+            evidences, each batch creating its own assessment. The results of all
+            batches are combined into one report. By default, all evidences are
+            uploaded in a single request
+        max_workers : int, optional
+            Maximum number of batches uploaded concurrently, by default 4.
+            Only used when `batch_size` is provided
+        wait : bool, optional
+            If False, the upload payload is prepared and the upload and polling run in a
+            background thread. A concurrent.futures.Future is returned right away, which
+            resolves to the final assessment. It can be polled with `done()`, awaited
+            with `asyncio.wrap_future` or given callbacks with `add_done_callback`.
+            Outstanding exports are listed by `pending_exports`. Only applies to uploads,
+            by default True
+        compact : bool, optional
+            If True, the file is written without indentation. Only applies when
+            `filename` is provided, by default False
+        incremental : bool, optional
+            If True, only evidences that are new or changed since the last successful
+            incremental export of the same use case, policy pack and model are uploaded,
+            and nothing is uploaded if no evidence changed. Content hashes of exported
+            evidences are kept in the Governance manifest. Only applies to uploads,
+            by default False
+
         Returns
         -------
         True
             When uploading is successful with all evidence
         False
             When it is not registered yet, or evidence is insufficient
+        concurrent.futures.Future
+            When `wait` is False and the upload was started
         """
-        if not self._validate_export():
+        if not self.validate_export():
             return False
         to_return = self._match_requirements()
 
         if filename is None:
-            self._api_export()
+            self._assessment = None
+            future = self._api_export(batch_size, max_workers, wait, incremental)
+            if not wait:
+                self._log_export_status(to_return)
+                return future
         else:
-            self._file_export(filename)
+            self._file_export(filename, compact)
 
-        if to_return:
-            export_status = "All requirements were matched."
-        else:
-            export_status = "Partial match of requirements."
-
-        global_logger.info(export_status)
+        self._log_export_status(to_return)
         return to_return
 
+    def wait_for_exports(self, timeout: float = None):
+        """
+        Wait until the exports started with `export(wait=False)` are done
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. Waits without limit if None
+
+        Returns
+        -------
+        List[dict]
+            Final assessment of each export that is done
+
+        Raises
+        ------
+        ExportError
+            If exports failed since the last call, once all the others are done.
+            The exceptions of the failed exports are listed in its `errors`
+        """
+        done, _ = wait_futures(self.pending_exports, timeout=timeout)
+        with self._pending_lock:
+            for future in done:
+                if future in self._pending_exports:
+                    self._pending_exports.remove(future)
+            failed, self._failed_exports = self._failed_exports, []
+        errors = [future.exception() for future in failed]
+        assessments = []
+        for future in done:
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is None:
+                assessments.append(future.result())
+            else:
+                errors.append(error)
+        if errors:
+            raise ExportError(errors)
+        return assessments
+
+    def close(self):
+        """
+        Wait for the exports started with `export(wait=False)`, then shut down
+        the thread pool created to run them. An executor passed to Governance
+        is not shut down
+        """
+        wait_futures(self.pending_exports)
+        if self._own_executor is not None:
+            self._own_executor.shutdown(wait=True)
+            if self._executor is self._own_executor:
+                self._executor = None
+            self._own_executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def get_evidence(self, verbose=False):
         """
         Returns evidence that has been send to the governance object
@@ -179,7 +331,7 @@ class Governance:
             if True, print out human-readable evidence requirements
         """
         if verbose:
-            self._print_evidence(self._evidences)
+            self._print_evidence(self._iter_evidences())
         return self._evidences
 
     def get_evidence_requirements(self, tags: dict = None, verbose=False):
@@ -211,7 +363,7 @@ class Governance:
         if tags is None:
             tags = self.get_model_info()["tags"]
 
-        reqs = [e for e in self._evidence_requirements if check_subset(e.tags, tags)]
+        reqs = list(self._filter_requirements(tags))
         if verbose:
             self._print_evidence(reqs)
         return reqs
@@ -244,7 +396,8 @@ class Governance:
         assessment_plan : str
             assessment plan JSON string
         assessment_plan_file : str
-            assessment plan file name that holds assessment plan JSON string
+            assessment plan file name that holds assessment plan JSON string.
+            Files ending with .gz are decompressed
 
         Examples
         --------
@@ -274,49 +427,14 @@ class Governance:
         self._plan = None
 
         plan = None
-        if use_case_name:
-            assessment_plan_url = self._api.get_assessment_plan_url(
-                use_case_name, policy_pack_key
-            )
-
-        if assessment_plan_url:
-            plan = self._api.get_assessment_plan(assessment_plan_url)
-
-        if assessment_plan:
-            plan = self.__parse_json_api(assessment_plan)
-
-        if assessment_plan_file:
-            with open(assessment_plan_file, "r") as f:
-                json_str = f.read()
-                plan = self.__parse_json_api(json_str)
-
-        if plan:
-            self._plan = plan
-            self._use_case_id = plan.get("use_case_id")
-            self._policy_pack_id = plan.get("policy_pack_id")
-            self._evidence_requirements = list(
-                map(
-                    lambda d: EvidenceRequirement(d),
-                    plan.get("evidence_requirements", []),
-                )
-            )
-
-            # Extract unique tags
-            for x in self._evidence_requirements:
-                if x.tags not in self._unique_tags:
-                    self._unique_tags.append(x.tags)
-            self._unique_tags = [x for x in self._unique_tags if x]
-
-            global_logger.info(
-                f"Successfully registered with {len(self._evidence_requirements)} evidence requirements"
-            )
+        if use_case_name or assessment_plan_url:
+            plan = self._fetch_plan(assessment_plan_url, use_case_name, policy_pack_key)
 
-            if self._unique_tags:
-                global_logger.info(
-                    f"The following tags have being found in the evidence requirements: {self._unique_tags}"
-                )
+        local_plan = self._read_plan(assessment_plan, assessment_plan_file)
+        if local_plan is not None:
+            plan = local_plan
 
-            self.clear_evidence()
+        self._set_plan(plan)
 
     def set_artifacts(
         self,
@@ -361,7 +479,7 @@ class Governance:
 
         self._print_model_changes_log()
 
-    def set_evidence(self, evidences: List[Evidence]):
+    def set_evidence(self, evidences: List[Union[Evidence, MetricEvidenceBatch]]):
         """
         Update evidences
         """
@@ -384,33 +502,112 @@ class Governance:
         if self._model:
             self._model["tags"] = selected_tag
 
-    def _api_export(self):
-        global_logger.info(
-            f"Uploading {len(self._evidences)} evidences.. for use_case_id={self._use_case_id} policy_pack_id={self._policy_pack_id}"
-        )
-
+    def _api_export(self, batch_size=None, max_workers=4, wait=True, incremental=False):
         # update when model tags are changed
         self.apply_model_changes()
 
-        assessment = self._api.create_assessment(
-            self._use_case_id, self._prepare_export_data()
-        )
+        # payloads are prepared up front so that evidence changes made while
+        # a background export runs do not affect it
+        evidences, manifest_entries = self._select_evidences(incremental)
+        if not evidences:
+            global_logger.info(
+                "No evidence changed since the last export, nothing was uploaded"
+            )
+            return self._skipped_export(wait)
+
+        self._log_upload_start(len(evidences))
+        if batch_size:
+            batches = self._prepare_batches(evidences, batch_size)
+            upload = partial(self._batched_upload, batches, max_workers)
+        else:
+            upload = partial(self._upload, self._prepare_export_data(evidences))
+
+        if not wait:
+            return self._submit_export(upload, manifest_entries)
+        return self._run_export(upload, manifest_entries)
+
+    def _batched_upload(self, batches, max_workers):
+        """Upload batches concurrently and merge the resulting assessments"""
+
+        def upload_batch(data):
+            try:
+                return self._upload(data)
+            except RequestException as error:
+                # a failed batch, e.g. after a timeout, does not lose the others
+                return {"result": "error", "error": str(error)}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            assessments = list(executor.map(upload_batch, batches))
+
+        return self._merge_assessments(assessments)
+
+    def _run_export(self, upload, manifest_entries=None):
+        assessment = upload()
+        self._report_assessment(assessment)
+        self._record_exported(assessment, manifest_entries)
+        return assessment
+
+    def _record_exported(self, assessment, manifest_entries):
+        """Record uploaded evidences in the manifest if the upload succeeded"""
+        if manifest_entries and assessment and assessment["result"] == "success":
+            self._get_manifest().record(self._manifest_scope(), manifest_entries)
+
+    def _skipped_export(self, wait):
+        if wait:
+            return None
+        future = Future()
+        future.set_result(None)
+        return future
+
+    def _submit_export(self, upload, manifest_entries=None):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="connect-export")
+            self._own_executor = self._executor
+
+        future = self._executor.submit(self._run_export, upload, manifest_entries)
+        with self._pending_lock:
+            self._pending_exports.append(future)
+        future.add_done_callback(self._remove_pending_export)
+        return future
+
+    def _remove_pending_export(self, future):
+        with self._pending_lock:
+            if future in self._pending_exports:
+                self._pending_exports.remove(future)
+                # kept until wait_for_exports reports it
+                if not future.cancelled() and future.exception() is not None:
+                    self._failed_exports.append(future)
+
+    def _upload(self, data):
+        """Create an assessment with data and wait until the server processed it"""
+        assessment = self._api.create_assessment(self._use_case_id, data)
 
         if assessment:
             # wait until uploading is finished
-            progress = 1
-            while assessment["result"] == "in_progress":
-                time.sleep(1)
-                sys.stdout.write("\r")
-                sys.stdout.write("." * progress)
-                sys.stdout.flush()
-                progress = progress + 1
-                assessment = self._api.get_assessment(
+            assessment = self._polling_strategy.wait(
+                lambda: self._api.get_assessment_with_headers(
                     self._use_case_id, assessment["id"]
-                )
+                ),
+                assessment,
+            )
+
+        return assessment
 
-            sys.stdout.write("\r")
+    def _log_export_status(self, requirements_matched):
+        if requirements_matched:
+            export_status = "All requirements were matched."
+        else:
+            export_status = "Partial match of requirements."
 
+        global_logger.info(export_status)
+
+    def _log_upload_start(self, n_evidences):
+        global_logger.info(
+            f"Uploading {n_evidences} evidences.. for use_case_id={self._use_case_id} policy_pack_id={self._policy_pack_id}"
+        )
+
+    def _report_assessment(self, assessment):
+        if assessment:
             # print the result
             self._assessment = assessment
             if assessment["result"] == "success":
@@ -419,10 +616,71 @@ class Governance:
                 global_logger.info(
                     f"{len(evidences)} evidences were successfuly uploaded, took {duration} ms"
                 )
+            elif assessment["result"] == "in_progress":
+                global_logger.warning(
+                    f"Evidences are still being processed by the server, assessment id={assessment.get('id')}"
+                )
             else:
                 error = assessment["error"]
                 global_logger.error(f"Error in uploading evidences : {error}")
 
+    @staticmethod
+    def _merge_assessments(assessments):
+        """Combine the assessments of batched uploads into a single report"""
+        assessments = [
+            a or {"result": "error", "error": "No assessment was created"}
+            for a in assessments
+        ]
+        succeeded = [a for a in assessments if a["result"] == "success"]
+        failed = [(i, a) for i, a in enumerate(assessments) if a["result"] != "success"]
+        evidences = flatten_list(
+            a.get("details", {}).get("evidences", []) for a in succeeded
+        )
+        merged = {
+            "ids": [a.get("id") for a in assessments],
+            "result": "error" if failed else "success",
+            "details": {"evidences": evidences},
+            # batches are uploaded concurrently, so the slowest one sets the duration
+            "duration": max((a.get("duration", 0) for a in assessments), default=0),
+            "batches": assessments,
+        }
+        if failed:
+            merged["error"] = "; ".join(
+                f"batch {i}: {a.get('error', a['result'])}" for i, a in failed
+            )
+            global_logger.info(
+                f"{len(succeeded)} of {len(assessments)} batches were successfuly uploaded"
+            )
+        return merged
+
+    def _model_changes(self):
+        """Yield the api call, plan model, key and local value of each model change to apply"""
+        # association between keys and api calls:
+        api_calls = {
+            "tags": self._api.update_use_case_model_link_tags,
+        }
+
+        # find model_link with model name from assessment plan
+        plan_model = self._find_plan_model()
+        if plan_model is None:
+            return
+
+        model_info = self.get_model_info()
+        for key in model_info.keys():
+            api_call = api_calls.get(key, None)
+            if api_call == None:
+                continue
+
+            model_value = model_info[key]
+            plan_model_value = plan_model[key]
+            if model_value != plan_model_value:
+                global_logger.info(
+                    "%s\n%s",
+                    f"Platform model and local model {key} do not match. Platform {key}: {plan_model_value}, Local {key}: {model_value}\n",
+                    f"Updated platform model {key}...",
+                )
+                yield api_call, plan_model, key, model_value
+
     def _print_model_changes_log(self):
         # find model_link with model name from assessment plan
         plan_model = self._find_plan_model()
@@ -452,11 +710,8 @@ class Governance:
                         """
                     )
 
-    def _check_inclusion(self, label, evidence):
-        matching_evidence = []
-        for e in evidence:
-            if check_subset(label, e.label):
-                matching_evidence.append(e)
+    def _check_inclusion(self, label, evidence_index):
+        matching_evidence = evidence_index.match(label)
         if not matching_evidence:
             global_logger.info(f"Missing required evidence with label ({label}).")
             return False
@@ -471,15 +726,47 @@ class Governance:
             return False
         return matching_evidence
 
-    def _file_export(self, filename):
+    def _fetch_plan(self, assessment_plan_url, use_case_name, policy_pack_key):
+        """Get the assessment plan from the API server, through the plan cache if any"""
+        if self._plan_cache is None:
+            if use_case_name:
+                assessment_plan_url = self._api.get_assessment_plan_url(
+                    use_case_name, policy_pack_key
+                )
+            if assessment_plan_url:
+                return self._api.get_assessment_plan(assessment_plan_url)
+            return None
+
+        key = self._plan_cache_key(assessment_plan_url, use_case_name, policy_pack_key)
+        entry = self._plan_cache.get(key)
+        if entry and self._plan_cache.is_fresh(entry):
+            return entry["plan"]
+
+        try:
+            if use_case_name:
+                assessment_plan_url = self._api.get_assessment_plan_url(
+                    use_case_name, policy_pack_key
+                )
+            if not assessment_plan_url:
+                return None
+            plan, etag = self._api.get_assessment_plan_if_modified(
+                assessment_plan_url, self._cached_plan_etag(entry, assessment_plan_url)
+            )
+        except (RequestsConnectionError, Timeout) as error:
+            return self._offline_plan(entry, error)
+        return self._store_plan(key, entry, assessment_plan_url, plan, etag)
+
+    def _file_export(self, filename, compact=False):
         global_logger.info(
-            f"Saving {len(self._evidences)} evidences to {filename}.. for use_case_id={self._use_case_id} policy_pack_id={self._policy_pack_id} "
+            f"Saving {self._count_evidences()} evidences to {filename}.. for use_case_id={self._use_case_id} policy_pack_id={self._policy_pack_id} "
         )
-        data = self._prepare_export_data()
+        # evidences are serialized one at a time while the file is written, and
+        # their structures are not cached, so each can be freed once written
+        evidences = self._evidence_structs(cache=False)
+        data = self._prepare_export_data(evidences)
         meta = {"client": "Credo AI Connect", "version": get_version()}
-        data = json_dumps(serialize(data=data, meta=meta))
-        with open(filename, "w") as f:
-            f.write(data)
+        with open_text(filename, "w") as f:
+            write_assessment(f, data, meta, compact)
 
     def _find_plan_model(self):
         """Return model from assessment plan who matches name of associated model"""
@@ -496,6 +783,11 @@ class Governance:
 
         return None
 
+    def _get_manifest(self):
+        if self._manifest is None:
+            self._manifest = EvidenceManifest()
+        return self._manifest
+
     def _get_model_info(self, model):
         """Get the tags and version for a model"""
         if model:
@@ -509,19 +801,75 @@ class Governance:
     def _match_requirements(self):
         missing = []
         required_labels = [e.label for e in self.get_evidence_requirements()]
+        evidence_index = EvidenceIndex(self._iter_evidences())
         for label in required_labels:
-            matching_evidence = self._check_inclusion(label, self._evidences)
+            matching_evidence = self._check_inclusion(label, evidence_index)
             if not matching_evidence:
                 missing.append(label)
             else:
-                matching_evidence[0].label = label
+                evidence_index.relabel(matching_evidence[0], label)
         return not bool(missing)
 
+    def _manifest_scope(self):
+        return {
+            "use_case_id": self._use_case_id,
+            "policy_pack_id": self._policy_pack_id,
+            "model": self._model,
+        }
+
     def __parse_json_api(self, json_str):
         return deserialize(json.loads(json_str))
 
-    def _prepare_export_data(self):
-        evidences = self._prepare_evidences()
+    def _plan_cache_key(self, assessment_plan_url, use_case_name, policy_pack_key):
+        # use case names and plan URLs are only unique within a tenant and server
+        config = self._api._client._config
+        key = {"tenant": config.tenant, "api_server": config.api_server}
+        if use_case_name:
+            return {
+                **key,
+                "use_case_name": use_case_name,
+                "policy_pack_key": policy_pack_key,
+            }
+        return {**key, "url": assessment_plan_url}
+
+    def _cached_plan_etag(self, entry, assessment_plan_url):
+        """ETag of the cached plan, if it was fetched from the same URL"""
+        if entry and entry["url"] == assessment_plan_url:
+            return entry["etag"]
+        return None
+
+    def _offline_plan(self, entry, error):
+        if entry is None:
+            raise error
+        global_logger.warning(
+            f"Cannot reach the API server ({error}), using the assessment plan cached from {entry['url']}"
+        )
+        return entry["plan"]
+
+    def _store_plan(self, key, entry, assessment_plan_url, plan, etag):
+        """Update the plan cache after a conditional request and return the plan"""
+        if plan is None:
+            if entry is None or entry["url"] != assessment_plan_url:
+                return None
+            # 304 Not Modified
+            return self._plan_cache.touch(key, entry)["plan"]
+        self._plan_cache.put(key, assessment_plan_url, plan, etag)
+        return plan
+
+    def _prepare_batches(self, evidences, batch_size):
+        """Split evidences into export payloads of at most batch_size evidences"""
+        batches = [
+            self._prepare_export_data(evidences[i : i + batch_size])
+            for i in range(0, len(evidences), batch_size)
+        ]
+        global_logger.info(
+            f"Uploading in {len(batches)} batches of up to {batch_size} evidences"
+        )
+        return batches
+
+    def _prepare_export_data(self, evidences=None):
+        if evidences is None:
+            evidences = self._prepare_evidences()
         data = {
             "policy_pack_id": self._policy_pack_id,
             "models": [self._model] if self._model else None,
@@ -531,20 +879,141 @@ class Governance:
         return data
 
     def _prepare_evidences(self):
-        evidences = list(map(lambda e: e.struct(), self._evidences))
+        evidences = list(self._evidence_structs())
         return evidences
 
+    def _iter_evidences(self):
+        """Iterate over evidences, and over the rows of metric evidence batches"""
+        for evidence in self._evidences:
+            if isinstance(evidence, MetricEvidenceBatch):
+                yield from evidence
+            else:
+                yield evidence
+
+    def _evidence_structs(self, cache=True):
+        """
+        Iterate over evidence structures, built in bulk for batches
+
+        If cache is False, structures are not kept by the evidences, see
+        Evidence.struct
+        """
+        for evidence in self._evidences:
+            if isinstance(evidence, MetricEvidenceBatch):
+                yield from evidence.structs()
+            else:
+                yield evidence.struct(cache=cache)
+
+    def _count_evidences(self):
+        return sum(
+            len(e) if isinstance(e, MetricEvidenceBatch) else 1 for e in self._evidences
+        )
+
     def _print_evidence(self, evidence):
         for i, label in enumerate([e.label for e in evidence]):
             print(f"\nEvidence Requirement {i}:")
             pprint(label)
 
-    def _validate_export(self):
+    def _read_plan(self, assessment_plan=None, assessment_plan_file=None):
+        """Parse an assessment plan from a JSON string or file, if provided"""
+        plan = None
+        if assessment_plan:
+            plan = self.__parse_json_api(assessment_plan)
+
+        if assessment_plan_file:
+            with open_text(assessment_plan_file, "r") as f:
+                json_str = f.read()
+                plan = self.__parse_json_api(json_str)
+        return plan
+
+    def _select_evidences(self, incremental=False):
+        """
+        Returns evidence structures to upload and, for incremental exports,
+        the manifest entries to record once they were uploaded
+        """
+        evidences = self._prepare_evidences()
+        if not incremental:
+            return evidences, None
+        changed, entries = self._get_manifest().select_changed(
+            self._manifest_scope(), evidences
+        )
+        if len(changed) < len(evidences):
+            global_logger.info(
+                f"{len(evidences) - len(changed)} evidences did not change since the last export"
+            )
+        return changed, entries
+
+    def _set_plan(self, plan):
+        """Register an assessment plan and extract its evidence requirements"""
+        if not plan:
+            return
+
+        self._plan = plan
+        self._use_case_id = plan.get("use_case_id")
+        self._policy_pack_id = plan.get("policy_pack_id")
+        self._evidence_requirements = list(
+            map(
+                lambda d: EvidenceRequirement(d),
+                plan.get("evidence_requirements", []),
+            )
+        )
+
+        self._group_requirements()
+
+        # Extract unique tags
+        for tags, _ in self._requirement_groups.values():
+            if tags not in self._unique_tags:
+                self._unique_tags.append(tags)
+        self._unique_tags = [x for x in self._unique_tags if x]
+
+        global_logger.info(
+            f"Successfully registered with {len(self._evidence_requirements)} evidence requirements"
+        )
+
+        if self._unique_tags:
+            global_logger.info(
+                f"The following tags have being found in the evidence requirements: {self._unique_tags}"
+            )
+
+        self.clear_evidence()
+
+    def _group_requirements(self):
+        """Group evidence requirements by tag set, and reset filtered requirements"""
+        self._requirement_groups = {}
+        self._requirements_by_tags = {}
+        for position, requirement in enumerate(self._evidence_requirements):
+            key = dict_hash(requirement.tags)
+            if key not in self._requirement_groups:
+                self._requirement_groups[key] = (requirement.tags, [])
+            self._requirement_groups[key][1].append(position)
+
+    def _filter_requirements(self, tags):
+        """
+        Returns the evidence requirements whose tags are a subset of tags
+
+        Tags are checked once per distinct tag set of the requirements, and the
+        result is kept until another plan is registered.
+        """
+        key = dict_hash(tags)
+        if key not in self._requirements_by_tags:
+            positions = []
+            for requirement_tags, group in self._requirement_groups.values():
+                if check_subset(requirement_tags, tags):
+                    positions += group
+            self._requirements_by_tags[key] = [
+                self._evidence_requirements[position] for position in sorted(positions)
+            ]
+        return self._requirements_by_tags[key]
+
+    def validate_export(self):
+        """
+        Returns True if evidences can be exported: Governance is registered
+        and has evidence. Otherwise, the reason is logged and False is returned
+        """
         if not self.registered:
             global_logger.info("Governance is not registered, please register first")
             return False
 
-        if 0 == len(self._evidences):
+        if not self.has_evidence():
             global_logger.info(
                 "No evidences added to governance, please add evidences first"
             )
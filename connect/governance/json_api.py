@@ -0,0 +1,128 @@
+"""
+Fast JSON:API conversion of the documents exchanged with the Credo API
+
+`serialize` and `deserialize` give the same results as their json_api_doc
+counterparts. The documents Connect handles have a known shape: one resource
+whose attributes are plain values (assessments, model links), and responses
+without included resources (assessment plans, use cases, policy packs).
+Those are converted directly, without the per-value dispatch of json_api_doc.
+Any other document is passed to json_api_doc.
+"""
+
+from typing import Union
+
+import json_api_doc
+
+# keys of a resource object that json_api_doc removes while flattening it
+_RESOURCE_MEMBERS = frozenset(("links", "attributes", "relationships"))
+
+
+def serialize(data: dict, meta: dict = None) -> dict:
+    """
+    Returns the JSON:API document of a resource, like `json_api_doc.serialize`
+
+    Parameters
+    ----------
+    data : dict
+        The resource, with its type under "$type" and optionally its "id"
+    meta : dict, optional
+        JSON:API meta of the document
+    """
+    resource = _serialize_plain_resource(data)
+    if resource is None:
+        return json_api_doc.serialize(data=data, meta=meta or {})
+    document = {"data": resource}
+    if meta:
+        document["meta"] = meta
+    return document
+
+
+def deserialize(content: dict) -> Union[dict, list, None]:
+    """
+    Returns the resources of a JSON:API document, like `json_api_doc.deserialize`
+
+    Unlike json_api_doc, content is not copied first: the result shares its
+    nested values with content, which must not be modified afterwards.
+    """
+    if "errors" in content or "included" in content or "data" not in content:
+        return json_api_doc.deserialize(content)
+    data = content["data"]
+    if isinstance(data, dict):
+        flat = _flat(data)
+        return flat if flat is not None else json_api_doc.deserialize(content)
+    elif isinstance(data, list):
+        result = []
+        for obj in data:
+            flat = _flat(obj) if isinstance(obj, dict) else None
+            if flat is None:
+                return json_api_doc.deserialize(content)
+            result.append(flat)
+        return result
+    return None
+
+
+def _serialize_plain_resource(data):
+    """
+    JSON:API resource object of data, or None if data is not a single
+    resource whose attributes are plain values
+    """
+    if not isinstance(data, dict) or data.get("$type") is None:
+        return None
+    attributes = {}
+    relationships = {}
+    for key, value in data.items():
+        if key == "$type" or key == "id":
+            continue
+        if isinstance(value, dict):
+            if _is_resource(value):
+                return None
+        elif isinstance(value, list):
+            if not value:
+                # json_api_doc treats empty lists as empty relationships
+                relationships[key] = {"data": []}
+                continue
+            if any(_is_resource(item) for item in value):
+                return None
+            value = list(value)
+        attributes[key] = value
+    resource = {}
+    if attributes:
+        resource["attributes"] = attributes
+    if relationships:
+        resource["relationships"] = relationships
+    resource["type"] = data["$type"]
+    if data.get("id") is not None:
+        resource["id"] = data["id"]
+    return resource
+
+
+def _is_resource(value):
+    return (
+        isinstance(value, dict)
+        and value.get("$type") is not None
+        and value.get("id") is not None
+    )
+
+
+def _flat(obj):
+    """
+    Flattened resource object, or None if it needs the resolution of
+    json_api_doc
+    """
+    attributes = obj.get("attributes") or {}
+    if not _RESOURCE_MEMBERS.isdisjoint(attributes):
+        return None
+    flat = {key: value for key, value in obj.items() if key not in _RESOURCE_MEMBERS}
+    flat.update(attributes)
+    for relationship, item in obj.get("relationships", {}).items():
+        data = item.get("data")
+        if data is not None:
+            flat[relationship] = data
+        elif item.get("links"):
+            flat[relationship] = item
+        else:
+            flat[relationship] = None
+    if flat.keys() == {"type", "id"} or flat.keys() == {"type", "id", "meta"}:
+        # a bare resource identifier, which json_api_doc resolves
+        return None
+    return flat
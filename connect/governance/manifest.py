@@ -0,0 +1,100 @@
+"""
+Local manifest of exported evidences, used for incremental exports
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from connect.utils import atomic_write_json, dict_hash, file_lock, get_cache_dir
+
+# evidence fields that change on every run without changing the evidence
+VOLATILE_FIELDS = ("generated_at",)
+
+
+class EvidenceManifest:
+    """Record of the content hash of every evidence exported
+
+    The manifest is a JSON file mapping an export scope (use case, policy pack
+    and model) to the content hash of each evidence, keyed by the hash of the
+    evidence label. It lets Governance upload only evidences that are new or
+    changed since the last successful export.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the manifest file. Defaults to evidence_manifest.json in the
+        Connect cache directory, see `connect.utils.get_cache_dir`
+    """
+
+    def __init__(self, path: str = None):
+        self.path = Path(path) if path else get_cache_dir() / "evidence_manifest.json"
+
+    def select_changed(
+        self, scope: dict, evidences: List[dict]
+    ) -> Tuple[List[dict], Dict[str, str]]:
+        """
+        Returns the evidences whose content differs from the last recorded export
+
+        Parameters
+        ----------
+        scope : dict
+            Identifies the export, e.g. use case id, policy pack id and model
+        evidences : List[dict]
+            Evidence structures, as returned by Evidence.struct()
+
+        Returns
+        -------
+        tuple
+            the new or changed evidences, and their manifest entries to pass
+            to `record` once they were exported
+        """
+        recorded = self._load().get(self._scope_key(scope), {})
+        changed = []
+        entries = {}
+        for evidence in evidences:
+            label_hash, content_hash = self._hash(evidence)
+            if recorded.get(label_hash) != content_hash:
+                changed.append(evidence)
+                entries[label_hash] = content_hash
+        return changed, entries
+
+    def record(self, scope: dict, entries: Dict[str, str]):
+        """
+        Record manifest entries of successfully exported evidences
+        """
+        # concurrent exports of one process or of several share the manifest
+        with file_lock(self.path):
+            manifest = self._load()
+            manifest.setdefault(self._scope_key(scope), {}).update(entries)
+            atomic_write_json(self.path, manifest)
+
+    def clear(self, scope: dict = None):
+        """
+        Forget recorded evidences of a scope, or of all scopes if scope is None
+        """
+        with file_lock(self.path):
+            if not self.path.exists():
+                return
+            if scope is None:
+                manifest = {}
+            else:
+                manifest = self._load()
+                manifest.pop(self._scope_key(scope), None)
+            atomic_write_json(self.path, manifest)
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _hash(evidence):
+        content = {k: v for k, v in evidence.items() if k not in VOLATILE_FIELDS}
+        return dict_hash(evidence["label"]), dict_hash(content)
+
+    @staticmethod
+    def _scope_key(scope):
+        return dict_hash(scope)
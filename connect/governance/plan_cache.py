@@ -0,0 +1,70 @@
+"""
+On-disk cache of assessment plans
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from connect.utils import atomic_write_json, dict_hash, get_cache_dir
+
+
+class AssessmentPlanCache:
+    """Cache of assessment plans kept in a directory
+
+    Each plan is stored with the URL it was fetched from, its ETag and the time
+    it was last validated against the API server. Within `ttl` seconds a
+    cached plan is used without any request. After that, Governance revalidates
+    it with a conditional request, which costs a 304 response when the plan
+    did not change. When the API server cannot be reached, cached plans are
+    used regardless of their age.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Directory of the cache. Defaults to assessment_plans in the Connect
+        cache directory, see `connect.utils.get_cache_dir`
+    ttl : float, optional
+        Seconds during which a cached plan is used without revalidation,
+        by default 3600
+    """
+
+    def __init__(self, cache_dir: str = None, ttl: float = 3600):
+        self.cache_dir = (
+            Path(cache_dir) if cache_dir else get_cache_dir() / "assessment_plans"
+        )
+        self.ttl = ttl
+
+    def get(self, key: dict) -> Optional[dict]:
+        """
+        Returns the cache entry of key, a dict with url, etag, plan and
+        validated_at, or None if the plan is not cached
+        """
+        try:
+            with open(self._path(key), "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Whether entry was validated less than ttl seconds ago"""
+        return time.time() - entry["validated_at"] < self.ttl
+
+    def put(self, key: dict, url: str, plan: dict, etag: str = None):
+        """Store a plan fetched from url"""
+        entry = {"url": url, "etag": etag, "plan": plan, "validated_at": time.time()}
+        self._write(key, entry)
+        return entry
+
+    def touch(self, key: dict, entry: dict):
+        """Mark entry as validated now, e.g. after a 304 Not Modified response"""
+        entry = {**entry, "validated_at": time.time()}
+        self._write(key, entry)
+        return entry
+
+    def _path(self, key):
+        return self.cache_dir / f"{dict_hash(key)}.json"
+
+    def _write(self, key, entry):
+        atomic_write_json(self._path(key), entry)
@@ -0,0 +1,215 @@
+"""
+Strategies to wait until the server finished processing an assessment
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Optional
+
+from connect.utils import global_logger
+
+from .transport import TransportPolicy
+
+# assessment attributes through which the server can ask for a polling interval,
+# when the status response has no Retry-After header
+SERVER_HINTS = ("poll_interval", "retry_after")
+
+
+class PollingStrategy(ABC):
+    """Abstract class defining how assessment progress is polled
+
+    A strategy decides how long to wait before each `get_assessment` request.
+    An interval suggested by the server takes precedence over the strategy's
+    own interval: first the Retry-After header of the last status response,
+    then the `poll_interval` or `retry_after` attribute of the assessment.
+
+    Parameters
+    ----------
+    timeout : float, optional
+        Overall deadline in seconds. Once it has passed, polling stops and the
+        assessment is returned while still in progress. No deadline if None
+    sleep : callable, optional
+        Function used to wait, by default time.sleep
+    clock : callable, optional
+        Monotonic clock used to enforce the deadline, by default time.monotonic
+    async_sleep : callable, optional
+        Coroutine function used to wait by `async_wait`, by default asyncio.sleep
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        async_sleep: Callable[[float], Awaitable] = asyncio.sleep,
+    ):
+        self.timeout = timeout
+        self.sleep = sleep
+        self.clock = clock
+        self.async_sleep = async_sleep
+
+    @abstractmethod
+    def interval(self, attempt: int) -> float:
+        """Seconds to wait before the status request number `attempt` (from 0)"""
+        pass
+
+    def next_delay(self, attempt: int, assessment: dict, elapsed: float, headers=None):
+        """
+        Returns seconds to wait before the next status request,
+        or None if the deadline has passed
+
+        headers are the headers of the last status response, if known
+        """
+        delay = self._server_hint(assessment, headers)
+        if delay is None:
+            delay = self.interval(attempt)
+
+        if self.timeout is not None:
+            remaining = self.timeout - elapsed
+            if remaining <= 0:
+                return None
+            delay = min(delay, remaining)
+        return delay
+
+    def wait(self, get_assessment: Callable[[], dict], assessment: dict):
+        """
+        Poll get_assessment until the assessment is no longer in progress
+
+        Parameters
+        ----------
+        get_assessment : callable
+            Function returning the current state of the assessment, or a tuple
+            of the assessment and the headers of the response
+        assessment : dict
+            Assessment returned when it was created
+
+        Returns
+        -------
+        dict
+            The last assessment received
+        """
+        start = self.clock()
+        attempt = 0
+        headers = None
+        while assessment["result"] == "in_progress":
+            delay = self.next_delay(attempt, assessment, self.clock() - start, headers)
+            if delay is None:
+                self._log_timeout(assessment)
+                break
+            self.sleep(delay)
+            assessment, headers = _split_headers(get_assessment())
+            attempt += 1
+            self._log_progress(assessment, attempt)
+        return assessment
+
+    async def async_wait(self, get_assessment, assessment: dict):
+        """
+        Asynchronous version of `wait`, get_assessment is a coroutine function
+        and waiting with `async_sleep` does not block the event loop
+        """
+        start = self.clock()
+        attempt = 0
+        headers = None
+        while assessment["result"] == "in_progress":
+            delay = self.next_delay(attempt, assessment, self.clock() - start, headers)
+            if delay is None:
+                self._log_timeout(assessment)
+                break
+            await self.async_sleep(delay)
+            assessment, headers = _split_headers(await get_assessment())
+            attempt += 1
+            self._log_progress(assessment, attempt)
+        return assessment
+
+    def _log_progress(self, assessment, attempt):
+        global_logger.debug(
+            f"Assessment {assessment.get('id')} is {assessment['result']} after {attempt} status requests"
+        )
+
+    def _log_timeout(self, assessment):
+        global_logger.warning(
+            f"Assessment {assessment.get('id')} is still in progress after {self.timeout} seconds"
+        )
+
+    @staticmethod
+    def _server_hint(assessment, headers=None):
+        if headers:
+            retry_after = TransportPolicy.retry_after(headers)
+            if retry_after is not None:
+                return max(retry_after, 0)
+        for key in SERVER_HINTS:
+            hint = assessment.get(key)
+            if hint is not None:
+                try:
+                    return max(float(hint), 0)
+                except (TypeError, ValueError):
+                    continue
+        return None
+
+
+def _split_headers(response):
+    """The assessment and response headers returned by a get_assessment function"""
+    if isinstance(response, tuple):
+        return response
+    return response, None
+
+
+class ExponentialBackoffPolling(PollingStrategy):
+    """Polling whose interval grows exponentially up to a cap
+
+    Parameters
+    ----------
+    initial_interval : float
+        Seconds to wait before the first status request, by default 0.25
+    multiplier : float
+        Factor applied to the interval after each status request, by default 2
+    max_interval : float
+        Maximum seconds between two status requests, by default 10
+    timeout : float, optional
+        Overall deadline in seconds, see PollingStrategy
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 0.25,
+        multiplier: float = 2.0,
+        max_interval: float = 10.0,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ):
+        super().__init__(timeout, **kwargs)
+        self.initial_interval = initial_interval
+        self.multiplier = multiplier
+        self.max_interval = max_interval
+
+    def interval(self, attempt):
+        try:
+            interval = self.initial_interval * self.multiplier**attempt
+        except OverflowError:
+            return self.max_interval
+        return min(interval, self.max_interval)
+
+
+class FixedIntervalPolling(PollingStrategy):
+    """Polling with a constant interval
+
+    Parameters
+    ----------
+    interval_seconds : float
+        Seconds between two status requests, by default 1
+    timeout : float, optional
+        Overall deadline in seconds, see PollingStrategy
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 1.0,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ):
+        super().__init__(timeout, **kwargs)
+        self.interval_seconds = interval_seconds
+
+    def interval(self, attempt):
+        return self.interval_seconds
@@ -0,0 +1,137 @@
+"""
+Access tokens shared by the API clients of all processes of a user
+"""
+
+import base64
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from connect.utils import atomic_write_json, file_lock, get_cache_dir
+
+# access tokens are refreshed this many seconds before they expire
+TOKEN_REFRESH_MARGIN = 60
+TOKEN_CACHE_ENV = "CREDO_CONNECT_TOKEN_CACHE"
+
+
+def token_expiry(token_response: dict, now: float = None) -> Optional[float]:
+    """
+    Returns the time an access token expires at, from the expires_in field of
+    the token exchange response or else from the exp claim of the JWT. None if
+    it is unknown
+    """
+    now = time.time() if now is None else now
+    expires_in = token_response.get("expires_in")
+    if expires_in is not None:
+        return now + float(expires_in)
+    return jwt_expiry(token_response.get("access_token"))
+
+
+def jwt_expiry(access_token: str) -> Optional[float]:
+    """Returns the exp claim of a JWT, None if it is not a JWT or has no exp"""
+    try:
+        payload = access_token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+        return float(exp)
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def token_expiring(expires_at: Optional[float], now: float = None) -> bool:
+    """Whether a token expiring at expires_at should be refreshed now"""
+    if expires_at is None:
+        return False
+    now = time.time() if now is None else now
+    return now >= expires_at - TOKEN_REFRESH_MARGIN
+
+
+class TokenCache:
+    """File of access tokens shared across processes
+
+    Tokens are keyed by API server, tenant and the SHA-256 of the API key, so
+    the key itself is never written. The file is only readable by its owner,
+    and a lock file serializes token exchanges: when many workers start at
+    once, the first one exchanges the API key and the others reuse its token.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of the cache file. Defaults to tokens.json in the Connect cache
+        directory, see `connect.utils.get_cache_dir`
+    """
+
+    def __init__(self, path: str = None):
+        self.path = Path(path) if path else get_cache_dir() / "tokens.json"
+
+    @classmethod
+    def from_env(cls) -> Optional["TokenCache"]:
+        """
+        Returns a TokenCache at the default path if the CREDO_CONNECT_TOKEN_CACHE
+        environment variable is set to 1 or true, else None
+        """
+        if os.environ.get(TOKEN_CACHE_ENV, "").lower() in ("1", "true", "yes"):
+            return cls()
+        return None
+
+    @staticmethod
+    def key(api_server: str, tenant: str, api_key: str) -> str:
+        api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        return f"{api_server}|{tenant}|{api_key_hash}"
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Returns the cached token of key as a dict with access_token and
+        expires_at, or None if there is none or it is about to expire
+        """
+        entry = self._load().get(key)
+        if not entry or token_expiring(entry["expires_at"]):
+            return None
+        return entry
+
+    def put(self, key: str, access_token: str, expires_at: Optional[float]):
+        """Store a token. Tokens without a known expiry are not cached"""
+        if expires_at is None:
+            return
+        with self.lock():
+            now = time.time()
+            tokens = {k: v for k, v in self._load().items() if v["expires_at"] > now}
+            tokens[key] = {"access_token": access_token, "expires_at": expires_at}
+            atomic_write_json(self.path, tokens)
+
+    def get_or_put(
+        self,
+        key: str,
+        access_token: str,
+        expires_at: Optional[float],
+        rejected_token: str = None,
+    ) -> dict:
+        """
+        Under the lock, returns the cached token of key if another client
+        stored a usable one, other than rejected_token, or else stores and
+        returns this one. Used by clients that cannot exchange the API key
+        while holding the lock
+        """
+        with self.lock():
+            cached = self.get(key)
+            if cached and cached["access_token"] != rejected_token:
+                return cached
+            self.put(key, access_token, expires_at)
+        return {"access_token": access_token, "expires_at": expires_at}
+
+    def lock(self):
+        """
+        Exclusive lock across threads and processes, held while a token is
+        exchanged, see `connect.utils.file_lock`
+        """
+        return file_lock(self.path)
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
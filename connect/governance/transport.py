@@ -0,0 +1,127 @@
+"""
+Connection pool, timeout and retry policy of the Credo API clients
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+class TransportPolicy:
+    """How API clients open connections, time out and retry requests
+
+    Idempotent requests are retried on connection errors, timeouts and
+    `retry_statuses`. Other requests (post, patch) are only retried on
+    429 Too Many Requests, which the server answers before processing them.
+    Between attempts the client waits for the Retry-After header of the
+    response if any, or else for an exponential backoff with full jitter.
+
+    Parameters
+    ----------
+    pool_connections : int, optional
+        Number of hosts whose connections are pooled, by default 10
+    pool_maxsize : int, optional
+        Maximum number of connections kept per host, by default 10. Should be
+        at least the number of concurrent uploads
+    connect_timeout : float, optional
+        Seconds to establish a connection, by default 10
+    read_timeout : float, optional
+        Seconds to wait for the server between bytes of the response, by default 60
+    max_retries : int, optional
+        Maximum number of retries of a request, by default 3. 0 disables retries
+    backoff_factor : float, optional
+        Upper bound in seconds of the first backoff, by default 0.5. It doubles
+        with every retry
+    max_backoff : float, optional
+        Maximum seconds waited between two attempts, including Retry-After,
+        by default 30
+    retry_statuses : Iterable[int], optional
+        Response statuses of idempotent requests that are retried
+    sleep : Callable, optional
+        Function used to wait, by default time.sleep
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        connect_timeout: float = 10,
+        read_timeout: float = 60,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.sleep = sleep
+
+    @property
+    def timeout(self):
+        """(connect, read) timeout passed to requests"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def create_session(self) -> requests.Session:
+        """Returns a session whose connection pools follow this policy"""
+        session = requests.Session()
+        # retries are handled by the client, not by urllib3
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def should_retry(
+        self, method: str, attempt: int, status: int = None, error: Exception = None
+    ) -> bool:
+        """
+        Whether a request is sent again after its attempt-th attempt (from 0)
+        failed with a response status or a connection error
+        """
+        if attempt >= self.max_retries:
+            return False
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if error is not None:
+            return idempotent
+        if status == 429:
+            return True
+        return idempotent and status in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before the retry following the attempt-th attempt"""
+        if retry_after is not None:
+            return min(max(retry_after, 0), self.max_backoff)
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, backoff)
+
+    @staticmethod
+    def retry_after(headers) -> Optional[float]:
+        """Seconds requested by a Retry-After header, in seconds or as an HTTP date"""
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
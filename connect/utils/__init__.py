@@ -2,7 +2,14 @@
 Utilities for CredoAI Connect
 """
 
+from connect._lazy import lazy_module
+
 from .common import *
-from .data_scrubbing import Scrubber
+from .files import *
 from .logging import *
 from .version_check import get_version
+
+# Scrubber imports pandas, it is imported on first access
+_LAZY_ATTRIBUTES = {"Scrubber": ".data_scrubbing"}
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
@@ -1,12 +1,12 @@
 import collections
+import gzip
 import hashlib
 import json
+import math
+import os
 from pathlib import Path
 from typing import Any, Dict
 
-import numpy as np
-import pandas as pd
-
 
 class NotRunError(Exception):
     pass
@@ -24,11 +24,25 @@ class IntegrationError(Exception):
     pass
 
 
+class ExportError(Exception):
+    """Background exports failed, their exceptions are listed in `errors`"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(
+            f"{len(errors)} exports failed: " + "; ".join(map(repr, errors))
+        )
+
+
 class SupressSettingWithCopyWarning:
     def __enter__(self):
+        import pandas as pd
+
         pd.options.mode.chained_assignment = None
 
     def __exit__(self, *args):
+        import pandas as pd
+
         pd.options.mode.chained_assignment = "warn"
 
 
@@ -62,6 +76,18 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent
 
 
+def get_cache_dir() -> Path:
+    """Directory where Connect keeps local state, e.g. export manifests
+
+    Defaults to ~/.cache/credoai_connect and can be changed with the
+    CREDO_CONNECT_CACHE_DIR environment variable.
+    """
+    path = os.getenv("CREDO_CONNECT_CACHE_DIR")
+    if path:
+        return Path(path)
+    return Path.home() / ".cache" / "credoai_connect"
+
+
 def flatten_list(lst):
     return [item for sublist in lst for item in sublist]
 
@@ -100,22 +126,112 @@ def humanize_label(s):
 
 
 class CredoEncoder(json.JSONEncoder):
-    """Special json encoder for numpy types"""
+    """Special json encoder for numpy types
+
+    Other objects that are not JSON serializable are encoded as strings.
+
+    Parameters
+    ----------
+    nan_as_null : bool, optional
+        If True, NaN and infinities of numpy arrays and scalars are encoded as
+        null, by default False
+    """
+
+    def __init__(self, *args, nan_as_null=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.nan_as_null = nan_as_null
 
     def default(self, obj):
-        # numpy encoders
+        if self.nan_as_null and type(obj).__module__ == "numpy":
+            return _numpy_to_json_builtins(obj)
+        # numpy encoders, numpy is only imported once an object is not JSON native
+        import numpy as np
+
         if isinstance(obj, np.integer):
             return int(obj)
         elif isinstance(obj, np.floating):
             return float(obj)
+        elif isinstance(obj, np.bool_):
+            return bool(obj)
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
-        return json.JSONEncoder.default(self, obj)
+        return str(obj)
+
+
+def json_dumps(obj, compact=False, nan_as_null=False):
+    """Custom json dumps with encoder
+
+    Parameters
+    ----------
+    obj :
+        Object to serialize
+    compact : bool, optional
+        If True, output has no indentation nor whitespace, by default False
+    nan_as_null : bool, optional
+        If True, NaN and infinities, including numpy ones, are encoded as null,
+        so the output is strict JSON and obj does not need to be scrubbed with
+        `Scrubber.remove_NaNs` first. Used for uploads, by default False, NaN
+        is encoded as NaN.
+
+        numpy values are converted by the encoder, one at a time. The C
+        encoder cannot replace NaN floats, including numpy.float64 scalars
+        which are floats: if obj holds any, its encoding fails and obj is
+        encoded again from a copy where they are None
+    """
+    if compact:
+        options = {"separators": (",", ":")}
+    else:
+        options = {"indent": 2}
+    if not nan_as_null:
+        return json.dumps(obj, cls=CredoEncoder, **options)
+    try:
+        return json.dumps(
+            obj, cls=CredoEncoder, nan_as_null=True, allow_nan=False, **options
+        )
+    except ValueError:
+        # NaN or infinite Python floats
+        return json.dumps(
+            _to_json_builtins(obj), cls=CredoEncoder, nan_as_null=True, **options
+        )
+
+
+def _to_json_builtins(obj):
+    """Returns a copy of obj with numpy values as builtins and NaN and infinities as None"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    elif isinstance(obj, dict):
+        return {key: _to_json_builtins(value) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [_to_json_builtins(value) for value in obj]
+    elif type(obj).__module__ == "numpy":
+        return _numpy_to_json_builtins(obj)
+    return obj
+
+
+def _numpy_to_json_builtins(obj):
+    import numpy as np
+
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "f":
+            finite = np.isfinite(obj)
+            if finite.all():
+                return obj.tolist()
+            values = obj.astype(object)
+            values[~finite] = None
+            return values.tolist()
+        elif obj.dtype.kind in "iub":
+            return obj.tolist()
+        return _to_json_builtins(obj.tolist())
+    elif isinstance(obj, np.generic):
+        return _to_json_builtins(obj.item())
+    return obj
 
 
-def json_dumps(obj):
-    """Custom json dumps with encoder"""
-    return json.dumps(obj, cls=CredoEncoder, indent=2, default=str)
+def open_text(filename, mode="r"):
+    """Open a text file, transparently (de)compressing files ending with .gz"""
+    if str(filename).endswith(".gz"):
+        return gzip.open(filename, mode + "t", encoding="utf-8")
+    return open(filename, mode)
 
 
 def dict_hash(dictionary: Dict[str, Any]) -> str:
@@ -123,7 +239,7 @@ def dict_hash(dictionary: Dict[str, Any]) -> str:
     dhash = hashlib.md5()
     # We need to sort arguments so {'a': 1, 'b': 2} is
     # the same as {'b': 2, 'a': 1}
-    encoded = json.dumps(dictionary, sort_keys=True).encode()
+    encoded = json.dumps(dictionary, sort_keys=True, cls=CredoEncoder).encode()
     dhash.update(encoded)
     return dhash.hexdigest()
 
@@ -136,6 +252,9 @@ def to_array(lst):
     lst :  (List, pandas.Series, numpy.ndarray)
         The list-like to be converted
     """
+    import numpy as np
+    import pandas as pd
+
     if type(lst) == pd.Series:
         return lst.values
     elif type(lst) == list:
@@ -1,10 +1,19 @@
-from copy import deepcopy
-
 import numpy as np
 import pandas as pd
 
+# pandas >= 3 copies lazily, and deprecates the copy keyword of concat
+_CONCAT_NO_COPY = {} if int(pd.__version__.split(".")[0]) >= 3 else {"copy": False}
+
 
 class Scrubber:
+    """Replaces NaNs and other missing values by None, which JSON encodes as null
+
+    The input is never modified. Scrubbed DataFrames, dicts and lists are new
+    objects, but the values without NaNs they hold are shared with the input
+    rather than copied. To encode NaN as null without a scrub pass, see
+    `connect.utils.json_dumps(obj, nan_as_null=True)`.
+    """
+
     @staticmethod
     def remove_NaNs(obj):
         if isinstance(obj, pd.DataFrame):
@@ -16,54 +25,76 @@ class Scrubber:
         elif isinstance(obj, list):
             return Scrubber._list_remove_NaNs(obj)
 
+    @staticmethod
+    def records(data: pd.DataFrame):
+        """Returns the rows of a DataFrame as dicts keyed by column, missing values as None
+
+        Equivalent to scrubbing the DataFrame and unpacking `iterrows()`, but
+        converts each column once instead of building a Series per row.
+        """
+        columns = []
+        for _, column in data.items():
+            values = column.tolist()
+            missing = column.isna().to_numpy()
+            if missing.any():
+                values = [None if m else v for v, m in zip(values, missing)]
+            columns.append(values)
+        keys = list(data.columns)
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+
     @staticmethod
     def _df_remove_NaNs(data: pd.DataFrame):
         # Assume DataFrame is well-formed: does not contain lists, DFs, or other complex objects
-        # returns copy of object --> no deep copy concern
+        # only the columns with missing values are converted to object, the
+        # others are shared with data without copying, and data is never written to
         name = getattr(data, "name", None)
-        scrubbed = data.fillna(np.nan).replace([np.nan], [None])
+        columns = [
+            Scrubber._series_remove_NaNs(column) if column.hasnans else column
+            for _, column in data.items()
+        ]
+        if not columns:
+            scrubbed = data.copy(deep=False)
+        else:
+            scrubbed = pd.concat(columns, axis=1, **_CONCAT_NO_COPY)
+            scrubbed.columns = data.columns
         if name:
             scrubbed.name = name
         return scrubbed
 
+    @staticmethod
+    def _series_remove_NaNs(column: pd.Series):
+        # astype returns a new Series, which can be written to
+        values = column.astype(object)
+        values[column.isna().to_numpy()] = None
+        return values
+
     @staticmethod
     def _list_remove_NaNs(data: list):
-        return_list = deepcopy(data)
-        for idx, item in enumerate(return_list):
-            if isinstance(item, pd.DataFrame):
-                return_list[idx] = Scrubber._df_remove_NaNs(item)
-            elif isinstance(item, np.ndarray):
-                return_list[idx] = Scrubber._array_remove_NaNs(item)
-            elif isinstance(item, dict):
-                return_list[idx] = Scrubber._dict_remove_NaNs(item)
-            elif isinstance(item, list):
-                return_list[idx] = Scrubber._list_remove_NaNs(item)
-            else:
-                # Assume no other iterable data types could be stored in list
-                if item is np.nan:
-                    return_list[idx] = None
-        return return_list
+        return [Scrubber._value_remove_NaNs(item) for item in data]
 
     @staticmethod
     def _array_remove_NaNs(data: np.ndarray):
         # Assume array is well-formed: does not contain lists or other complex objects
-        # returns copy of object --> no deep copy concern
-        return np.where(np.isnan(data), None, data)
+        missing = np.isnan(data) if data.dtype.kind in "fc" else pd.isna(data)
+        if not missing.any():
+            return data
+        return np.where(missing, None, data)
 
     @staticmethod
     def _dict_remove_NaNs(data: dict):
-        return_dict = deepcopy(data)
-        for key, val in return_dict.items():
-            if isinstance(val, pd.DataFrame):
-                return_dict[key] = Scrubber._df_remove_NaNs(val)
-            elif isinstance(val, np.ndarray):
-                return_dict[key] = Scrubber._array_remove_NaNs(val)
-            elif isinstance(val, dict):
-                return_dict[key] = Scrubber._dict_remove_NaNs(val)
-            elif isinstance(val, list):
-                return_dict[key] = Scrubber._list_remove_NaNs(val)
-            else:
-                # Assume no other iterable data types could be stored in dictionary
-                if val is np.nan:
-                    return_dict[key] = None
-        return return_dict
+        return {key: Scrubber._value_remove_NaNs(val) for key, val in data.items()}
+
+    @staticmethod
+    def _value_remove_NaNs(val):
+        if isinstance(val, float):
+            return None if val != val else val
+        elif isinstance(val, pd.DataFrame):
+            return Scrubber._df_remove_NaNs(val)
+        elif isinstance(val, np.ndarray):
+            return Scrubber._array_remove_NaNs(val)
+        elif isinstance(val, dict):
+            return Scrubber._dict_remove_NaNs(val)
+        elif isinstance(val, list):
+            return Scrubber._list_remove_NaNs(val)
+        # Assume no other iterable data types could be stored in dict or list
+        return val
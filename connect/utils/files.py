@@ -0,0 +1,81 @@
+"""
+Locked and atomic access to the JSON files of the Connect cache directory
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+__all__ = ["atomic_write_json", "file_lock"]
+
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+# lock files held by the current thread, so that file_lock is reentrant
+_held = threading.local()
+
+
+@contextmanager
+def file_lock(path):
+    """
+    Exclusive lock of path across threads and processes
+
+    The lock is held on a sibling file named path + ".lock". It is reentrant:
+    a thread holding the lock of a path can take it again.
+    """
+    lock_path = Path(f"{path}.lock")
+    key = str(lock_path)
+    held = _held.__dict__.setdefault("paths", set())
+    if key in held:
+        yield
+        return
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.setdefault(key, threading.Lock())
+    with thread_lock:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            held.add(key)
+            yield
+        finally:
+            held.discard(key)
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            os.close(fd)
+
+
+def atomic_write_json(path, obj):
+    """
+    Write obj as JSON to path, under the file lock of path
+
+    obj is written to a temporary file of a unique name first, which then
+    replaces path, so readers never see a partial file. The file is only
+    readable by its owner.
+    """
+    path = Path(path)
+    with file_lock(path):
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as f:
+            try:
+                json.dump(obj, f)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
@@ -1,25 +1,74 @@
-import requests
+import json
+import os
+import threading
+import time
 
 import connect
-from connect.utils import global_logger
+from connect.utils import get_cache_dir, global_logger
+
+PACKAGE = "credoai-connect"
+# set to 0 or false to disable the check of the latest version on PyPI
+VERSION_CHECK_ENV = "CREDO_CONNECT_VERSION_CHECK"
+# seconds during which the latest version found on PyPI is reused
+VERSION_CHECK_TTL = 24 * 3600
+
+_background_check = None
+_background_lock = threading.Lock()
 
 
 def get_version():
     return connect.__version__
 
 
-def validate_version():
-    current_version = get_version()
+def version_check_enabled():
+    return os.getenv(VERSION_CHECK_ENV, "1").lower() not in ("0", "false", "no")
+
 
-    package = "credoai-connect"
+def get_latest_version(ttl: float = VERSION_CHECK_TTL, timeout: float = 5):
+    """
+    Returns the latest version of Connect on PyPI, or None if it cannot be fetched
+
+    The version is cached in the Connect cache directory for ttl seconds.
+    """
+    import requests
+
+    cache_path = get_cache_dir() / "version_check.json"
     try:
-        response = requests.get(f"https://pypi.org/pypi/{package}/json")
-    except requests.ConnectionError:
+        with open(cache_path, "r") as f:
+            cached = json.load(f)
+        if time.time() - cached["checked_at"] < ttl:
+            return cached["latest_version"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    try:
+        response = requests.get(
+            f"https://pypi.org/pypi/{PACKAGE}/json", timeout=timeout
+        )
+        latest_version = response.json()["info"]["version"]
+    except (requests.RequestException, ValueError, KeyError):
         global_logger.info(
             "No internet connection. Cannot determine whether Credo AI Connect version is up-to-date"
         )
+        return None
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump({"latest_version": latest_version, "checked_at": time.time()}, f)
+    except OSError:
+        pass
+    return latest_version
+
+
+def validate_version():
+    """Warn if a newer version of Connect is available on PyPI"""
+    if not version_check_enabled():
+        return
+    current_version = get_version()
+    latest_version = get_latest_version()
+    if latest_version is None:
         return
-    latest_version = response.json()["info"]["version"]
     on_latest = current_version == latest_version
 
     if not on_latest:
@@ -31,3 +80,25 @@ def validate_version():
             """,
             current_version,
         )
+
+
+def validate_version_in_background():
+    """
+    Run validate_version once per process in a daemon thread, so that it never
+    delays the caller nor the exit of the process
+
+    Returns
+    -------
+    threading.Thread
+        the thread of the check, or None if the check is disabled
+    """
+    global _background_check
+    if not version_check_enabled():
+        return None
+    with _background_lock:
+        if _background_check is None:
+            _background_check = threading.Thread(
+                target=validate_version, name="connect-version-check", daemon=True
+            )
+            _background_check.start()
+    return _background_check
@@ -0,0 +1,6 @@
+#!/usr/bin/env bash
+
+set -e
+set -x
+
+PYTHONPATH=. python -m benchmarks.suite "${@}"
@@ -32,7 +32,7 @@ with open("docs/requirements.txt") as f:
 
 dev_requirements += doc_requirements
 
-EXTRAS_REQUIRES = {"dev": dev_requirements}
+EXTRAS_REQUIRES = {"dev": dev_requirements, "async": ["httpx>=0.23.0"]}
 
 CLASSIFIERS = [
     "Intended Audience :: Information Technology",
@@ -0,0 +1,4 @@
+import os
+
+# tests never check the latest version on PyPI
+os.environ["CREDO_CONNECT_VERSION_CHECK"] = "0"
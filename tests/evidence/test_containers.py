@@ -0,0 +1,89 @@
+"""
+Test the conversion of metric and statistic test containers
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from connect.evidence import MetricContainer, StatisticTestContainer
+from connect.utils import Scrubber, ValidationError
+
+
+def iterrows_structs(container, evidence_class):
+    """Structures of the row by row conversion the containers used to make"""
+    return [
+        evidence_class(additional_labels=container.labels, **row, **container.metadata)
+        for _, row in container.scrubbed_data.iterrows()
+    ]
+
+
+def strip_time(structs):
+    return [{k: v for k, v in s.items() if k != "generated_at"} for s in structs]
+
+
+def test_metric_container_matches_iterrows():
+    data = pd.DataFrame(
+        {
+            "type": ["accuracy", "precision", "recall"],
+            "value": [0.9, 0.8, 0.7],
+            "subtype": ["overall", "group", "overall"],
+        }
+    )
+    container = MetricContainer(data, labels={"model": "m"}, metadata={"run": 1})
+
+    evidences = container.to_evidence()
+    expected = iterrows_structs(container, container.evidence_class)
+
+    assert strip_time(e.struct() for e in expected) == strip_time(
+        e.struct() for e in evidences
+    )
+
+
+def test_metric_container_scrubs_missing_values():
+    data = pd.DataFrame(
+        {
+            "type": ["accuracy", "precision"],
+            "value": [0.9, np.nan],
+            "subtype": ["a", None],
+        }
+    )
+
+    evidence = MetricContainer(data).to_evidence()[1]
+
+    assert evidence.value is None
+    assert evidence.metadata["subtype"] is None
+
+
+def test_statistic_test_container_matches_iterrows():
+    data = pd.DataFrame(
+        {
+            "statistic_type": ["ks", "chi2"],
+            "test_statistic": [0.12, 3.4],
+            "significance_threshold": [0.05, 0.05],
+            "p_value": [0.2, 0.01],
+            "significant": [False, True],
+        }
+    )
+    container = StatisticTestContainer(data)
+
+    evidences = container.to_evidence(source="test")
+    expected = iterrows_structs(container, container.evidence_class)
+
+    assert [e.data for e in expected] == [e.data for e in evidences]
+    assert all(e.metadata["source"] == "test" for e in evidences)
+
+
+def test_records_replaces_missing_values():
+    data = pd.DataFrame(
+        {"a": [1.0, np.nan], "b": pd.array([None, 2], dtype="Int64"), "c": ["x", None]}
+    )
+
+    assert [{"a": 1.0, "b": None, "c": "x"}, {"a": None, "b": 2, "c": None}] == (
+        Scrubber.records(data)
+    )
+
+
+def test_metric_container_requires_columns():
+    with pytest.raises(ValidationError):
+        MetricContainer(pd.DataFrame({"type": ["accuracy"]}))
@@ -0,0 +1,27 @@
+"""
+Test the caching of deepchecks suite results rendered to JSON
+"""
+
+from connect.evidence.deepchecks_evidence.evidence import DeepchecksEvidence
+
+
+class SuiteResult:
+    """Result with the to_json method of deepchecks.core.SuiteResult"""
+
+    def __init__(self):
+        self.renders = 0
+
+    def to_json(self):
+        self.renders += 1
+        return f'{{"render": {self.renders}}}'
+
+
+def test_suite_result_is_rendered_once():
+    result = SuiteResult()
+    evidence = DeepchecksEvidence("suite", result)
+
+    assert evidence.struct()["data"] == evidence.struct()["data"]
+    assert 1 == result.renders
+
+    evidence.invalidate()
+    assert '{"render": 2}' == evidence.struct()["data"]
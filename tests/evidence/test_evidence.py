@@ -0,0 +1,122 @@
+"""
+Test caching of evidence structures
+"""
+
+import gc
+import math
+import weakref
+
+import pandas as pd
+import pytest
+
+from connect.evidence import MetricEvidence, MetricEvidenceBatch, TableEvidence
+from connect.utils import ValidationError
+
+
+class CountingTableEvidence(TableEvidence):
+    data_calls = 0
+
+    @property
+    def data(self):
+        CountingTableEvidence.data_calls += 1
+        return super().data
+
+
+@pytest.fixture()
+def evidence():
+    CountingTableEvidence.data_calls = 0
+    return CountingTableEvidence("table", pd.DataFrame({"A": [1, 2], "B": [3, 4]}))
+
+
+def test_struct_is_cached(evidence):
+    first = evidence.struct()
+    str(evidence)
+    assert first == evidence.struct()
+    assert 1 == CountingTableEvidence.data_calls
+
+    # returned structures do not alter the cache
+    first["label"] = None
+    assert {"table_name": "table"} == evidence.struct()["label"]
+
+
+def test_label_and_metadata_changes_invalidate_struct(evidence):
+    evidence.struct()
+    evidence.label = {"table_name": "other"}
+    evidence.metadata = {"source": "test"}
+
+    struct = evidence.struct()
+    assert {"table_name": "other"} == struct["label"]
+    assert {"source": "test"} == struct["metadata"]
+    # data is not computed again
+    assert 1 == CountingTableEvidence.data_calls
+
+
+def test_metric_evidence_is_not_cached():
+    evidence = MetricEvidence(type="accuracy_score", value=0.5)
+    str(evidence)
+    evidence.value = 0.9
+    assert 0.9 == evidence.struct()["data"]["value"]
+
+
+def test_invalidate_after_in_place_change(evidence):
+    evidence.struct()
+    evidence._data.loc[0, "A"] = 10
+    assert [1, 3] == evidence.struct()["data"]["value"][0]
+
+    evidence.invalidate()
+    assert [10, 3] == evidence.struct()["data"]["value"][0]
+
+
+def test_release(evidence):
+    table = evidence._data
+    table_ref = weakref.ref(table)
+    struct = evidence.struct()
+
+    evidence.release()
+    del table
+    gc.collect()
+    assert None == table_ref()
+    assert struct == evidence.struct()
+
+    evidence.label = {"table_name": "other"}
+    evidence.invalidate()
+    assert struct["data"] == evidence.struct()["data"]
+    assert 1 == CountingTableEvidence.data_calls
+
+
+def test_metric_evidence_batch_structs():
+    batch = MetricEvidenceBatch(
+        ["accuracy_score", "precision"],
+        [0.9, 0.8],
+        confidence_intervals=[[0.85, 0.95], [0.7, 0.9]],
+        confidence_levels=95,
+        additional_labels={"model": "m"},
+        dataset="validation",
+    )
+    evidence = MetricEvidence(
+        "precision", 0.8, [0.7, 0.9], 95, {"model": "m"}, dataset="validation"
+    )
+
+    expected = {**evidence.struct(), "generated_at": batch.creation_time}
+    assert expected == batch.structs()[1]
+    assert expected == batch[1].struct() == batch[-1].struct()
+    assert 2 == len(batch)
+
+    batch[0].label = {"metric_type": "accuracy"}
+    assert [
+        {"metric_type": "accuracy"},
+        {"metric_type": "precision", "model": "m"},
+    ] == [s["label"] for s in batch.structs()]
+
+
+def test_metric_evidence_batch_converts_values_to_float():
+    from decimal import Decimal
+
+    batch = MetricEvidenceBatch(["a", "b", "c"], [Decimal("0.5"), None, 1])
+
+    values = [row.data["value"] for row in batch]
+    assert 0.5 == values[0] and 1.0 == values[2]
+    assert math.isnan(values[1])
+    assert values[::2] == [s["data"]["value"] for s in batch.structs()][::2]
+    with pytest.raises(ValidationError):
+        MetricEvidenceBatch(["a"], ["high"])
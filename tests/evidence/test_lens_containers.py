@@ -0,0 +1,39 @@
+"""
+Test the sections kept from ydata profile descriptions
+"""
+
+from dataclasses import dataclass
+
+from connect.evidence.lens_evidence.containers import BULKY_SECTIONS, _drop_sections
+
+
+def description():
+    return {
+        "table": {"n": 3},
+        "variables": {
+            "age": {"mean": 30.0, "histogram": ([1, 2], [0, 1, 2]), "n_missing": 0}
+        },
+        "correlations": {"pearson": [[1.0]]},
+        "sample": [{"id": "head"}],
+    }
+
+
+def test_drop_sections_keeps_description_intact():
+    full = description()
+
+    dropped = _drop_sections(full, frozenset(BULKY_SECTIONS))
+
+    assert {"table", "variables"} == set(dropped)
+    assert {"mean": 30.0, "n_missing": 0} == dropped["variables"]["age"]
+    assert description() == full
+
+
+def test_drop_sections_of_dataclass_description():
+    @dataclass
+    class BaseDescription:
+        table: dict
+        sample: list
+
+    dropped = _drop_sections(BaseDescription({"n": 3}, []), frozenset({"sample"}))
+
+    assert {"table": {"n": 3}} == dropped
@@ -0,0 +1,78 @@
+"""
+Test the layouts of table evidence
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from connect.evidence import TableContainer, TableEvidence
+from connect.utils import ValidationError, json_dumps
+
+
+@pytest.fixture()
+def table():
+    table = pd.DataFrame(
+        {
+            "count": [1, 2, 3],
+            "rate": [0.5, np.nan, 0.25],
+            "group": ["a", None, "c"],
+            "nullable": pd.array([1, None, 3], dtype="Int64"),
+        }
+    )
+    table.name = "disaggregated_performance"
+    return table
+
+
+def test_column_layout(table):
+    data = TableEvidence("table", table, layout="columns").data
+
+    assert "columns" == data["layout"]
+    assert ["count", "rate", "group", "nullable"] == [
+        c["value"] for c in data["columns"]
+    ]
+    assert [
+        [1, 2, 3],
+        [0.5, None, 0.25],
+        ["a", None, "c"],
+        [1, None, 3],
+    ] == data["value"]
+    assert int == type(data["value"][0][0])
+
+
+def test_row_layout_is_default(table):
+    data = TableEvidence("table", table[["count", "rate"]]).data
+
+    assert "layout" not in data
+    assert [[1, 0.5], [3, 0.25]] == data["value"][::2]
+    # integers are not upcast to floats by the other columns
+    assert int == type(data["value"][0][0])
+
+
+def test_container_layout(table):
+    rows = TableContainer(table).to_evidence()[0].data["value"]
+    columns = TableContainer(table, layout="columns").to_evidence()[0].data["value"]
+
+    assert rows == [list(row) for row in zip(*columns)]
+
+
+def test_layouts_convert_values_alike():
+    table = pd.DataFrame(
+        {
+            "when": pd.to_datetime(["2020-01-01", None]),
+            "rate": [0.5, np.nan],
+            "count": [1, 2],
+        }
+    )
+
+    rows = TableEvidence("table", table).data["value"]
+    columns = TableEvidence("table", table, layout="columns").data["value"]
+
+    assert rows == [list(row) for row in zip(*columns)]
+    assert [[pd.Timestamp("2020-01-01"), 0.5, 1], [None, None, 2]] == rows
+    assert json_dumps(rows) == json_dumps([list(row) for row in zip(*columns)])
+
+
+def test_invalid_layout(table):
+    with pytest.raises(ValidationError):
+        TableEvidence("table", table, layout="cells")
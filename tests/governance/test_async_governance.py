@@ -0,0 +1,193 @@
+"""
+Test asyncio Credo API client and governance
+"""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from connect.evidence.evidence import MetricEvidence
+from connect.governance.async_credo_api_client import AsyncCredoApiClient
+from connect.governance.async_governance import AsyncGovernance
+from connect.governance.credo_api_client import CredoApiConfig
+from connect.governance.token_cache import TokenCache
+
+API_KEY = "API_KEY"
+API_SERVER = "http://api.server"
+TENANT = "credoai"
+API_BASE = f"{API_SERVER}/api/v2/{TENANT}"
+USE_CASE_ID = "64YUaLWSviHgibJaRWr3ZE"
+POLICY_PACK_ID = "NYCE+1"
+ASSESSMENT_PLAN_URL = (
+    f"{API_BASE}/use_cases/{USE_CASE_ID}/assessment_plans/{POLICY_PACK_ID}"
+)
+ASSESSMENT_PLAN = {
+    "data": {
+        "type": "assessment_plans",
+        "id": POLICY_PACK_ID,
+        "attributes": {
+            "use_case_id": USE_CASE_ID,
+            "policy_pack_id": POLICY_PACK_ID,
+            "evidence_requirements": [
+                {"evidence_type": "metric", "label": {"metric_type": "precision"}},
+                {"evidence_type": "metric", "label": {"metric_type": "recall"}},
+            ],
+        },
+    }
+}
+
+
+class FakeServer:
+    """Records requests and answers them like the Credo API server"""
+
+    def __init__(self):
+        self.requests = []
+        self.tokens = iter(["VALID_TOKEN", "REFRESHED_VALID_TOKEN"])
+        self.expired_token = None
+
+    def __call__(self, request: httpx.Request):
+        self.requests.append(request)
+        url = str(request.url)
+        if url == f"{API_SERVER}/auth/exchange":
+            return httpx.Response(200, json={"access_token": next(self.tokens)})
+        if request.headers.get("Authorization") == f"Bearer {self.expired_token}":
+            return httpx.Response(401)
+        if url.startswith(f"{API_BASE}/assessment_plan_url"):
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "type": "assessment_plan_urls",
+                        "id": "url",
+                        "attributes": {"url": ASSESSMENT_PLAN_URL},
+                    }
+                },
+            )
+        if url == ASSESSMENT_PLAN_URL:
+            return httpx.Response(200, json=ASSESSMENT_PLAN)
+        if url == f"{API_BASE}/use_cases/{USE_CASE_ID}/assessments":
+            evidences = json.loads(request.content)["data"]["attributes"]["evidences"]
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "type": "assessments",
+                        "id": "assessment",
+                        "attributes": {
+                            "result": "success",
+                            "details": {"evidences": evidences},
+                        },
+                    }
+                },
+            )
+        return httpx.Response(404)
+
+
+@pytest.fixture()
+def server():
+    return FakeServer()
+
+
+@pytest.fixture()
+def client(server):
+    config = CredoApiConfig(api_key=API_KEY, api_server=API_SERVER, tenant=TENANT)
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return AsyncCredoApiClient(config=config, http_client=http_client)
+
+
+def build_metric_evidence(type):
+    return MetricEvidence(type=type, value=0.2)
+
+
+class TestAsyncCredoApiClient:
+    def test_get_request(self, client, server):
+        response = asyncio.run(client.get(ASSESSMENT_PLAN_URL))
+
+        assert POLICY_PACK_ID == response["policy_pack_id"]
+        # the access token is fetched with the first request
+        assert f"{API_SERVER}/auth/exchange" == str(server.requests[0].url)
+        assert "Bearer VALID_TOKEN" == server.requests[1].headers["Authorization"]
+
+    def test_access_token_expired(self, client, server):
+        client.set_access_token("INVALID_TOKEN")
+        server.expired_token = "INVALID_TOKEN"
+
+        response = asyncio.run(client.get(ASSESSMENT_PLAN_URL))
+
+        assert POLICY_PACK_ID == response["policy_pack_id"]
+        assert "Bearer VALID_TOKEN" == client._client.headers["Authorization"]
+        assert 3 == len(server.requests)
+
+
+class TestAsyncGovernance:
+    def test_register_and_export(self, client, server):
+        gov = AsyncGovernance(credo_api_client=client)
+
+        async def run():
+            await gov.register(use_case_name="Fraud Detection", policy_pack_key="NYCE")
+            gov.add_evidence(
+                [build_metric_evidence("precision"), build_metric_evidence("recall")]
+            )
+            return await gov.export()
+
+        assert True == asyncio.run(run())
+        assert USE_CASE_ID == gov._use_case_id
+        assert "success" == gov._assessment["result"]
+
+    def test_concurrent_batched_export(self, client, server):
+        gov = AsyncGovernance(credo_api_client=client)
+
+        async def run():
+            await gov.register(assessment_plan_url=ASSESSMENT_PLAN_URL)
+            gov.add_evidence(
+                [build_metric_evidence("precision"), build_metric_evidence("recall")]
+            )
+            return await gov.export(batch_size=1)
+
+        assert True == asyncio.run(run())
+        assert 2 == len(gov._assessment["details"]["evidences"])
+        posts = [r for r in server.requests if r.url.path.endswith("assessments")]
+        assert 2 == len(posts)
+
+
+def test_clients_sharing_token_cache_do_not_deadlock(tmp_path):
+    exchanges = []
+
+    async def handler(request):
+        if request.url.path == "/auth/exchange":
+            exchanges.append(request)
+            # yield to the event loop while the token is exchanged
+            await asyncio.sleep(0.05)
+            return httpx.Response(
+                200, json={"access_token": "CACHED_TOKEN", "expires_in": 3600}
+            )
+        return httpx.Response(200, json=ASSESSMENT_PLAN)
+
+    cache = TokenCache(str(tmp_path / "tokens.json"))
+    config = CredoApiConfig(api_key=API_KEY, api_server=API_SERVER, tenant=TENANT)
+    clients = [
+        AsyncCredoApiClient(
+            config=config,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            token_cache=cache,
+        )
+        for _ in range(2)
+    ]
+    results = []
+
+    async def run():
+        results.extend(
+            await asyncio.gather(*(c.get(ASSESSMENT_PLAN_URL) for c in clients))
+        )
+
+    # a deadlock blocks the event loop itself, so the loop runs in a thread
+    thread = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert 2 == len(results)
+    assert 1 == len(exchanges)
@@ -10,6 +10,7 @@ class TestCredoApi:
         # Use mock for CredoApiClient becasue we do not want to call HTTP request from test.
         # We will only check if CredoApi is calling client method with right arguments.
         mocker.patch.object(CredoApiClient, "get")
+        mocker.patch.object(CredoApiClient, "get_with_headers")
         mocker.patch.object(CredoApiClient, "post")
         mocker.patch.object(CredoApiClient, "patch")
         mocker.patch.object(CredoApiClient, "delete")
@@ -81,3 +82,12 @@ class TestCredoApi:
         api.get_assessment(use_case_id, id)
 
         client.get.assert_called_with(f"use_cases/{use_case_id}/assessments/{id}")
+
+    def test_get_assessment_with_headers(self, api, client):
+        use_case_id = "64YUaLWSviHgibJaRWr3ZE"
+        id = "wotgqfrrnxYDJSrvhHFW3E"
+        api.get_assessment_with_headers(use_case_id, id)
+
+        client.get_with_headers.assert_called_with(
+            f"use_cases/{use_case_id}/assessments/{id}"
+        )
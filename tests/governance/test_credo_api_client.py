@@ -2,14 +2,41 @@
 Test Credo API client
 """
 
+import gzip
+import json
 import os
 import pathlib
+import tempfile
+import time
 
+import numpy as np
 import pytest
+import requests
 import responses
 
 from connect import __version__
-from connect.governance.credo_api_client import CredoApiClient, CredoApiConfig
+from connect.governance.credo_api_client import (
+    CredoApiClient,
+    CredoApiConfig,
+    encode_body,
+)
+from connect.governance.token_cache import TokenCache, jwt_expiry
+from connect.governance.transport import TransportPolicy
+
+
+def test_encode_body_is_compact_strict_json():
+    data = {"$type": "assessments", "values": np.array([0.5, np.nan]), "x": np.inf}
+
+    body, headers = encode_body(data)
+
+    assert {} == headers
+    assert (
+        '{"data":{"attributes":{"values":[0.5,null],"x":null},"type":"assessments"}}'
+        == body
+    )
+    assert json.loads(body) == json.loads(
+        gzip.decompress(encode_body(data, compress=True)[0])
+    )
 
 
 class TestCredoApiConfig:
@@ -70,7 +97,10 @@ class TestCredoApiClient:
         )
 
         config = CredoApiConfig(api_key=API_KEY, api_server=API_SERVER, tenant=TENANT)
-        return CredoApiClient(config=config)
+        client = CredoApiClient(config=config)
+        # authentication is lazy, get the token while the exchange is mocked
+        client.refresh_token()
+        return client
 
     @responses.activate
     def test_refresh_token(self, client):
@@ -196,3 +226,173 @@ class TestCredoApiClient:
 
         response = client.delete("models/123")
         assert None == response
+
+    @responses.activate
+    def test_post_request_compressed(self, client):
+        responses.post(
+            f"{API_SERVER}/api/v2/{TENANT}/models",
+            json={
+                "data": {
+                    "attributes": {"name": "model 1"},
+                    "type": "models",
+                    "id": "123",
+                }
+            },
+        )
+
+        response = client.post(
+            "models", {"name": "model 1", "$type": "models"}, compress=True
+        )
+        assert "model 1" == response["name"]
+
+        request = responses.calls[0].request
+        assert "gzip" == request.headers["Content-Encoding"]
+        body = json.loads(gzip.decompress(request.body))
+        assert {"name": "model 1"} == body["data"]["attributes"]
+
+    @responses.activate
+    def test_get_with_headers(self, client):
+        responses.get(
+            f"{API_SERVER}/api/v2/{TENANT}/use_cases/1/assessments/2",
+            json={
+                "data": {
+                    "attributes": {"result": "in_progress"},
+                    "type": "a",
+                    "id": "2",
+                }
+            },
+            headers={"Retry-After": "5"},
+        )
+
+        assessment, headers = client.get_with_headers("use_cases/1/assessments/2")
+
+        assert "in_progress" == assessment["result"]
+        assert "5" == headers["retry-after"]
+
+    @responses.activate
+    def test_get_conditional(self, client):
+        url = f"{API_SERVER}/api/v2/{TENANT}/assessment_plans/1"
+        responses.get(
+            url,
+            json={"data": {"attributes": {"name": "plan"}, "type": "plans", "id": "1"}},
+            headers={"ETag": '"v1"'},
+        )
+        plan, etag = client.get_conditional("assessment_plans/1")
+        assert "plan" == plan["name"]
+        assert '"v1"' == etag
+        assert "If-None-Match" not in responses.calls[0].request.headers
+
+        responses.replace(responses.GET, url, status=304)
+        plan, etag = client.get_conditional("assessment_plans/1", etag)
+        assert None == plan
+        assert '"v1"' == etag
+        assert '"v1"' == responses.calls[1].request.headers["If-None-Match"]
+
+    @responses.activate
+    def test_retry_idempotent_request(self, client):
+        sleeps = []
+        client._transport = TransportPolicy(sleep=sleeps.append, read_timeout=5)
+        url = f"{API_SERVER}/api/v2/{TENANT}/models"
+        responses.get(url, status=503)
+        responses.get(url, status=503, headers={"Retry-After": "2"})
+        responses.get(
+            url,
+            json={"data": {"attributes": {"name": "model 1"}, "type": "models"}},
+        )
+
+        response = client.get("models")
+        assert "model 1" == response["name"]
+        assert 3 == len(responses.calls)
+        assert sleeps[0] <= 0.5
+        assert 2 == sleeps[1]
+        assert (10, 5) == responses.calls[0].request.req_kwargs["timeout"]
+
+    @responses.activate
+    def test_retry_post_request_only_when_throttled(self, client):
+        sleeps = []
+        client._transport = TransportPolicy(sleep=sleeps.append)
+        url = f"{API_SERVER}/api/v2/{TENANT}/models"
+        responses.post(url, status=429, headers={"Retry-After": "1"})
+        responses.post(url, status=500)
+
+        with pytest.raises(requests.HTTPError):
+            client.post("models", {"name": "model 1", "$type": "models"})
+        assert 2 == len(responses.calls)
+        assert [1] == sleeps
+
+    @responses.activate
+    def test_retries_exhausted(self, client):
+        client._transport = TransportPolicy(sleep=lambda _: None, max_retries=2)
+        responses.get(f"{API_SERVER}/api/v2/{TENANT}/models", status=502)
+
+        with pytest.raises(requests.HTTPError):
+            client.get("models")
+        assert 3 == len(responses.calls)
+
+    @responses.activate
+    def test_refresh_token_on_session(self, client):
+        responses.post(
+            f"{API_SERVER}/auth/exchange",
+            json={"access_token": "REFRESHED_VALID_TOKEN"},
+        )
+
+        client.refresh_token()
+
+        request = responses.calls[0].request
+        assert "Authorization" not in request.headers
+        assert "Credo AI Connect" == request.headers["X-Client-Name"]
+
+    @responses.activate
+    def test_lazy_authentication(self):
+        config = CredoApiConfig(api_key=API_KEY, api_server=API_SERVER, tenant=TENANT)
+        client = CredoApiClient(config=config)
+        assert 0 == len(responses.calls)
+
+        responses.post(f"{API_SERVER}/auth/exchange", json={"access_token": "TOKEN"})
+        responses.get(f"{API_SERVER}/api/v2/{TENANT}/models", status=204)
+        client.get("models")
+        client.get("models")
+        assert [
+            "/auth/exchange",
+            "/api/v2/credoai/models",
+            "/api/v2/credoai/models",
+        ] == [c.request.path_url for c in responses.calls]
+        assert "Bearer TOKEN" == responses.calls[1].request.headers["Authorization"]
+
+    @responses.activate
+    def test_proactive_token_refresh(self, client):
+        responses.post(
+            f"{API_SERVER}/auth/exchange",
+            json={"access_token": "NEW_TOKEN", "expires_in": 3600},
+        )
+        responses.get(f"{API_SERVER}/api/v2/{TENANT}/models", status=204)
+
+        client.set_access_token("OLD_TOKEN", expires_at=time.time() + 10)
+        client.get("models")
+        assert 2 == len(responses.calls)
+        assert "Bearer NEW_TOKEN" == responses.calls[1].request.headers["Authorization"]
+        assert client._token_expires_at > time.time() + 3000
+
+    @responses.activate
+    def test_shared_token_cache(self):
+        responses.post(
+            f"{API_SERVER}/auth/exchange",
+            json={"access_token": "TOKEN", "expires_in": 3600},
+        )
+        responses.get(f"{API_SERVER}/api/v2/{TENANT}/models", status=204)
+        cache = TokenCache(f"{tempfile.mkdtemp()}/tokens.json")
+        config = CredoApiConfig(api_key=API_KEY, api_server=API_SERVER, tenant=TENANT)
+
+        for _ in range(3):
+            CredoApiClient(config=config, token_cache=cache).get("models")
+
+        exchanges = [c for c in responses.calls if "auth" in c.request.url]
+        assert 1 == len(exchanges)
+        assert 0o600 == os.stat(cache.path).st_mode & 0o777
+        assert API_KEY not in cache.path.read_text()
+
+    def test_jwt_expiry(self):
+        # {"alg": "none"} . {"exp": 1700000000}
+        token = "eyJhbGciOiJub25lIn0.eyJleHAiOjE3MDAwMDAwMDB9.sig"
+        assert 1700000000 == jwt_expiry(token)
+        assert None == jwt_expiry("VALID_TOKEN")
@@ -0,0 +1,44 @@
+"""
+Test matching evidence requirements with the evidence index
+"""
+
+import random
+
+from connect.evidence import MetricEvidence
+from connect.governance.evidence_index import EvidenceIndex
+from connect.utils import check_subset
+
+
+def build_evidence(label):
+    evidence = MetricEvidence(type="metric", value=0.5)
+    evidence.label = label
+    return evidence
+
+
+def test_match_like_check_subset():
+    rng = random.Random(0)
+    values = ["a", "b", 1, 1.0, True, None, float("nan"), ["x", "y"], {"k": "v"}]
+    evidences = [
+        build_evidence(
+            {key: rng.choice(values) for key in rng.sample(["m", "n", "o", "p"], 3)}
+        )
+        for _ in range(200)
+    ]
+    requirements = [
+        {key: rng.choice(values + [["x"]]) for key in rng.sample(["m", "n", "o"], 2)}
+        for _ in range(200)
+    ] + [{}]
+    index = EvidenceIndex(evidences)
+    for label in requirements:
+        expected = [e for e in evidences if check_subset(label, e.label)]
+        assert expected == index.match(label)
+
+
+def test_relabel_updates_index():
+    evidence = build_evidence({"metric_type": "accuracy_score", "model": "m"})
+    index = EvidenceIndex([evidence, build_evidence({"metric_type": "precision"})])
+
+    index.relabel(evidence, {"metric_type": "recall"})
+    assert [] == index.match({"model": "m"})
+    assert [evidence] == index.match({"metric_type": "recall"})
+    assert {"metric_type": "recall"} == evidence.label
@@ -0,0 +1,123 @@
+"""
+Test registering and exporting many use cases with GovernanceFleet
+"""
+
+import pytest
+
+from connect.evidence import MetricEvidence
+from connect.governance import GovernanceFleet
+from connect.governance.credo_api import CredoApi
+from connect.governance.credo_api_client import CredoApiClient
+
+
+def build_plan(use_case_id):
+    return {
+        "use_case_id": use_case_id,
+        "policy_pack_id": "PP+1",
+        "evidence_requirements": [
+            {"evidence_type": "metric", "label": {"metric_type": "accuracy_score"}},
+            {"evidence_type": "metric", "label": {"metric_type": "precision"}},
+        ],
+    }
+
+
+class TestGovernanceFleet:
+    @pytest.fixture()
+    def client(self):
+        # requests go through the mocked CredoApi, so the client never authenticates
+        return CredoApiClient()
+
+    @pytest.fixture()
+    def fleet(self, client, mocker):
+        def get_assessment_plan(url):
+            if url.endswith("missing"):
+                return None
+            if url.endswith("broken"):
+                raise ConnectionError("connection refused")
+            return build_plan(url.rsplit("/", 1)[-1])
+
+        mocker.patch.object(
+            CredoApi, "get_assessment_plan", side_effect=get_assessment_plan
+        )
+
+        def create_assessment(use_case_id, data):
+            if use_case_id == "rejected":
+                return {"id": use_case_id, "result": "error", "error": "invalid"}
+            return {
+                "id": use_case_id,
+                "result": "success",
+                "details": {"evidences": data["evidences"]},
+            }
+
+        mocker.patch.object(
+            CredoApi, "create_assessment", side_effect=create_assessment
+        )
+        with GovernanceFleet(credo_api_client=client, max_workers=4) as fleet:
+            yield fleet
+
+    def test_register(self, fleet, client):
+        statuses = fleet.register(
+            {
+                key: {"assessment_plan_url": f"http://api.server/plans/{key}"}
+                for key in ["a", "b", "missing", "broken"]
+            }
+        )
+
+        assert {"status": "registered"} == statuses["a"]
+        assert {"status": "registered"} == statuses["b"]
+        assert {"status": "not_registered"} == statuses["missing"]
+        assert "error" == statuses["broken"]["status"]
+        assert "connection refused" == statuses["broken"]["error"]
+        assert "a" == fleet["a"]._use_case_id
+        assert 4 == len(fleet)
+        # members share the client
+        assert all(fleet[key]._api._client is client for key in fleet)
+
+    def test_export(self, fleet):
+        fleet.register(
+            {
+                key: {"assessment_plan_url": f"http://api.server/plans/{key}"}
+                for key in ["a", "b", "c", "missing"]
+            }
+        )
+        fleet["a"].add_evidence(
+            [
+                MetricEvidence(type="accuracy_score", value=0.9),
+                MetricEvidence(type="precision", value=0.8),
+            ]
+        )
+        fleet["b"].add_evidence(MetricEvidence(type="accuracy_score", value=0.9))
+
+        statuses = fleet.export()
+
+        assert {
+            "a": {"status": "exported"},
+            "b": {"status": "partial"},
+            "c": {"status": "skipped"},
+            "missing": {"status": "skipped"},
+        } == statuses
+        assert 2 == CredoApi.create_assessment.call_count
+
+    def test_export_rejected_by_server(self, fleet):
+        fleet.register(
+            {"rejected": {"assessment_plan_url": "http://api.server/plans/rejected"}}
+        )
+        fleet["rejected"].add_evidence(MetricEvidence(type="accuracy_score", value=0.9))
+
+        statuses = fleet.export()
+
+        assert {"rejected": {"status": "error", "error": "invalid"}} == statuses
+
+    def test_export_bounds_member_workers(self, fleet, mocker):
+        fleet.register({"a": {"assessment_plan_url": "http://api.server/plans/a"}})
+        fleet["a"].add_evidence(MetricEvidence(type="accuracy_score", value=0.9))
+        export = mocker.spy(fleet["a"], "export")
+
+        fleet.export(batch_size=1, max_workers=16)
+
+        assert 4 == export.call_args[1]["max_workers"]
+
+
+def test_client_pool_fits_member_uploads():
+    with GovernanceFleet(max_workers=2, member_workers=3) as fleet:
+        assert 6 == fleet._client._transport.pool_maxsize
@@ -1,13 +1,25 @@
+import gzip
 import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from json_api_doc import serialize
+from requests.exceptions import ConnectionError
 from pandas import DataFrame
 
-from connect.evidence.evidence import MetricEvidence, TableEvidence
+from connect.evidence.evidence import (
+    MetricEvidence,
+    MetricEvidenceBatch,
+    TableEvidence,
+)
 from connect.governance.credo_api import CredoApi
 from connect.governance.credo_api_client import CredoApiClient
 from connect.governance.governance import Governance
+from connect.governance.manifest import EvidenceManifest
+from connect.governance.plan_cache import AssessmentPlanCache
+from connect.utils import check_subset as check_subset_impl
+from connect.utils import ExportError, get_version, json_dumps
 
 USE_CASE_ID = "64YUaLWSviHgibJaRWr3ZE"
 POLICY_PACK_ID = "NYCE+1"
@@ -221,3 +233,284 @@ class TestGovernance:
             model="test", model_tags={"risk": "high", "model_type": "binary"}
         )
         assert 5 == len(gov.get_evidence_requirements())
+
+    def test_get_evidence_requirements_keeps_plan_order(self, gov, mocker):
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        check_subset = mocker.patch(
+            "connect.governance.governance.check_subset", wraps=check_subset_impl
+        )
+        tags = {"risk": "high", "model_type": "binary"}
+        labels = [r.label for r in gov.get_evidence_requirements(tags)]
+        assert [r["label"] for r in EVIDENCE_REQUIREMENTS] == labels
+        # one check per distinct tag set, then memoized
+        assert 3 == check_subset.call_count
+        gov.get_evidence_requirements(dict(tags))
+        assert 3 == check_subset.call_count
+
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        assert 5 == len(gov.get_evidence_requirements(tags))
+        assert 6 == check_subset.call_count
+
+    def test_export_metric_evidence_batch(self, gov, api):
+        api.create_assessment.side_effect = lambda use_case_id, data: {
+            "id": "id",
+            "result": "success",
+            "details": {"evidences": data["evidences"]},
+        }
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        gov.add_evidence(
+            MetricEvidenceBatch(
+                ["accuracy_score", "p_value", "f1_score"],
+                [0.9, 0.05, 0.7],
+                model_name="superich detector",
+            )
+        )
+        gov.add_evidence(build_table_evidence("disaggregated_performance"))
+
+        assert True == gov.export()
+        uploaded = api.create_assessment.call_args[0][1]["evidences"]
+        assert 4 == len(uploaded)
+        assert {"metric_type": "p_value"} == uploaded[1]["label"]
+        assert 0.05 == uploaded[1]["data"]["value"]
+
+    def test_export_in_batches(self, gov, api):
+        api.create_assessment.side_effect = lambda use_case_id, data: {
+            "id": "id",
+            "result": "success",
+            "details": {"evidences": data["evidences"]},
+        }
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        evidences = [
+            build_metric_evidence("accuracy_score"),
+            build_metric_evidence("p_value"),
+            build_table_evidence("disaggregated_performance"),
+        ]
+        gov.add_evidence(evidences)
+
+        assert True == gov.export(batch_size=2)
+        assert 2 == api.create_assessment.call_count
+        assert "success" == gov._assessment["result"]
+        assert 3 == len(gov._assessment["details"]["evidences"])
+
+    def test_export_in_batches_with_failed_batch(self, gov, api):
+        api.create_assessment.side_effect = [
+            {"id": "1", "result": "success", "details": {"evidences": [{}]}},
+            {"id": "2", "result": "error", "error": "Invalid evidence"},
+        ]
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        gov.add_evidence(
+            [build_metric_evidence("accuracy_score"), build_metric_evidence("p_value")]
+        )
+
+        gov.export(batch_size=1, max_workers=1)
+        assert "error" == gov._assessment["result"]
+        assert "batch 1: Invalid evidence" == gov._assessment["error"]
+        assert ["1", "2"] == gov._assessment["ids"]
+
+    def test_export_in_batches_with_connection_error(self, gov, api):
+        api.create_assessment.side_effect = [
+            {"id": "1", "result": "success", "details": {"evidences": [{}]}},
+            ConnectionError("Connection reset"),
+        ]
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        gov.add_evidence(
+            [build_metric_evidence("accuracy_score"), build_metric_evidence("p_value")]
+        )
+
+        gov.export(batch_size=1, max_workers=1)
+        assert "error" == gov._assessment["result"]
+        assert "batch 1: Connection reset" == gov._assessment["error"]
+        assert ["1", None] == gov._assessment["ids"]
+
+    def test_export_without_waiting(self, gov, api):
+        api.create_assessment.side_effect = lambda use_case_id, data: {
+            "id": "id",
+            "result": "success",
+            "details": {"evidences": data["evidences"]},
+        }
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        gov.add_evidence([build_metric_evidence("accuracy_score")])
+
+        future = gov.export(wait=False)
+        # the payload was prepared before returning
+        gov.add_evidence([build_metric_evidence("p_value")])
+
+        assessment = future.result(timeout=5)
+        assert "success" == assessment["result"]
+        assert 1 == len(assessment["details"]["evidences"])
+        assert [] == gov.pending_exports
+
+    def test_wait_for_exports(self, gov, api):
+        api.create_assessment.return_value = {"id": "id", "result": "success"}
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        gov.add_evidence([build_metric_evidence("accuracy_score")])
+
+        futures = [gov.export(wait=False) for _ in range(3)]
+
+        gov.wait_for_exports(timeout=5)
+        assert all(future.done() for future in futures)
+        assert [] == gov.pending_exports
+
+    def test_wait_for_exports_with_failed_export(self, gov, api):
+        api.create_assessment.side_effect = [
+            {"id": "1", "result": "success"},
+            ConnectionError("Connection reset"),
+            {"id": "3", "result": "success"},
+        ]
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        gov.add_evidence([build_metric_evidence("accuracy_score")])
+
+        with gov:
+            futures = [gov.export(wait=False) for _ in range(3)]
+            with pytest.raises(ExportError) as error:
+                gov.wait_for_exports(timeout=5)
+
+        assert all(future.done() for future in futures)
+        assert 1 == len(error.value.errors)
+        assert isinstance(error.value.errors[0], ConnectionError)
+        assert None == gov._executor
+
+    @pytest.mark.parametrize("compact", [False, True], ids=["indented", "compact"])
+    def test_export_to_file_is_streamed_json_api(self, gov, compact):
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        gov.set_artifacts(model="test", model_tags={"risk": "high"})
+        evidences = [
+            build_metric_evidence("accuracy_score"),
+            build_metric_evidence("p_value"),
+            build_table_evidence("disaggregated_performance"),
+        ]
+        gov.add_evidence(evidences)
+        meta = {"client": "Credo AI Connect", "version": get_version()}
+        expected = json_dumps(
+            serialize(data=gov._prepare_export_data(), meta=meta), compact=compact
+        )
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            filename = f"{tempDir}/assessment.json"
+            gov.export(filename, compact=compact)
+            with open(filename) as f:
+                assert expected == f.read()
+
+    def test_export_to_file_does_not_cache_structs(self, gov):
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        table = build_table_evidence("disaggregated_performance")
+        gov.add_evidence([build_metric_evidence("accuracy_score"), table])
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            gov.export(f"{tempDir}/assessment.json")
+
+        assert "_struct_cache" not in table.__dict__
+        assert "_data_cache" not in table.__dict__
+
+    def test_export_to_compressed_file_and_register(self, gov):
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        gov.add_evidence([build_metric_evidence("accuracy_score")])
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            filename = f"{tempDir}/assessment.json.gz"
+            gov.export(filename)
+            with gzip.open(filename, "rt") as f:
+                document = json.load(f)
+
+            plan_file = f"{tempDir}/plan.json.gz"
+            with gzip.open(plan_file, "wt") as f:
+                f.write(ASSESSMENT_PLAN_JSON_STR)
+            gov.register(assessment_plan_file=plan_file)
+
+        assert "assessments" == document["data"]["type"]
+        assert 1 == len(document["data"]["attributes"]["evidences"])
+        assert POLICY_PACK_ID == gov._policy_pack_id
+
+    def test_incremental_export(self, gov, api):
+        api.create_assessment.side_effect = lambda use_case_id, data: {
+            "id": "id",
+            "result": "success",
+            "details": {"evidences": data["evidences"]},
+        }
+        gov._manifest = EvidenceManifest(f"{tempfile.mkdtemp()}/manifest.json")
+        gov.register(assessment_plan=ASSESSMENT_PLAN_JSON_STR)
+        evidences = [
+            build_metric_evidence("accuracy_score"),
+            build_metric_evidence("p_value"),
+        ]
+        gov.add_evidence(evidences)
+
+        gov.export(incremental=True)
+        assert 2 == len(api.create_assessment.call_args[0][1]["evidences"])
+
+        # nothing changed, upload is skipped
+        gov.export(incremental=True)
+        assert 1 == api.create_assessment.call_count
+
+        gov.set_evidence([evidences[0], MetricEvidence(type="p_value", value=0.9)])
+        gov.export(incremental=True)
+        assert 2 == api.create_assessment.call_count
+        uploaded = api.create_assessment.call_args[0][1]["evidences"]
+        assert [{"metric_type": "p_value"}] == [e["label"] for e in uploaded]
+
+    @pytest.fixture()
+    def cached_gov(self, client, mocker):
+        mocker.patch.object(CredoApi, "get_assessment_plan_if_modified")
+        cache = AssessmentPlanCache(tempfile.mkdtemp(), ttl=0)
+        return Governance(credo_api_client=client, plan_cache=cache)
+
+    def test_register_with_cached_assessment_plan(self, cached_gov):
+        api = cached_gov._api
+        api.get_assessment_plan_if_modified.return_value = (ASSESSMENT_PLAN, '"v1"')
+        cached_gov.register(assessment_plan_url=ASSESSMENT_PLAN_URL)
+        api.get_assessment_plan_if_modified.assert_called_with(
+            ASSESSMENT_PLAN_URL, None
+        )
+
+        # revalidated with the cached ETag, 304 Not Modified
+        api.get_assessment_plan_if_modified.return_value = (None, '"v1"')
+        cached_gov.register(assessment_plan_url=ASSESSMENT_PLAN_URL)
+        api.get_assessment_plan_if_modified.assert_called_with(
+            ASSESSMENT_PLAN_URL, '"v1"'
+        )
+        assert USE_CASE_ID == cached_gov._use_case_id
+        assert 3 == len(cached_gov.get_evidence_requirements())
+
+        # fresh entries are used without any request
+        cached_gov._plan_cache.ttl = 3600
+        cached_gov.register(assessment_plan_url=ASSESSMENT_PLAN_URL)
+        assert 2 == api.get_assessment_plan_if_modified.call_count
+        assert True == cached_gov.registered
+
+    def test_register_with_cached_assessment_plan_offline(self, cached_gov):
+        api = cached_gov._api
+        api.get_assessment_plan_if_modified.side_effect = ConnectionError()
+        with pytest.raises(ConnectionError):
+            cached_gov.register(assessment_plan_url=ASSESSMENT_PLAN_URL)
+
+        key = cached_gov._plan_cache_key(ASSESSMENT_PLAN_URL, None, None)
+        cached_gov._plan_cache.put(key, ASSESSMENT_PLAN_URL, ASSESSMENT_PLAN)
+        cached_gov.register(assessment_plan_url=ASSESSMENT_PLAN_URL)
+        assert POLICY_PACK_ID == cached_gov._policy_pack_id
+        assert True == cached_gov.registered
+
+    def test_cached_assessment_plan_is_scoped_to_tenant(self, cached_gov):
+        key = cached_gov._plan_cache_key(None, "use case", "PP")
+        cached_gov._plan_cache.put(key, ASSESSMENT_PLAN_URL, ASSESSMENT_PLAN)
+
+        cached_gov._api._client._config._tenant = "other"
+        other_key = cached_gov._plan_cache_key(None, "use case", "PP")
+
+        assert "other" == other_key["tenant"]
+        assert None == cached_gov._plan_cache.get(other_key)
+
+
+def test_manifest_concurrent_records(tmp_path):
+    manifest = EvidenceManifest(str(tmp_path / "manifest.json"))
+    scope = {"use_case_id": USE_CASE_ID}
+
+    def record(thread):
+        for i in range(50):
+            manifest.record(scope, {f"{thread}-{i}": "hash"})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(record, range(8)))
+
+    assert 400 == len(manifest._load()[manifest._scope_key(scope)])
+    manifest.clear(scope)
+    assert {} == manifest._load()
@@ -0,0 +1,90 @@
+"""
+Test the fast JSON:API conversion against json_api_doc
+"""
+
+import copy
+import json
+
+import json_api_doc
+import pytest
+
+from connect.governance.json_api import deserialize, serialize
+
+EVIDENCE = {
+    "type": "metric",
+    "label": {"metric_type": "accuracy"},
+    "data": {"value": 0.9},
+    "metadata": {},
+}
+
+SERIALIZED = [
+    {
+        "$type": "assessments",
+        "evidences": [EVIDENCE, {**EVIDENCE, "label": {"metric_type": "f1"}}],
+        "assessed_at": "2023-01-01",
+        "policy_pack_id": None,
+    },
+    {"$type": "assessments", "evidences": [], "tags": {"a": 1}},
+    {"$type": "use_case_model_links", "id": "link", "tags": {"model": "x"}},
+    # nested resources are serialized by json_api_doc
+    {"$type": "assessments", "use_case": {"$type": "use_cases", "id": "uc"}},
+    {"$type": "assessments", "models": [{"$type": "models", "id": "m"}, 1]},
+]
+
+DESERIALIZED = [
+    {
+        "data": {
+            "type": "assessment_plans",
+            "id": "plan",
+            "attributes": {"evidence_requirements": [{"label": {"a": 1}}]},
+            "relationships": {
+                "use_case": {"data": {"type": "use_cases", "id": "uc"}},
+                "models": {"data": []},
+                "policy_pack": {"links": {"related": "/pp"}},
+                "owner": {"data": None},
+            },
+            "links": {"self": "/plan"},
+        }
+    },
+    {
+        "data": [
+            {"type": "use_cases", "id": "1", "attributes": {"name": "a"}},
+            {"type": "use_cases", "id": "2", "attributes": {"name": "b"}},
+        ]
+    },
+    {"data": {"type": "use_cases", "id": "1"}},
+    {
+        "data": {
+            "type": "use_cases",
+            "id": "1",
+            "relationships": {"owner": {"data": {"type": "users", "id": "u"}}},
+        },
+        "included": [{"type": "users", "id": "u", "attributes": {"name": "n"}}],
+    },
+    {"data": None},
+    {"errors": [{"title": "Not found"}]},
+]
+
+
+@pytest.mark.parametrize("data", SERIALIZED)
+def test_serialize_matches_json_api_doc(data):
+    meta = {"client": "connect"}
+
+    expected = json.dumps(json_api_doc.serialize(data=data, meta=meta))
+
+    assert expected == json.dumps(serialize(data, meta=meta))
+
+
+@pytest.mark.parametrize("content", DESERIALIZED)
+def test_deserialize_matches_json_api_doc(content):
+    expected = json.dumps(json_api_doc.deserialize(copy.deepcopy(content)))
+
+    assert expected == json.dumps(deserialize(content))
+
+
+def test_deserialize_does_not_modify_content():
+    content = copy.deepcopy(DESERIALIZED[0])
+
+    deserialize(content)
+
+    assert DESERIALIZED[0] == content
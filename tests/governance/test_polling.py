@@ -0,0 +1,142 @@
+"""
+Test assessment polling strategies
+"""
+
+import asyncio
+
+from connect.governance.governance import Governance
+from connect.governance.polling import ExponentialBackoffPolling, FixedIntervalPolling
+
+USE_CASE_ID = "64YUaLWSviHgibJaRWr3ZE"
+
+
+class FakeClock:
+    """Clock advanced by the fake sleep"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def __call__(self):
+        return self.now
+
+
+class FakeCredoApi:
+    """CredoApi whose assessments stay in progress for a number of status requests"""
+
+    def __init__(self, in_progress_polls, hint=None, retry_after=None):
+        self.in_progress_polls = in_progress_polls
+        self.hint = hint
+        self.retry_after = retry_after
+        self.polls = 0
+
+    def create_assessment(self, use_case_id, data):
+        return self._assessment("in_progress")
+
+    def get_assessment(self, use_case_id, id):
+        self.polls += 1
+        if self.polls <= self.in_progress_polls:
+            return self._assessment("in_progress")
+        return self._assessment("success")
+
+    def get_assessment_with_headers(self, use_case_id, id):
+        headers = {}
+        if self.retry_after is not None:
+            headers["Retry-After"] = self.retry_after
+        return self.get_assessment(use_case_id, id), headers
+
+    def _assessment(self, result):
+        assessment = {"id": "assessment", "result": result, "details": {}}
+        if self.hint is not None:
+            assessment["poll_interval"] = self.hint
+        return assessment
+
+
+def build_strategy(clock, **kwargs):
+    return ExponentialBackoffPolling(sleep=clock.sleep, clock=clock, **kwargs)
+
+
+def wait(strategy, api):
+    assessment = api.create_assessment(USE_CASE_ID, {})
+    return strategy.wait(
+        lambda: api.get_assessment_with_headers(USE_CASE_ID, assessment["id"]),
+        assessment,
+    )
+
+
+class TestPolling:
+    def test_exponential_backoff_with_cap(self):
+        clock = FakeClock()
+        strategy = build_strategy(clock, initial_interval=0.1, max_interval=0.5)
+
+        assessment = wait(strategy, FakeCredoApi(in_progress_polls=4))
+
+        assert "success" == assessment["result"]
+        assert [0.1, 0.2, 0.4, 0.5, 0.5] == clock.sleeps
+
+    def test_server_hint_takes_precedence(self):
+        clock = FakeClock()
+        strategy = build_strategy(clock)
+
+        wait(strategy, FakeCredoApi(in_progress_polls=2, hint=3))
+
+        assert [3.0, 3.0, 3.0] == clock.sleeps
+
+    def test_retry_after_header_takes_precedence(self):
+        clock = FakeClock()
+        strategy = build_strategy(clock)
+
+        wait(strategy, FakeCredoApi(in_progress_polls=2, hint=3, retry_after="7"))
+
+        # the first delay comes from the creation response, without headers
+        assert [3.0, 7.0, 7.0] == clock.sleeps
+
+    def test_deadline(self):
+        clock = FakeClock()
+        strategy = FixedIntervalPolling(2, timeout=5, sleep=clock.sleep, clock=clock)
+        api = FakeCredoApi(in_progress_polls=100)
+
+        assessment = wait(strategy, api)
+
+        assert "in_progress" == assessment["result"]
+        assert [2, 2, 1] == clock.sleeps
+        assert 3 == api.polls
+
+    def test_async_wait(self):
+        clock = FakeClock()
+
+        async def sleep(seconds):
+            clock.sleep(seconds)
+
+        strategy = ExponentialBackoffPolling(
+            initial_interval=0.1, clock=clock, async_sleep=sleep
+        )
+        api = FakeCredoApi(in_progress_polls=2, retry_after="2")
+
+        async def get_assessment():
+            return api.get_assessment_with_headers(USE_CASE_ID, "assessment")
+
+        assessment = asyncio.run(
+            strategy.async_wait(get_assessment, api.create_assessment(USE_CASE_ID, {}))
+        )
+
+        assert "success" == assessment["result"]
+        assert 3 == api.polls
+        assert [0.1, 2.0, 2.0] == clock.sleeps
+
+    def test_governance_upload_uses_strategy(self, mocker):
+        clock = FakeClock()
+        gov = Governance(
+            credo_api_client=mocker.Mock(),
+            polling_strategy=build_strategy(clock, initial_interval=0.01),
+        )
+        gov._api = FakeCredoApi(in_progress_polls=1)
+
+        assessment = gov._upload({})
+
+        assert "success" == assessment["result"]
+        assert [0.01, 0.02] == clock.sleeps
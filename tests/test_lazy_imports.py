@@ -0,0 +1,51 @@
+"""
+Test that heavy dependencies are only imported by the code paths using them
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+IMPORTED_MODULES = """
+import sys
+
+import {module}
+
+print(" ".join(m for m in {candidates!r} if m in sys.modules))
+"""
+
+
+def imported(module, candidates):
+    code = IMPORTED_MODULES.format(module=module, candidates=candidates)
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+@pytest.mark.parametrize(
+    "module,not_imported",
+    [
+        ("connect", ["pandas", "numpy", "requests", "json_api_doc", "dotenv"]),
+        ("connect.governance", ["pandas", "numpy", "httpx"]),
+        ("connect.evidence", ["pandas", "numpy", "requests"]),
+        ("connect.evidence.lens_evidence", ["pandas", "ydata_profiling"]),
+        ("connect.evidence.deepchecks_evidence", ["pandas", "deepchecks"]),
+    ],
+)
+def test_import_is_lazy(module, not_imported):
+    assert [] == imported(module, not_imported)
+
+
+def test_lazy_attributes():
+    import connect
+    from connect.evidence import TableContainer
+    from connect.governance import Governance
+
+    assert Governance is connect.Governance
+    assert TableContainer is connect.evidence.containers.TableContainer
+    assert "Governance" in dir(connect)
+    assert "Scrubber" in dir(connect.utils)
+    with pytest.raises(AttributeError):
+        connect.not_an_attribute
@@ -0,0 +1,48 @@
+"""
+Test NaN scrubbing
+"""
+
+import numpy as np
+import pandas as pd
+
+from connect.utils import Scrubber
+
+
+def test_remove_NaNs_dataframe_converts_only_missing_columns():
+    data = pd.DataFrame({"rate": [0.5, np.nan], "count": [1, 2], "group": ["a", None]})
+    data.name = "table"
+
+    scrubbed = Scrubber.remove_NaNs(data)
+
+    assert [0.5, None] == scrubbed["rate"].tolist()
+    assert [1, 2] == scrubbed["count"].tolist()
+    assert "int64" == scrubbed["count"].dtype
+    assert ["a", None] == scrubbed["group"].tolist()
+    assert "table" == scrubbed.name
+    assert np.isnan(data["rate"][1])
+
+
+def test_remove_NaNs_dataframe_does_not_modify_input():
+    data = pd.DataFrame(
+        {"group": pd.Series(["a", np.nan], dtype=object), "rate": [0.5, np.nan]}
+    )
+    data.columns = ["value", "value"]
+
+    scrubbed = Scrubber.remove_NaNs(data)
+
+    assert ["value", "value"] == scrubbed.columns.tolist()
+    assert ["a", None] == scrubbed.iloc[:, 0].tolist()
+    assert [0.5, None] == scrubbed.iloc[:, 1].tolist()
+    assert np.isnan(data.iloc[1, 0])
+    assert np.isnan(data.iloc[1, 1])
+
+
+def test_remove_NaNs_nested_does_not_modify_input():
+    data = {"a": [np.nan, {"b": float("nan"), "c": 1}], "d": np.array([1.0, np.nan])}
+
+    scrubbed = Scrubber.remove_NaNs(data)
+
+    assert [None, {"b": None, "c": 1}] == scrubbed["a"]
+    assert [1.0, None] == scrubbed["d"].tolist()
+    assert np.isnan(data["a"][0]) and np.isnan(data["a"][1]["b"])
+    assert np.isnan(data["d"][1])
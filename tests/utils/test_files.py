@@ -0,0 +1,43 @@
+"""
+Test locked and atomic writes of JSON files
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from connect.utils import atomic_write_json, file_lock
+
+
+def test_concurrent_updates_are_not_lost(tmp_path):
+    path = tmp_path / "state.json"
+
+    def update(key):
+        for i in range(50):
+            with file_lock(path):
+                try:
+                    with open(path) as f:
+                        state = json.load(f)
+                except FileNotFoundError:
+                    state = {}
+                state[f"{key}-{i}"] = i
+                atomic_write_json(path, state)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(update, range(8)))
+
+    with open(path) as f:
+        assert 400 == len(json.load(f))
+    assert [path.name, f"{path.name}.lock"] == sorted(
+        p.name for p in tmp_path.iterdir()
+    )
+
+
+def test_atomic_write_json_replaces_file(tmp_path):
+    path = tmp_path / "cache" / "state.json"
+
+    atomic_write_json(path, {"a": 1})
+    atomic_write_json(path, {"b": 2})
+
+    with open(path) as f:
+        assert {"b": 2} == json.load(f)
+    assert 0o600 == path.stat().st_mode & 0o777
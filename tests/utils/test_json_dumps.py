@@ -0,0 +1,62 @@
+"""
+Test JSON encoding of numpy values and NaNs
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from connect.utils import json_dumps
+
+
+def test_json_dumps_nan_as_null():
+    data = {
+        "a": [np.nan, 1.5],
+        "b": np.float32("nan"),
+        "c": np.array([1.0, np.nan]),
+        "d": np.int64(3),
+    }
+
+    for compact in (True, False):
+        text = json_dumps(data, compact=compact, nan_as_null=True)
+        assert {"a": [None, 1.5], "b": None, "c": [1.0, None], "d": 3} == json.loads(
+            text
+        )
+    assert "NaN" in json_dumps(data, compact=True)
+
+
+def test_json_dumps_nan_as_null_matches_default_encoder():
+    data = {
+        "array": np.arange(6, dtype=float).reshape(2, 3),
+        "ints": np.arange(3),
+        "scalars": [np.int64(1), np.float32(0.5), np.bool_(True)],
+        "tuple": (1, "a"),
+        "when": pd.Timestamp("2020-01-01"),
+    }
+
+    text = json_dumps(data, compact=True, nan_as_null=True)
+
+    assert "\n" not in text
+    assert json.loads(json_dumps(data)) == json.loads(text)
+
+
+def test_json_dumps_nan_as_null_writes_non_finite_as_null():
+    data = {"values": np.array([1.0, np.nan, np.inf]), "x": -float("inf")}
+
+    assert '{"values":[1.0,null,null],"x":null}' == json_dumps(
+        data, compact=True, nan_as_null=True
+    )
+
+
+def test_json_dumps_nan_as_null_does_not_copy_numpy_payloads(mocker):
+    from connect.utils import common
+
+    to_builtins = mocker.spy(common, "_to_json_builtins")
+    data = {"values": np.array([1.0, np.nan]), "x": np.float32("nan"), "y": 1.5}
+
+    assert '{"values":[1.0,null],"x":null,"y":1.5}' == json_dumps(
+        data, compact=True, nan_as_null=True
+    )
+    # only numpy leaves are converted, the dict is not copied
+    assert all(not isinstance(c[0][0], dict) for c in to_builtins.call_args_list)
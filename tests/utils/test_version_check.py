@@ -0,0 +1,68 @@
+"""
+Test the check of the latest Connect version
+"""
+
+import os
+import subprocess
+import sys
+
+from connect.utils import version_check
+
+# counts the network calls made while importing connect
+IMPORT_NETWORK_CALLS = """
+import socket
+
+calls = []
+socket_connect, getaddrinfo = socket.socket.connect, socket.getaddrinfo
+
+
+def record(name, function):
+    def recorded(*args, **kwargs):
+        calls.append(name)
+        return function(*args, **kwargs)
+
+    return recorded
+
+
+# patched rather than audited, since audit hooks need Python 3.8
+socket.socket.connect = record("connect", socket_connect)
+socket.getaddrinfo = record("getaddrinfo", getaddrinfo)
+import connect
+import connect.governance
+
+print(len(calls))
+"""
+
+
+def test_import_without_network_access():
+    env = {**os.environ, "CREDO_CONNECT_VERSION_CHECK": "1"}
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_NETWORK_CALLS],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "0" == result.stdout.strip()
+
+
+def test_latest_version_is_cached(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv("CREDO_CONNECT_CACHE_DIR", str(tmp_path))
+    get = mocker.patch("requests.get")
+    get.return_value.json.return_value = {"info": {"version": "9.9.9"}}
+
+    assert "9.9.9" == version_check.get_latest_version()
+    assert "9.9.9" == version_check.get_latest_version()
+    assert 1 == get.call_count
+
+    assert "9.9.9" == version_check.get_latest_version(ttl=0)
+    assert 2 == get.call_count
+
+
+def test_version_check_disabled(mocker, monkeypatch):
+    monkeypatch.setenv("CREDO_CONNECT_VERSION_CHECK", "0")
+    get_latest_version = mocker.patch.object(version_check, "get_latest_version")
+
+    version_check.validate_version()
+    assert None == version_check.validate_version_in_background()
+    get_latest_version.assert_not_called()